@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Monte Carlo battle simulator throughput
+Runs 1v1 and 6v6 matchups at increasing batch sizes, on one process and on
+every core, and reports battles per second.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
+
+from battle_sim import BattleSimulator, simulate
+from config import MOVE_GENERATIONS
+from data_store import get_store
+
+BATCH_SIZES = (1_000, 10_000, 100_000, 400_000)
+
+
+def main():
+    store = get_store()
+    names = store.pokemon_table().text["name"].tolist()
+    if len(names) < 12:
+        print(f"Not enough Pokemon data found at {store.resolve('pokemon')}")
+        return
+
+    generation = MOVE_GENERATIONS[-1]
+    simulator = BattleSimulator(store.damage_calculator(generation), store.move_learners(generation))
+    matchups = {
+        "1v1": simulator.setup([names[:1], names[6:7]]),
+        "6v6": simulator.setup([names[:6], names[6:12]]),
+    }
+    cores = os.cpu_count() or 1
+
+    print("=== Battle Simulator Benchmark ===")
+    print(f"Cores: {cores}")
+    print()
+    print(f"{'Matchup':<8} {'Battles':>10} {'Workers':>8} {'Seconds':>9} {'Battles/s':>12} {'Mean turns':>11}")
+    for label, setup in matchups.items():
+        for battles in BATCH_SIZES:
+            for workers in sorted({1, cores}):
+                result = simulate(setup, battles, workers=workers, seed=0)
+                print(
+                    f"{label:<8} {battles:>10,} {result['workers']:>8} {result['seconds']:>9.3f} "
+                    f"{result['battles_per_second']:>12,} {result['turns']['mean']:>11.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
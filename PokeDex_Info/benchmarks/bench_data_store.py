@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark: grab_info calls with and without the in-memory DataStore
+Compares the old behaviour (re-parse pokemon_data.json on every call) against
+repeated calls served from the process-wide cache.
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
+
+from data_store import get_store
+from grab_info import (
+    pk_names,
+    get_pokemon_by_name,
+    get_pokemon_in_game,
+    get_games_by_region,
+)
+
+
+def time_call(func, *args, repeat: int = 200) -> float:
+    """Return the mean time per call in microseconds (after one warm-up call)"""
+    func(*args)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    store = get_store()
+    pokemon_path = store.resolve("pokemon")
+    if not store.pokemon():
+        print(f"No Pokemon data found at {pokemon_path}")
+        return
+
+    def parse_from_disk():
+        with open(pokemon_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    name = store.pokemon()[len(store.pokemon()) // 2]["name"]
+    region = store.games()[0]["region"] if store.games() else "Kanto"
+
+    print("=== DataStore Benchmark ===")
+    print(f"Dataset: {pokemon_path} ({os.path.getsize(pokemon_path):,} bytes)")
+    print()
+    rows = [
+        ("json.load per call (old behaviour)", time_call(parse_from_disk, repeat=3)),
+        ("pk_names()", time_call(pk_names)),
+        (f"get_pokemon_by_name({name!r})", time_call(get_pokemon_by_name, name)),
+        ("get_pokemon_in_game('Scarlet')", time_call(get_pokemon_in_game, "Scarlet")),
+        (f"get_games_by_region({region!r})", time_call(get_games_by_region, region)),
+    ]
+    for label, micros in rows:
+        print(f"  {label:<40} {micros:>12,.1f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Parquet export vs. JSON
+Time and memory to get "just base stats" and "just Gen 9 learnsets" from the
+JSON files versus the Parquet datasets written by utils/parquet_export.py.
+JSON memory is the traced Python peak; Parquet memory is the size of the
+loaded Arrow table.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
+
+import serialization
+from config import MOVES_FILE_TEMPLATE, MOVE_GENERATIONS, PARQUET_DATA_DIR
+from data_store import get_store
+import parquet_export
+from parquet_export import STAT_COLUMNS, read_dataset
+
+STATS = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed", "total")
+
+
+def best_ms(func, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def json_peak_mb(func) -> float:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def json_stats(path: str):
+    return [
+        (record.get("name"), *((record.get("base_stats") or {}).get(stat) for stat in STATS))
+        for record in serialization.load(path)
+    ]
+
+
+def json_learnsets(path: str):
+    return [
+        (move.get("name"), learner.get("name"), learner.get("method"), learner.get("level"))
+        for move in serialization.load(path).get("moves", [])
+        for learner in move.get("learned_by", [])
+    ]
+
+
+def main():
+    if parquet_export.pa is None:
+        print("pyarrow is not installed (pip install pyarrow)")
+        return
+    store = get_store()
+    if not os.path.isdir(os.path.join(store.root, PARQUET_DATA_DIR)):
+        print("Exporting Parquet datasets first...")
+        parquet_export.export_parquet(store)
+
+    generation = MOVE_GENERATIONS[-1]
+    pokemon_path = store.resolve("pokemon")
+    moves_path = store.resolve(MOVES_FILE_TEMPLATE.format(generation=generation))
+    cases = [
+        (
+            "Base stats",
+            lambda: json_stats(pokemon_path),
+            lambda: read_dataset("pokemon", columns=STAT_COLUMNS),
+        ),
+        (
+            f"Gen {generation} learnsets",
+            lambda: json_learnsets(moves_path),
+            lambda: read_dataset("learnsets", filters=[("generation", "=", generation)]),
+        ),
+    ]
+
+    print("=== Parquet vs. JSON Benchmark ===")
+    print(f"{'Query':<20} {'Rows':>8} {'JSON ms':>9} {'JSON MB':>9} {'Parquet ms':>11} {'Parquet MB':>11}")
+    for label, from_json, from_parquet in cases:
+        rows = len(from_json())
+        json_ms, json_mb = best_ms(from_json), json_peak_mb(from_json)
+        parquet_ms, parquet_mb = best_ms(from_parquet), from_parquet().nbytes / 1e6
+        print(f"{label:<20} {rows:>8} {json_ms:>9.1f} {json_mb:>9.1f} {parquet_ms:>11.1f} {parquet_mb:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compiled columnar queries vs. list comprehensions over dicts
+Runs the same filters on the real Pokemon records and on a synthetic set of
+100k records (real records with randomized stats and types).
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
+
+from data_store import get_store
+from query_engine import PokemonTable
+
+SYNTHETIC_SIZE = 100_000
+STAT_FIELDS = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed")
+TYPES = (
+    "Normal", "Fire", "Water", "Electric", "Grass", "Ice", "Fighting", "Poison", "Ground",
+    "Flying", "Psychic", "Bug", "Rock", "Ghost", "Dragon", "Dark", "Steel", "Fairy",
+)
+
+
+def _available(record, game):
+    info = (record.get("game_appearances") or {}).get(game)
+    return isinstance(info, dict) and info.get("available")
+
+
+# Each query as an expression plus the equivalent dict scan
+QUERIES = [
+    (
+        "types has Fire and base_stats.speed > 100 and game in Scarlet",
+        lambda p: "Fire" in (p.get("types") or [])
+        and (p.get("base_stats") or {}).get("speed", 0) > 100
+        and _available(p, "Scarlet"),
+    ),
+    (
+        "base_stats.total >= 500 and (types has Dragon or types has Steel)",
+        lambda p: (p.get("base_stats") or {}).get("total", 0) >= 500
+        and ({"Dragon", "Steel"} & set(p.get("types") or [])),
+    ),
+    (
+        "has_game_appearances and not has_physical_info",
+        lambda p: bool(p.get("game_appearances")) and not p.get("physical_info"),
+    ),
+]
+
+
+def synthetic_records(records, size: int, seed: int = 0):
+    rng = random.Random(seed)
+    synthetic = []
+    for i in range(size):
+        record = dict(records[i % len(records)])
+        stats = {field: rng.randint(5, 255) for field in STAT_FIELDS}
+        stats["total"] = sum(stats.values())
+        record["base_stats"] = stats
+        record["types"] = rng.sample(TYPES, rng.choice((1, 2)))
+        synthetic.append(record)
+    return synthetic
+
+
+def time_call(func, repeat: int) -> float:
+    """Return the mean time per call in milliseconds (after one warm-up call)"""
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(label: str, records, repeat: int):
+    start = time.perf_counter()
+    table = PokemonTable(records)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"{label}: {len(records):,} records (table built in {build_ms:,.0f} ms)")
+
+    for expression, predicate in QUERIES:
+        expected = sum(1 for p in records if predicate(p))
+        actual = table.count(expression)
+        assert actual == expected, f"{expression}: {actual} != {expected}"
+
+        scan_ms = time_call(lambda: [p for p in records if predicate(p)], repeat)
+        table_ms = time_call(lambda: table.rows(expression), repeat)
+        print(f"  {expression}")
+        print(
+            f"    {actual:,} matches | dict scan {scan_ms:8.3f} ms | "
+            f"columnar {table_ms:8.3f} ms | {scan_ms / table_ms:5.1f}x"
+        )
+    print()
+
+
+def main():
+    records = get_store().pokemon()
+    if not records:
+        print(f"No Pokemon data found at {get_store().resolve('pokemon')}")
+        return
+
+    print("=== Query Engine Benchmark ===")
+    print()
+    run("Pokemon data", records, repeat=200)
+    run("Synthetic", synthetic_records(records, SYNTHETIC_SIZE), repeat=5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON backends (stdlib json, orjson, msgspec)
+Load and dump time plus peak traced memory for pokemon_data.json, every
+moves generation file and the items category files, for each installed
+backend, and typed record decoding of the Pokemon and moves data.
+"""
+
+import glob
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
+
+import serialization
+from config import MOVES_FILE_TEMPLATE, MOVE_GENERATIONS, ITEMS_CATEGORY_DIR
+from data_store import get_store
+
+
+def measure(func, repeat: int = 3):
+    """Best wall time in ms over `repeat` runs, and peak traced MB of one run"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1e6
+
+
+def main():
+    store = get_store()
+    datasets = {
+        "pokemon_data.json": [store.resolve("pokemon")],
+        "moves (all generations)": [store.resolve(MOVES_FILE_TEMPLATE.format(generation=g)) for g in MOVE_GENERATIONS],
+        "items (categories)": sorted(glob.glob(os.path.join(store.root, ITEMS_CATEGORY_DIR, "*.json"))),
+    }
+    datasets = {label: [p for p in paths if os.path.exists(p)] for label, paths in datasets.items()}
+    datasets = {label: paths for label, paths in datasets.items() if paths}
+    if not datasets:
+        print(f"No data files found under {store.root}")
+        return
+
+    raw = {label: [open(path, "rb").read() for path in paths] for label, paths in datasets.items()}
+    backends = serialization.available_backends()
+
+    print("=== Serialization Benchmark ===")
+    print(f"Backends: {', '.join(backends)}")
+    print()
+    print(f"{'Dataset':<24} {'MB':>6} {'Backend':<8} {'Load ms':>9} {'Load peak MB':>13} "
+          f"{'Dump ms':>9} {'Dump peak MB':>13} {'Compact ms':>11}")
+    for label, blobs in raw.items():
+        size = sum(len(blob) for blob in blobs) / 1e6
+        for name in backends:
+            backend = serialization.get_backend(name)
+            parsed = [backend.loads(blob) for blob in blobs]
+            load_ms, load_peak = measure(lambda: [backend.loads(blob) for blob in blobs])
+            dump_ms, dump_peak = measure(lambda: [backend.dump(data, io.BytesIO()) for data in parsed])
+            compact_ms, _ = measure(lambda: [backend.dump(data, io.BytesIO(), compact=True) for data in parsed])
+            print(f"{label:<24} {size:>6.1f} {name:<8} {load_ms:>9.1f} {load_peak:>13.1f} "
+                  f"{dump_ms:>9.1f} {dump_peak:>13.1f} {compact_ms:>11.1f}")
+
+    print()
+    print("Typed records (serialization.load_records):")
+    typed = {"pokemon_data.json": "pokemon", "moves (all generations)": "moves"}
+    for label, kind in typed.items():
+        if label not in raw:
+            continue
+        for name in backends:
+            os.environ[serialization.BACKEND_ENV] = name
+            load_ms, peak = measure(lambda: [serialization.decode_records(blob, kind) for blob in raw[label]])
+            print(f"  {label:<24} {name:<8} {load_ms:>9.1f} ms {peak:>8.1f} MB peak")
+    os.environ.pop(serialization.BACKEND_ENV, None)
+
+
+if __name__ == "__main__":
+    main()
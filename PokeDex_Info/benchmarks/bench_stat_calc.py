@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized stat calculation vs. a per-Pokemon Python loop
+Computes final stats for every species under batches of random level, IV, EV
+and nature spreads and reports stat computations per second.
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
+
+from data_store import get_store
+from stat_calc import STATS, calculate_stat_grid, nature_table
+
+SPREAD_BATCHES = (10, 100, 1000)
+LOOP_SPREADS = 10
+
+
+def random_spreads(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    natures = np.array(list(nature_table().values()))
+    levels = rng.integers(1, 101, count)
+    ivs = rng.integers(0, 32, (count, len(STATS)))
+    evs = rng.integers(0, 253, (count, len(STATS)))
+    return levels, ivs, evs, natures[rng.integers(0, len(natures), count)]
+
+
+def python_stats(base, level, ivs, evs, natures):
+    """Reference implementation: one Pokemon at a time"""
+    stats = []
+    for i, value in enumerate(base):
+        core = math.floor((2 * value + ivs[i] + evs[i] // 4) * level / 100)
+        if i == 0:
+            stats.append(1 if value == 1 else core + level + 10)
+        else:
+            stats.append(math.floor((core + 5) * natures[i]))
+    return stats
+
+
+def main():
+    table = get_store().pokemon_table()
+    if not len(table):
+        print(f"No Pokemon data found at {get_store().resolve('pokemon')}")
+        return
+    base = np.nan_to_num(
+        np.column_stack([table.numeric[f"base_stats.{stat}"] for stat in STATS])
+    )
+
+    print("=== Stat Calculator Benchmark ===")
+    print(f"Species (and forms): {len(base):,}")
+    print()
+
+    levels, ivs, evs, natures = random_spreads(LOOP_SPREADS)
+    base_rows = base.astype(int).tolist()
+    start = time.perf_counter()
+    expected = [
+        [python_stats(row, int(levels[k]), ivs[k].tolist(), evs[k].tolist(), natures[k].tolist()) for row in base_rows]
+        for k in range(LOOP_SPREADS)
+    ]
+    elapsed = time.perf_counter() - start
+    computed = LOOP_SPREADS * base.size
+    print(f"  Python loop, {LOOP_SPREADS} spreads: {computed / elapsed:>14,.0f} stats/s")
+    grid = calculate_stat_grid(base, levels, ivs, evs, natures)
+    assert np.array_equal(grid, np.array(expected)), "vectorized stats differ from the loop"
+
+    for count in SPREAD_BATCHES:
+        levels, ivs, evs, natures = random_spreads(count)
+        calculate_stat_grid(base, levels, ivs, evs, natures)
+        start = time.perf_counter()
+        grid = calculate_stat_grid(base, levels, ivs, evs, natures)
+        elapsed = time.perf_counter() - start
+        print(f"  NumPy grid, {count:>5,} spreads: {grid.size / elapsed:>14,.0f} stats/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Build precomputed indexes and tables from the scraped JSON data.
+Writes compact sidecar files to data/derived/ so the web pages can load them
+instead of scanning the full datasets at request time.
+
+Usage:
+    python build_derived_data.py              # build everything
+    python build_derived_data.py pokemon_index  # build selected artifacts
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "utils"))
+
+from config import PokeDataUtils, DERIVED_DATA_DIR, MOVE_GENERATIONS
+from data_store import get_store
+
+# Per-Pokemon learnset slices, one file each, under data/derived/
+LEARNSETS_DIR = "learnsets"
+MOVE_RECOMMENDATIONS_DIR = "move_recommendations"
+
+
+def write_sidecar(data, filename: str) -> str:
+    """Write compact JSON to the derived data directory"""
+    store = get_store()
+    output_dir = store.resolve(DERIVED_DATA_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = os.path.join(output_dir, filename)
+    PokeDataUtils.save_json_data(data, output_file, compact=True)
+    return output_file
+
+
+def build_pokemon_index():
+    """Inverted indexes for types, abilities, games, egg groups and generation"""
+    index = get_store().pokemon_index()
+    return write_sidecar(index.to_dict(), "pokemon_inverted_index.json")
+
+
+def build_search_index():
+    """Prefix and fuzzy name search index for the web SearchBar"""
+    index = get_store().search_index()
+    return write_sidecar(index.to_dict(), "search_index.json")
+
+
+def build_stat_analytics():
+    """Base stats with overall percentiles and top 10 per type, generation and game"""
+    matrix = get_store().stat_matrix()
+    return write_sidecar(matrix.to_dict(), "stat_analytics.json")
+
+
+def build_type_weaknesses():
+    """Per-species defensive multipliers (with ability variants) and type charts"""
+    matchups = get_store().type_matchups()
+    return write_sidecar(matchups.to_dict(), "type_weaknesses.json")
+
+
+def build_speed_tiers():
+    """Speed of every species under benchmark spreads, per generation"""
+    from stat_calc import speed_tier_tables
+
+    tables = speed_tier_tables(get_store().pokemon_table())
+    return write_sidecar({"version": 1, "generations": tables}, "speed_tiers.json")
+
+
+def build_similar_pokemon():
+    """Top 10 most similar Pokemon (stats, typing, abilities) for every species"""
+    index = get_store().similarity_index()
+    return write_sidecar(index.to_dict(k=10), "similar_pokemon.json")
+
+
+def build_move_learners():
+    """Per-move learner bitsets, one file per generation"""
+    store = get_store()
+    return [
+        write_sidecar(store.move_learners(generation).to_dict(), f"move_learners_gen{generation}.json")
+        for generation in MOVE_GENERATIONS
+    ]
+
+
+def build_learnsets():
+    """Normalized learnset table plus one learnset slice per species/form"""
+    table = get_store().learnset_table()
+    output_files = [write_sidecar(table.to_dict(), "learnset_table.json")]
+    for _, name, learnset in table.learner_slices():
+        slug = PokeDataUtils.normalize_key(name)
+        output_files.append(
+            write_sidecar(
+                {"version": 1, "name": name, "generations": learnset},
+                os.path.join(LEARNSETS_DIR, f"{slug}.json"),
+            )
+        )
+    return output_files
+
+
+def build_move_recommendations():
+    """Top damaging moves per species for every generation, one slice per species"""
+    from move_recommender import recommendation_slices
+
+    store = get_store()
+    recommenders = {generation: store.move_recommender(generation) for generation in MOVE_GENERATIONS}
+    return [
+        write_sidecar(
+            {"version": 1, "name": name, "generations": generations},
+            os.path.join(MOVE_RECOMMENDATIONS_DIR, f"{PokeDataUtils.normalize_key(name)}.json"),
+        )
+        for name, generations in recommendation_slices(recommenders).items()
+    ]
+
+
+def build_game_matrix():
+    """Species per game and dex completion plans (overall and per platform)"""
+    matrix = get_store().game_matrix()
+    return write_sidecar(matrix.to_dict(), "game_matrix.json")
+
+
+def build_evolution_graph():
+    """Evolution DAG: species nodes, method edges, families and stages"""
+    graph = get_store().evolution_graph()
+    return write_sidecar(graph.to_dict(), "evolution_graph.json")
+
+
+def build_egg_move_chains():
+    """Shortest egg move chain for every (species, egg move), one file per generation"""
+    from breeding import precompute_egg_chains
+
+    store = get_store()
+    searches = {generation: store.egg_move_search(generation) for generation in MOVE_GENERATIONS}
+    chains = precompute_egg_chains(searches)
+    return [
+        write_sidecar(
+            {"version": 1, "generation": generation, "chains": chains[generation]},
+            f"egg_move_chains_gen{generation}.json",
+        )
+        for generation in MOVE_GENERATIONS
+    ]
+
+
+def build_catch_rates():
+    """Catch chance per species, Poke Ball, status and HP for the latest generation"""
+    calculator = get_store().catch_calculator()
+    return write_sidecar(calculator.to_dict(MOVE_GENERATIONS[-1]), "catch_rates.json")
+
+
+BUILDERS = {
+    "pokemon_index": build_pokemon_index,
+    "search_index": build_search_index,
+    "stat_analytics": build_stat_analytics,
+    "type_weaknesses": build_type_weaknesses,
+    "speed_tiers": build_speed_tiers,
+    "similar_pokemon": build_similar_pokemon,
+    "move_learners": build_move_learners,
+    "learnsets": build_learnsets,
+    "move_recommendations": build_move_recommendations,
+    "game_matrix": build_game_matrix,
+    "evolution_graph": build_evolution_graph,
+    "egg_move_chains": build_egg_move_chains,
+    "catch_rates": build_catch_rates,
+}
+
+
+def main(selected=None):
+    names = selected or list(BUILDERS)
+    unknown = [name for name in names if name not in BUILDERS]
+    if unknown:
+        print(f"Unknown artifacts: {', '.join(unknown)}")
+        print(f"Available: {', '.join(BUILDERS)}")
+        return
+
+    print("🔧 Building derived data...")
+    for name in names:
+        start = time.perf_counter()
+        output_files = BUILDERS[name]()
+        if isinstance(output_files, str):
+            output_files = [output_files]
+        elapsed = (time.perf_counter() - start) * 1000
+        size = sum(os.path.getsize(path) for path in output_files)
+        print(
+            f"  ✓ {name}: {len(output_files)} file(s), {size:,} bytes ({elapsed:.0f} ms)"
+        )
+    print("✅ Derived data built!")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -2,13 +2,21 @@
 """
 Build complete evolution chain data for all Pokemon.
 Scrapes PokéAPI and adds evolution data to pokemon_data.json.
+Chains stored without parent links are refreshed; pass --force to refetch
+every chain.
 """
 
 import json
+import os
+import sys
 import requests
 from pathlib import Path
 from typing import Dict, List, Optional
 
+sys.path.append(os.path.join(os.path.dirname(__file__), "utils"))
+import serialization
+from config import PokeDataUtils
+
 # Evolution method mapping
 EVOLUTION_METHODS = {
     "level-up": "Level {param}",
@@ -75,7 +83,8 @@ def build_evolution_chain(chain_node: Dict, parent_name: Optional[str] = None) -
             evolutions.append({
                 'name': evolved_name,
                 'method': method,
-                'sprite': evolves_to['species']['name'].lower()
+                'sprite': evolves_to['species']['name'].lower(),
+                'from': species_name
             })
         
         # Recursively get further evolutions
@@ -152,12 +161,19 @@ def format_evolution_method(detail: Dict) -> str:
         trigger = detail.get('trigger', {}).get('name', 'Special condition')
         return trigger.replace('-', ' ').title()
 
-def enhance_pokemon_data():
-    """Add evolution data to pokemon_data.json."""
+def has_parent_links(evolution: Dict) -> bool:
+    """True when every entry of a stored chain names its parent ('from')."""
+    return all(entry.get('from') for entry in evolution.get('evolutions', []))
+
+def enhance_pokemon_data(force: bool = False):
+    """Add evolution data to pokemon_data.json.
+
+    Chains stored before entries had a 'from' field are fetched again;
+    force=True refetches every chain.
+    """
     data_path = Path('data/pokemon_data.json')
     
-    with open(data_path) as f:
-        pokemon_list = json.load(f)
+    pokemon_list = serialization.load(data_path)
     
     print("🔄 Adding evolution data to Pokemon...")
     
@@ -167,8 +183,9 @@ def enhance_pokemon_data():
         if (i + 1) % 100 == 0:
             print(f"  Processing {i + 1}/{len(pokemon_list)}: {pokemon_name}")
         
-        # Skip if already has evolution data
-        if 'evolution' in pokemon:
+        # Skip if already has current evolution data
+        existing = pokemon.get('evolution')
+        if existing is not None and not force and has_parent_links(existing):
             continue
         
         # Fetch evolution data
@@ -176,7 +193,7 @@ def enhance_pokemon_data():
         
         if evolution_data:
             pokemon['evolution'] = evolution_data
-        else:
+        elif existing is None:
             # Add empty evolution for Pokemon with no evolutions
             pokemon['evolution'] = {
                 'name': pokemon_name,
@@ -184,12 +201,11 @@ def enhance_pokemon_data():
             }
     
     # Write back
-    with open(data_path, 'w') as f:
-        json.dump(pokemon_list, f, indent=2, ensure_ascii=False)
+    PokeDataUtils.save_json_data(pokemon_list, data_path)
     
     print(f"✅ Enhanced {len(pokemon_list)} Pokemon with evolution data!")
 
 if __name__ == '__main__':
     print("📊 Building evolution data for all Pokemon...")
     print("   This will take a minute to fetch from PokéAPI...")
-    enhance_pokemon_data()
+    enhance_pokemon_data(force='--force' in sys.argv[1:])
@@ -3,11 +3,16 @@
 Fetch hidden abilities for all Pokemon from PokéAPI and add to pokemon_data.json
 """
 
-import json
+import os
+import sys
 import requests
 from pathlib import Path
 import time
 
+sys.path.append(os.path.join(os.path.dirname(__file__), "utils"))
+import serialization
+from config import PokeDataUtils
+
 DATA_PATH = Path(__file__).parent / "data" / "pokemon_data.json"
 POKEAPI_BASE = "https://pokeapi.co/api/v2"
 
@@ -35,8 +40,7 @@ def add_hidden_abilities_to_pokemon():
     """Add hidden abilities to all Pokemon in pokemon_data.json"""
     
     # Load existing data
-    with open(DATA_PATH, 'r') as f:
-        pokemon_data = json.load(f)
+    pokemon_data = serialization.load(DATA_PATH)
     
     print(f"Processing {len(pokemon_data)} Pokemon to add hidden abilities...")
     
@@ -71,8 +75,7 @@ def add_hidden_abilities_to_pokemon():
         time.sleep(0.1)
     
     # Save updated data
-    with open(DATA_PATH, 'w') as f:
-        json.dump(pokemon_data, f, indent=2, ensure_ascii=False)
+    PokeDataUtils.save_json_data(pokemon_data, DATA_PATH)
     
     print(f"\nSuccessfully added hidden abilities!")
     print(f"Pokemon with hidden abilities: {hidden_count}/{len(pokemon_data)}")
@@ -3,11 +3,16 @@
 Script to add moves data to pokemon_data.json by fetching from PokéAPI
 """
 
-import json
+import os
+import sys
 import requests
 from pathlib import Path
 import time
 
+sys.path.append(os.path.join(os.path.dirname(__file__), "utils"))
+import serialization
+from config import PokeDataUtils
+
 DATA_PATH = Path(__file__).parent / "data" / "pokemon_data.json"
 POKEAPI_BASE = "https://pokeapi.co/api/v2"
 
@@ -34,8 +39,7 @@ def add_moves_to_pokemon():
     """Add moves field to all Pokemon in pokemon_data.json"""
     
     # Load existing data
-    with open(DATA_PATH, 'r') as f:
-        pokemon_data = json.load(f)
+    pokemon_data = serialization.load(DATA_PATH)
     
     print(f"Processing {len(pokemon_data)} Pokemon...")
     
@@ -57,8 +61,7 @@ def add_moves_to_pokemon():
         time.sleep(0.1)
     
     # Save updated data
-    with open(DATA_PATH, 'w') as f:
-        json.dump(pokemon_data, f, indent=2)
+    PokeDataUtils.save_json_data(pokemon_data, DATA_PATH)
     
     print(f"\nSuccessfully added moves to all Pokemon!")
     print(f"Saved to {DATA_PATH}")
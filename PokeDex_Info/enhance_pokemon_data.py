@@ -4,9 +4,14 @@ Enhance pokemon_data.json with hidden abilities and evolution data.
 This script enriches the Pokemon data with additional fields needed for the UI.
 """
 
-import json
+import os
+import sys
 from pathlib import Path
 
+sys.path.append(os.path.join(os.path.dirname(__file__), "utils"))
+import serialization
+from config import PokeDataUtils
+
 # Hidden ability data - mapping of Pokemon to their hidden ability
 HIDDEN_ABILITIES = {
     "Bulbasaur": "Chlorophyll",
@@ -85,8 +90,7 @@ def enhance_pokemon_data():
     """Enhance pokemon_data.json with hidden abilities and evolution data."""
     data_path = Path('data/pokemon_data.json')
     
-    with open(data_path) as f:
-        pokemon_list = json.load(f)
+    pokemon_list = serialization.load(data_path)
     
     # Enhance each Pokemon
     for pokemon in pokemon_list:
@@ -111,8 +115,7 @@ def enhance_pokemon_data():
             }
     
     # Write back
-    with open(data_path, 'w') as f:
-        json.dump(pokemon_list, f, indent=2, ensure_ascii=False)
+    PokeDataUtils.save_json_data(pokemon_list, data_path)
     
     print(f"✅ Enhanced {len(pokemon_list)} Pokemon")
 
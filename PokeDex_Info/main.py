@@ -21,6 +21,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "utils"))
 sys.path.append(os.path.join(os.path.dirname(__file__), "scrapers"))
 
 from utils.config import PokeDataUtils, DATA_FILES
+from data_store import get_store
 
 
 class PokemonDataOrchestrator:
@@ -63,20 +64,20 @@ class PokemonDataOrchestrator:
         print()
 
         # Check Pokemon data completeness if available
-        pokemon_data = self.utils.load_json_data(DATA_FILES["pokemon"])
-        if isinstance(pokemon_data, list) and pokemon_data:
+        table = get_store().pokemon_table()
+        if len(table):
             print("Pokemon Data Completeness:")
-            total = len(pokemon_data)
+            total = len(table)
 
             # Basic stats
-            with_abilities = sum(1 for p in pokemon_data if p.get("abilities"))
-            with_base_stats = sum(1 for p in pokemon_data if p.get("base_stats"))
-            with_types = sum(1 for p in pokemon_data if p.get("types"))
+            with_abilities = table.count("has_abilities")
+            with_base_stats = table.count("has_base_stats")
+            with_types = table.count("has_types")
 
             # Extended stats
-            with_physical = sum(1 for p in pokemon_data if p.get("physical_info"))
-            with_games = sum(1 for p in pokemon_data if p.get("game_appearances"))
-            with_evolution = sum(1 for p in pokemon_data if p.get("evolution_info"))
+            with_physical = table.count("has_physical_info")
+            with_games = table.count("has_game_appearances")
+            with_evolution = table.count("has_evolution_info")
 
             print(f"  Basic Info Coverage:")
             print(f"    Types: {with_types}/{total} ({(with_types/total*100):.1f}%)")
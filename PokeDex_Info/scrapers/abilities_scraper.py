@@ -1,5 +1,10 @@
 from bs4 import BeautifulSoup
 import requests
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
+from config import PokeDataUtils, atomic_write
 
 url_base = "https://www.serebii.net/abilitydex/"
 ability_list = []
@@ -205,7 +210,6 @@ def fetch_ability_details(ability_link):
 
 def export_to_json(abilities_data, filename="../data/abilities_data.json"):
     """Export abilities data to a JSON file for web app use"""
-    import json
     from datetime import datetime
 
     # Create a structured JSON object
@@ -232,15 +236,14 @@ def export_to_json(abilities_data, filename="../data/abilities_data.json"):
         json_data["abilities"].append(ability_json)
 
     # Write JSON file
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(json_data, f, ensure_ascii=False, indent=2)
+    PokeDataUtils.save_json_data(json_data, filename)
 
     print(f"JSON data exported to {filename}")
 
 
 def export_to_text(abilities_data, filename="../data/abilities_data.txt"):
     """Export abilities data to a structured text file"""
-    with open(filename, "w", encoding="utf-8") as f:
+    with atomic_write(filename) as f:
         f.write("=" * 80 + "\n")
         f.write("POKEMON ABILITY DEX\n")
         f.write("Scraped from Serebii.net\n")
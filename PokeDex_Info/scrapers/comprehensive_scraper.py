@@ -21,6 +21,7 @@ import time
 import re
 from typing import Dict, List, Any, Optional
 from utils.config import PokeDataUtils, BASE_URLS, DATA_FILES, REGION_TO_GAMES
+from utils.lookup import PokemonLookup
 
 
 class ComprehensivePokemonScraper:
@@ -29,6 +30,7 @@ class ComprehensivePokemonScraper:
     def __init__(self):
         self.utils = PokeDataUtils()
         self.pokemon_data = self.utils.load_json_data(DATA_FILES["pokemon"])
+        self.lookup = PokemonLookup(self.pokemon_data)
         self.updated_count = 0
 
     def scrape_pokemon_details(self, pokemon_name: str, pokemon_entry: Dict) -> Dict:
@@ -271,16 +273,10 @@ class ComprehensivePokemonScraper:
                 updated_pokemon = self.scrape_pokemon_details(pokemon_name, pokemon)
 
                 # Update the pokemon in our main data
-                pokemon_index = next(
-                    (
-                        idx
-                        for idx, p in enumerate(self.pokemon_data)
-                        if p.get("name") == pokemon_name
-                    ),
-                    None,
-                )
-                if pokemon_index is not None:
-                    self.pokemon_data[pokemon_index] = updated_pokemon
+                existing = self.lookup.by_name(pokemon_name)
+                if existing is not None:
+                    if existing is not updated_pokemon:
+                        self.lookup.replace(existing, updated_pokemon)
                     self.updated_count += 1
 
                 # Save progress periodically
@@ -381,9 +377,7 @@ def main():
 
         if choice == "1":
             # Test on Bulbasaur
-            test_pokemon = next(
-                (p for p in scraper.pokemon_data if p.get("name") == "Bulbasaur"), None
-            )
+            test_pokemon = scraper.lookup.by_name("Bulbasaur")
             if test_pokemon:
                 updated = scraper.scrape_pokemon_details(
                     "Bulbasaur", test_pokemon.copy()
@@ -5,7 +5,6 @@ Scrapes game-specific Pokedex numbers from Serebii.net individual Pokemon pages
 Handles the concatenated format where all dex info is in one cell
 """
 
-import json
 import requests
 import time
 import re
@@ -14,7 +13,8 @@ import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
-from grab_info import pk_names, get_all_games
+from grab_info import pk_names
+from data_store import get_store
 
 
 def parse_dex_info(text):
@@ -116,19 +116,20 @@ def scrape_game_dex_data(limit=None):
         pokemon_names = pokemon_names[:limit]
         print(f"Limited to first {limit} Pokemon for testing")
 
-    # Load existing Pokemon data
-    with open("pokemon_data.json", "r") as f:
-        pokemon_data = json.load(f)
+    # Reuse the Pokemon data already parsed by pk_names() instead of reloading it
+    store = get_store()
+    pokemon_data = store.pokemon()
+    if not pokemon_data:
+        # Missing or unparseable file: saving would overwrite it with []
+        print(f"No Pokemon data loaded from {store.resolve('pokemon')}; aborting")
+        return
+    lookup = store.pokemon_lookup()
 
     print(f"Processing {len(pokemon_names)} Pokemon...")
 
     for i, pokemon_name in enumerate(pokemon_names, 1):
         # Find the corresponding Pokemon in our data
-        pokemon = None
-        for p in pokemon_data:
-            if p["name"] == pokemon_name:
-                pokemon = p
-                break
+        pokemon = lookup.by_name(pokemon_name)
 
         if not pokemon:
             print(f"  Pokemon {pokemon_name} not found in data")
@@ -215,8 +216,7 @@ def scrape_game_dex_data(limit=None):
 
     # Save updated data
     print("Saving updated Pokemon data...")
-    with open("../data/pokemon_data.json", "w") as f:
-        json.dump(pokemon_data, f, indent=2)
+    store.save("pokemon", pokemon_data)
 
     print("Game dex data scraping completed!")
 
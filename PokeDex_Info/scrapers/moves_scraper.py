@@ -9,6 +9,7 @@ import os
 import json
 import time
 import re
+import shutil
 from typing import Dict, List, Any, Optional
 
 # Add project paths
@@ -1020,11 +1021,12 @@ class MovesDataScraper:
                 merged_moves.append(move)
                 new_move_count += 1
 
-        # Create backup before saving if file exists
+        # Create backup before saving if file exists (a copy, so the live
+        # file stays in place until the atomic save replaces it)
         if os.path.exists(output_file):
             backup_file = output_file.replace(".json", "_backup.json")
             try:
-                os.rename(output_file, backup_file)
+                shutil.copy2(output_file, backup_file)
                 print(f"Created backup: {backup_file}")
             except Exception as e:
                 print(f"Warning: Could not create backup: {e}")
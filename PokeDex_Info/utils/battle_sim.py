@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Battle Simulator
+Simplified Monte Carlo singles battles (1v1 up to 6v6). Damage, accuracy,
+priority, critical hits, speed ties and secondary effects (flinch, burn,
+paralysis, poison) are rolled for a whole batch of simulations at once with
+NumPy; large batches are sharded across a process pool. Each side always
+uses its best expected-damage move against the current opponent and the
+next Pokemon in team order comes in when one faints.
+"""
+
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils, MOVE_GENERATIONS
+from damage_calc import RANDOM_ROLLS
+from stat_calc import SPEED, Spread, calculate_stats
+from type_chart import TYPE_INDEX
+
+MAX_TURNS = 200
+MOVESET_SIZE = 4
+CRIT_CHANCE = 1 / 24
+FULL_PARALYSIS_CHANCE = 0.25
+SHARD_SIZE = 50_000
+
+# Secondary effect codes; burn and poison also deal end-of-turn chip damage
+NO_EFFECT, FLINCH, BURN, PARALYSIS, POISON = range(5)
+EFFECT_KEYWORDS = (("flinch", FLINCH), ("burn", BURN), ("paralyz", PARALYSIS), ("poison", POISON))
+CHIP_DAMAGE = {BURN: 1 / 16, POISON: 1 / 8}
+
+# Typeless fallback for Pokemon without a damaging move
+STRUGGLE = {"name": "Struggle", "battle_type": None, "category": "Physical", "base_power": 50, "accuracy": None}
+
+
+def move_effect(move: Dict) -> tuple:
+    """(effect code, chance) from a move's secondary_effect text and effect_rate ('30%')"""
+    text = (move.get("secondary_effect") or "").lower()
+    match = re.search(r"\d+(\.\d+)?", str(move.get("effect_rate") or ""))
+    chance = float(match.group()) / 100 if match else 0.0
+    for keyword, effect in EFFECT_KEYWORDS:
+        if keyword in text:
+            return effect, chance
+    return NO_EFFECT, 0.0
+
+
+class BattleSetup:
+    """Precomputed per-pairing tables for two teams; plain arrays so it pickles cheaply.
+
+    Tables indexed [attacker slot, defender slot] hold the chosen move's
+    damage (roll 100, without and with a critical hit), accuracy, priority,
+    category and secondary effect.
+    """
+
+    def __init__(self, teams: List[List[str]], hp: List[np.ndarray], speed: List[np.ndarray],
+                 tables: List[Dict[str, np.ndarray]], moves: List[List[List[str]]]):
+        self.teams = teams
+        self.hp = hp
+        self.speed = speed
+        self.tables = tables
+        self.moves = moves
+
+
+class BattleSimulator:
+    """Builds BattleSetups from a DamageCalculator and a generation's learner bitsets"""
+
+    def __init__(self, calculator, learners=None):
+        self.calculator = calculator
+        self.learners = learners
+
+    def default_moveset(self, name: str) -> List[Dict]:
+        """Up to four learnable damaging moves with the best power x accuracy x STAB"""
+        matchups = self.calculator.matchups
+        own_types = matchups.type_members[matchups._row(name)]
+        scored = []
+        for move in self.calculator.damaging_moves():
+            if self.learners is not None and not self.learners.can_learn(name, move["name"]):
+                continue
+            type_index = TYPE_INDEX.get(PokeDataUtils.normalize_key(move.get("battle_type") or ""))
+            stab = 1.5 if type_index is not None and own_types[type_index] else 1.0
+            accuracy = (move.get("accuracy") or 100) / 100
+            scored.append((move["base_power"] * accuracy * stab, move["name"], move))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [move for _, _, move in scored[:MOVESET_SIZE]] or [STRUGGLE]
+
+    def setup(
+        self,
+        teams: Sequence[Sequence[str]],
+        movesets: Optional[Dict[str, Sequence[str]]] = None,
+        spreads: Optional[Sequence[Spread]] = None,
+    ) -> BattleSetup:
+        """Tables for teams[0] vs teams[1]; movesets maps a name to move names"""
+        teams = [list(team) for team in teams]
+        spreads = list(spreads or (Spread(), Spread()))
+        team_moves = [
+            [
+                self.calculator._moves(movesets[name]) if movesets and name in movesets else self.default_moveset(name)
+                for name in team
+            ]
+            for team in teams
+        ]
+
+        hp, speed = [], []
+        for team, spread in zip(teams, spreads):
+            stats = calculate_stats(self.calculator.base_stats[self.calculator._rows(team)], spread)
+            hp.append(np.nan_to_num(stats[:, 0]))
+            speed.append(np.nan_to_num(stats[:, SPEED]))
+
+        tables = []
+        for side in (0, 1):
+            attackers, defenders = teams[side], teams[1 - side]
+            all_moves = [move for moves in team_moves[side] for move in moves]
+            grids = [
+                self.calculator.calculate(attackers, defenders, all_moves, spreads[side], spreads[1 - side], critical=crit)
+                for crit in (False, True)
+            ]
+            shape = (len(attackers), len(defenders))
+            table = {
+                "damage": np.zeros(shape), "crit_damage": np.zeros(shape),
+                "accuracy": np.ones(shape), "priority": np.zeros(shape, dtype=int),
+                "physical": np.zeros(shape, dtype=bool), "effect": np.zeros(shape, dtype=int),
+                "effect_chance": np.zeros(shape), "choice": np.zeros(shape, dtype=int),
+            }
+            start = 0
+            for a, moves in enumerate(team_moves[side]):
+                columns = np.arange(start, start + len(moves))
+                start += len(moves)
+                accuracy = np.array([(m.get("accuracy") or 100) / 100 for m in moves])
+                expected = grids[0].max[a][:, columns] * accuracy  # (defender, move)
+                for d in range(shape[1]):
+                    best = int(np.argmax(expected[d]))
+                    move = moves[best]
+                    effect, chance = move_effect(move)
+                    table["damage"][a, d] = grids[0].max[a, d, columns[best]]
+                    table["crit_damage"][a, d] = grids[1].max[a, d, columns[best]]
+                    table["accuracy"][a, d] = accuracy[best]
+                    table["priority"][a, d] = move.get("speed_priority") or 0
+                    table["physical"][a, d] = move.get("category") == "Physical"
+                    table["effect"][a, d] = effect
+                    table["effect_chance"][a, d] = chance
+                    table["choice"][a, d] = best
+            tables.append(table)
+
+        move_names = [[[move["name"] for move in moves] for moves in side] for side in team_moves]
+        return BattleSetup(teams, hp, speed, tables, move_names)
+
+
+def run_battles(setup: BattleSetup, battles: int, seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """Simulate `battles` battles at once: winner per battle (0, 1 or -1 for a draw) and turns"""
+    rng = np.random.default_rng(seed)
+    n = battles
+    sims = np.arange(n)
+    hp = [np.tile(setup.hp[side], (n, 1)) for side in (0, 1)]
+    status = [np.zeros((n, len(setup.teams[side])), dtype=int) for side in (0, 1)]
+    active = [np.zeros(n, dtype=int), np.zeros(n, dtype=int)]
+    winner = np.full(n, -1)
+    turns = np.zeros(n, dtype=int)
+    running = np.ones(n, dtype=bool)
+
+    def attack(side: int, mask: np.ndarray, can_flinch: np.ndarray, flinched: np.ndarray) -> np.ndarray:
+        """One side's move in the simulations in mask; returns who was flinched"""
+        idx = sims[mask]
+        if not len(idx):
+            return flinched
+        a, d = active[side][idx], active[1 - side][idx]
+        table = setup.tables[side]
+        defender = 1 - side
+        my_status = status[side][idx, a]
+        moves = ~flinched[idx] & ~((my_status == PARALYSIS) & (rng.random(len(idx)) < FULL_PARALYSIS_CHANCE))
+        hit = moves & (rng.random(len(idx)) < table["accuracy"][a, d])
+        crit = rng.random(len(idx)) < CRIT_CHANCE
+        roll = RANDOM_ROLLS[rng.integers(0, len(RANDOM_ROLLS), len(idx))]
+        damage = np.where(crit, table["crit_damage"][a, d], table["damage"][a, d])
+        damage = np.floor(damage * roll / 100)
+        damage = np.where(table["physical"][a, d] & (my_status == BURN) & ~crit, np.floor(damage / 2), damage)
+        damage = np.where(table["damage"][a, d] > 0, np.maximum(damage, 1), 0) * hit
+        hp[defender][idx, d] -= damage
+
+        effect = table["effect"][a, d]
+        triggers = hit & (hp[defender][idx, d] > 0) & (rng.random(len(idx)) < table["effect_chance"][a, d])
+        flinch = triggers & (effect == FLINCH) & can_flinch[idx]
+        flinched = flinched.copy()
+        flinched[idx[flinch]] = True
+        inflict = triggers & (effect != FLINCH) & (effect != NO_EFFECT) & (status[defender][idx, d] == 0)
+        status[defender][idx[inflict], d[inflict]] = effect[inflict]
+        return flinched
+
+    for turn in range(1, MAX_TURNS + 1):
+        if not running.any():
+            break
+        idx = sims[running]
+        a0, a1 = active[0][idx], active[1][idx]
+        priority = setup.tables[0]["priority"][a0, a1] - setup.tables[1]["priority"][a1, a0]
+        speed0 = setup.speed[0][a0] * np.where(status[0][idx, a0] == PARALYSIS, 0.5, 1)
+        speed1 = setup.speed[1][a1] * np.where(status[1][idx, a1] == PARALYSIS, 0.5, 1)
+        tie = rng.random(len(idx)) < 0.5
+        first0 = (priority > 0) | ((priority == 0) & ((speed0 > speed1) | ((speed0 == speed1) & tie)))
+
+        side0_first = np.zeros(n, dtype=bool)
+        side0_first[idx] = first0
+        side1_first = running & ~side0_first
+        none = np.zeros(n, dtype=bool)
+
+        flinched = attack(0, side0_first, side0_first, none)
+        flinched = attack(1, side1_first, side1_first, flinched)
+        alive0 = hp[0][sims, active[0]] > 0
+        alive1 = hp[1][sims, active[1]] > 0
+        flinched = attack(1, side0_first & alive1 & alive0, none, flinched)
+        attack(0, side1_first & alive0 & alive1, none, flinched)
+
+        # End-of-turn burn and poison damage, then replace fainted Pokemon
+        for side in (0, 1):
+            current = hp[side][sims, active[side]]
+            current_status = status[side][sims, active[side]]
+            for effect, fraction in CHIP_DAMAGE.items():
+                chip = running & (current > 0) & (current_status == effect)
+                hp[side][sims[chip], active[side][chip]] -= np.maximum(np.floor(setup.hp[side][active[side][chip]] * fraction), 1)
+
+        remaining = [(hp[side] > 0).any(axis=1) for side in (0, 1)]
+        for side in (0, 1):
+            fainted = running & (hp[side][sims, active[side]] <= 0) & remaining[side]
+            active[side][fainted] = np.argmax(hp[side][fainted] > 0, axis=1)
+
+        finished = running & ~(remaining[0] & remaining[1])
+        winner[finished & remaining[0]] = 0
+        winner[finished & remaining[1]] = 1
+        turns[finished] = turn
+        running &= ~finished
+
+    turns[running] = MAX_TURNS
+    return {"winner": winner, "turns": turns}
+
+
+def _run_shard(task) -> Dict[str, np.ndarray]:
+    setup, battles, seed = task
+    return run_battles(setup, battles, seed)
+
+
+def simulate(setup: BattleSetup, battles: int = 100_000, workers: Optional[int] = None,
+             seed: Optional[int] = None, shard_size: int = SHARD_SIZE) -> Dict:
+    """Run battles in shards across a process pool.
+
+    Returns win rates, the distribution of battle lengths and throughput.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(max(1, -(-battles // shard_size)))
+    tasks = [
+        (setup, min(shard_size, battles - i * shard_size), child)
+        for i, child in enumerate(seeds)
+    ]
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    if workers <= 1 or len(tasks) <= 1:
+        shards = [_run_shard(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            shards = list(executor.map(_run_shard, tasks))
+    elapsed = time.perf_counter() - start
+
+    winner = np.concatenate([shard["winner"] for shard in shards])
+    turns = np.concatenate([shard["turns"] for shard in shards])
+    counts = np.bincount(turns, minlength=MAX_TURNS + 1)
+    return {
+        "teams": setup.teams,
+        "movesets": setup.moves,
+        "battles": int(len(winner)),
+        "win_rate": [float(np.mean(winner == 0)), float(np.mean(winner == 1))],
+        "draw_rate": float(np.mean(winner == -1)),
+        "turns": {
+            "mean": float(turns.mean()),
+            "median": float(np.median(turns)),
+            "distribution": {int(t): int(c) for t, c in enumerate(counts) if c},
+        },
+        "workers": min(workers, len(tasks)),
+        "seconds": round(elapsed, 3),
+        "battles_per_second": round(len(winner) / elapsed) if elapsed else None,
+    }
+
+
+if __name__ == "__main__":
+    from data_store import get_store
+
+    store = get_store()
+    generation = MOVE_GENERATIONS[-1]
+    simulator = BattleSimulator(store.damage_calculator(generation), store.move_learners(generation))
+    names = store.pokemon_table().text["name"]
+    teams = [sys.argv[1:2] or [names[0]], sys.argv[2:3] or [names[3]]]
+    result = simulate(simulator.setup(teams), 100_000, seed=0)
+    print(f"{teams[0]} vs {teams[1]}: {result['battles']:,} battles")
+    print(f"  Win rate: {result['win_rate'][0]:.1%} / {result['win_rate'][1]:.1%} (draws {result['draw_rate']:.1%})")
+    print(f"  Turns: mean {result['turns']['mean']:.1f}, median {result['turns']['median']:.0f}")
+    print(f"  Movesets: {result['movesets']}")
+    print(f"  {result['battles_per_second']:,} battles/s on {result['workers']} worker(s)")
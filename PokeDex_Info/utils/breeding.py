@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Breeding
+Egg-group bitsets (bit = Pokemon table row) for instant compatible-partner
+lookups, and an egg move chain search: a breadth-first search over the
+egg-group graph finds the shortest chain of fathers that delivers an egg move
+to a target species in a generation. Chains for every (species, egg move)
+pair are precomputed in a batch spread across processes.
+
+Simplified model: any two breedable Pokemon sharing an egg group can pass a
+move they know; gender ratios and Ditto are not used for move chains.
+"""
+
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils, MOVE_GENERATIONS
+from team_coverage import learner_name
+
+UNDISCOVERED = "Undiscovered"
+DITTO = "Ditto"
+EGG_MOVE_METHOD = "Breeding"
+
+Chain = List[str]
+
+
+class BreedingIndex:
+    """Egg-group membership as bitsets over Pokemon table rows"""
+
+    def __init__(self, table):
+        self.names: List[str] = table.text["name"].tolist()
+        self.rows = {PokeDataUtils.normalize_key(name): row for row, name in enumerate(self.names)}
+        self.groups: List[str] = list(table.labels["egg_groups"])
+        membership = table.sets["egg_groups"]
+        self.row_groups: List[Tuple[int, ...]] = [tuple(np.flatnonzero(groups).tolist()) for groups in membership]
+        self.group_bits: List[int] = []
+        for column in range(len(self.groups)):
+            bits = 0
+            for row in np.flatnonzero(membership[:, column]):
+                bits |= 1 << int(row)
+            self.group_bits.append(bits)
+
+        columns = {PokeDataUtils.normalize_key(group): i for i, group in enumerate(self.groups)}
+        self.undiscovered = columns.get(PokeDataUtils.normalize_key(UNDISCOVERED))
+        self.ditto = columns.get(PokeDataUtils.normalize_key(DITTO))
+        undiscovered_bits = self._bits(self.undiscovered)
+        self.ditto_bits = self._bits(self.ditto)
+        # Rows that can breed at all (in some egg group other than Undiscovered)
+        self.breedable_bits = 0
+        for column, bits in enumerate(self.group_bits):
+            if column != self.undiscovered:
+                self.breedable_bits |= bits
+        self.breedable_bits &= ~undiscovered_bits
+
+    def _bits(self, column: Optional[int]) -> int:
+        return self.group_bits[column] if column is not None else 0
+
+    def row(self, name: str) -> int:
+        row = self.rows.get(PokeDataUtils.normalize_key(name))
+        if row is None:
+            raise ValueError(f"Unknown Pokemon '{name}'")
+        return row
+
+    def decode(self, bits: int) -> List[str]:
+        names = []
+        while bits:
+            low = bits & -bits
+            names.append(self.names[low.bit_length() - 1])
+            bits ^= low
+        return names
+
+    def partner_bits(self, name: str) -> int:
+        """Bitset of the rows that can produce an egg with `name`"""
+        row = self.row(name)
+        if not self.breedable_bits >> row & 1:
+            return 0
+        if self.ditto is not None and self.ditto in self.row_groups[row]:
+            return self.breedable_bits & ~self.ditto_bits
+        partners = self.ditto_bits
+        for group in self.row_groups[row]:
+            partners |= self.group_bits[group]
+        return partners & self.breedable_bits
+
+    def partners(self, name: str) -> List[str]:
+        return self.decode(self.partner_bits(name))
+
+    def compatible(self, first: str, second: str) -> bool:
+        return bool(self.partner_bits(first) >> self.row(second) & 1)
+
+    def egg_move_search(self, moves: List[Dict]) -> "EggMoveSearch":
+        """Egg move chain search over one generation's learnsets"""
+        learners: Dict[str, Tuple[set, set]] = {}
+        for move in moves:
+            natural, egg = learners.setdefault(move.get("name", ""), (set(), set()))
+            for learner in move.get("learned_by", []):
+                row = self.rows.get(PokeDataUtils.normalize_key(learner_name(learner)))
+                if row is None or not self.breedable_bits >> row & 1:
+                    continue
+                (egg if learner.get("method") == EGG_MOVE_METHOD else natural).add(row)
+        # A move learned naturally needs no chain
+        move_learners = {
+            name: (sorted(natural), sorted(egg - natural))
+            for name, (natural, egg) in learners.items()
+            if egg - natural
+        }
+        carrier_groups = [
+            tuple(g for g in groups if g != self.ditto) for groups in self.row_groups
+        ]
+        return EggMoveSearch(self.names, carrier_groups, move_learners)
+
+
+class EggMoveSearch:
+    """Shortest egg move chains for one generation.
+
+    Holds only plain lists and dicts so it can be shipped to worker processes.
+    """
+
+    def __init__(self, names: List[str], row_groups: List[Tuple[int, ...]],
+                 move_learners: Dict[str, Tuple[List[int], List[int]]]):
+        self.names = names
+        self.row_groups = row_groups
+        self.move_learners = move_learners
+        self.move_keys = {PokeDataUtils.normalize_key(move): move for move in move_learners}
+
+    def move_chains(self, move: str) -> Dict[str, Chain]:
+        """Chain (source first, target last) for every species with `move` as an egg move.
+
+        One BFS per move serves all targets: egg groups are reached from the
+        groups of natural learners, and a species with the egg move carries it
+        from one of its groups into its other groups.
+        """
+        natural, egg = self.move_learners.get(move, ([], []))
+        via: Dict[int, Tuple[int, Optional[int]]] = {}  # group -> (carrier row, previous group)
+        queue = deque()
+        for row in natural:
+            for group in self.row_groups[row]:
+                if group not in via:
+                    via[group] = (row, None)
+                    queue.append(group)
+
+        carriers_by_group: Dict[int, List[int]] = {}
+        for row in egg:
+            for group in self.row_groups[row]:
+                carriers_by_group.setdefault(group, []).append(row)
+
+        depth = {group: 0 for group in via}
+        while queue:
+            group = queue.popleft()
+            for carrier in carriers_by_group.get(group, []):
+                for other in self.row_groups[carrier]:
+                    if other not in via:
+                        via[other] = (carrier, group)
+                        depth[other] = depth[group] + 1
+                        queue.append(other)
+
+        chains = {}
+        for target in egg:
+            reached = [group for group in self.row_groups[target] if group in via]
+            if not reached:
+                continue
+            group: Optional[int] = min(reached, key=depth.get)
+            chain = [self.names[target]]
+            while group is not None:
+                carrier, group = via[group]
+                chain.append(self.names[carrier])
+            chains[self.names[target]] = chain[::-1]
+        return chains
+
+    def chain(self, target: str, move: str) -> Optional[Chain]:
+        """Shortest chain delivering `move` to `target`, or None"""
+        move = self.move_keys.get(PokeDataUtils.normalize_key(move), move)
+        return self.move_chains(move).get(target)
+
+    def all_chains(self, moves: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Chain]]:
+        """target -> move -> chain for every egg move (or the given moves)"""
+        chains: Dict[str, Dict[str, Chain]] = {}
+        for move in moves if moves is not None else self.move_learners:
+            for target, chain in self.move_chains(move).items():
+                chains.setdefault(target, {})[move] = chain
+        return chains
+
+
+def _search_chunk(task: Tuple[int, EggMoveSearch, List[str]]) -> Tuple[int, Dict[str, Dict[str, Chain]]]:
+    generation, search, moves = task
+    return generation, search.all_chains(moves)
+
+
+def precompute_egg_chains(
+    searches: Dict[int, EggMoveSearch], workers: Optional[int] = None, chunk_size: int = 64
+) -> Dict[int, Dict[str, Dict[str, Chain]]]:
+    """all_chains for every generation, with move chunks spread over processes"""
+    tasks = []
+    for generation, search in searches.items():
+        moves = list(search.move_learners)
+        for start in range(0, len(moves), chunk_size):
+            tasks.append((generation, search, moves[start:start + chunk_size]))
+
+    results: Dict[int, Dict[str, Dict[str, Chain]]] = {generation: {} for generation in searches}
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(tasks) <= 1:
+        chunks = [_search_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+            chunks = list(executor.map(_search_chunk, tasks))
+    for generation, chains in chunks:
+        for target, by_move in chains.items():
+            results[generation].setdefault(target, {}).update(by_move)
+    return results
+
+
+if __name__ == "__main__":
+    import time
+    from data_store import get_store
+
+    store = get_store()
+    breeding = store.breeding_index()
+    searches = {generation: store.egg_move_search(generation) for generation in MOVE_GENERATIONS}
+    for workers in (1, None):
+        start = time.perf_counter()
+        chains = precompute_egg_chains(searches, workers)
+        elapsed = (time.perf_counter() - start) * 1000
+        total = sum(len(by_move) for by_target in chains.values() for by_move in by_target.values())
+        print(f"{total} egg move chains with {workers or os.cpu_count()} worker(s) in {elapsed:.0f} ms")
+
+    latest = chains[MOVE_GENERATIONS[-1]]
+    for target, by_move in list(latest.items())[:5]:
+        for move, chain in by_move.items():
+            print(f"  {move} -> {target}: {' > '.join(chain)}")
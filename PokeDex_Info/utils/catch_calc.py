@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Catch Calculator
+Vectorized catch probabilities over species x ball x status x HP grids using
+each generation's capture formula (Gen 1, Gen 2, Gen 3-4 and Gen 5+ shake
+checks), with the Poke Ball modifiers from the items data. Full tables for
+every species are built in one NumPy pass per generation and cached, so
+single lookups are plain array indexing.
+
+Not modelled: critical captures, Legends: Arceus balls and mechanics, and
+per-game quirks such as the Gen 2 status bug beyond sleep/freeze.
+"""
+
+import os
+import sys
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils, MOVE_GENERATIONS
+from stat_calc import STATS, Spread, calculate_stats
+
+STATUSES = ("none", "sleep", "freeze", "paralysis", "poison", "burn")
+# Remaining HP as a fraction of max HP; 0.0 means 1 HP
+HP_FRACTIONS = (1.0, 0.5, 0.25, 0.0)
+POKE_BALL_CATEGORY = "Poké Balls"
+ULTRA_BEAST_ABILITY = "Beast Boost"
+MOON_STONE = "Moon Stone"
+
+# Gen 1 ball constants: (random range N, HP divisor G)
+GEN1_BALLS = {
+    "Poke Ball": (255, 12),
+    "Great Ball": (200, 8),
+    "Ultra Ball": (150, 12),
+    "Safari Ball": (150, 12),
+}
+GEN1_STATUS_BONUS = {"sleep": 25, "freeze": 25, "paralysis": 12, "poison": 12, "burn": 12}
+
+
+class Scenario:
+    """Battle conditions that some balls depend on"""
+
+    def __init__(self, level: int = 30, turn: int = 1, dark: bool = False, fishing: bool = False,
+                 underwater: bool = False, caught: bool = False, love: bool = False,
+                 own_level: Optional[int] = None):
+        self.level = level  # wild Pokemon level
+        self.turn = turn  # 1 = first turn of the battle
+        self.dark = dark  # night or cave (Dusk Ball)
+        self.fishing = fishing  # hooked with a rod (Lure Ball)
+        self.underwater = underwater  # diving or surfing (Dive Ball)
+        self.caught = caught  # species already registered (Repeat Ball)
+        self.love = love  # same species, opposite gender (Love Ball)
+        self.own_level = own_level  # level of the player's Pokemon (Level Ball)
+
+    def key(self) -> Tuple:
+        return tuple(vars(self).values())
+
+
+class BallContext:
+    """Per-species and per-status inputs handed to the ball modifier functions"""
+
+    def __init__(self, calculator: "CatchCalculator", rows: np.ndarray, generation: int, scenario: Scenario):
+        self.generation = generation
+        self.scenario = scenario
+        self.water_or_bug = calculator.water_or_bug[rows]
+        self.speed = calculator.speed[rows]
+        self.weight = calculator.weight[rows]
+        self.moon = calculator.moon[rows]
+        self.ultra_beast = calculator.ultra_beast[rows]
+        self.asleep = np.array([status == "sleep" for status in STATUSES])
+
+
+def _nest(c: BallContext) -> float:
+    top = 40 if c.generation <= 4 else 41
+    return max((top - c.scenario.level) / 10, 1.0)
+
+
+def _timer(c: BallContext) -> float:
+    turns = c.scenario.turn - 1
+    if c.generation <= 4:
+        return min((turns + 10) / 10, 4.0)
+    return min(1 + turns * 1229 / 4096, 4.0)
+
+
+def _level(c: BallContext) -> float:
+    own, level = c.scenario.own_level, c.scenario.level
+    if own is None or own <= level:
+        return 1.0
+    return 8.0 if own >= 4 * level else 4.0 if own >= 2 * level else 2.0
+
+
+def _lure(c: BallContext) -> float:
+    if not c.scenario.fishing:
+        return 1.0
+    return 3.0 if c.generation <= 6 else 5.0 if c.generation == 7 else 4.0
+
+
+# Ball -> (generation introduced, modifier); a modifier returns a catch rate
+# multiplier broadcastable to (species, status), or None for a guaranteed
+# capture. Additive modifiers (Heavy Ball) are in BALL_BONUS.
+BALLS: Dict[str, Tuple[int, Callable[[BallContext], Optional[object]]]] = {
+    "Poke Ball": (1, lambda c: 1.0),
+    "Great Ball": (1, lambda c: 1.5),
+    "Ultra Ball": (1, lambda c: 2.0),
+    "Master Ball": (1, lambda c: None),
+    "Safari Ball": (1, lambda c: 1.5),
+    "Fast Ball": (2, lambda c: np.where(c.speed >= 100, 4.0, 1.0)[:, None]),
+    "Level Ball": (2, _level),
+    "Lure Ball": (2, _lure),
+    "Heavy Ball": (2, lambda c: 1.0),
+    "Love Ball": (2, lambda c: 8.0 if c.scenario.love else 1.0),
+    "Friend Ball": (2, lambda c: 1.0),
+    "Moon Ball": (2, lambda c: np.where(c.moon, 4.0, 1.0)[:, None]),
+    "Sport Ball": (2, lambda c: 1.5),
+    "Net Ball": (3, lambda c: np.where(c.water_or_bug, 3.5 if c.generation >= 7 else 3.0, 1.0)[:, None]),
+    "Dive Ball": (3, lambda c: 3.5 if c.scenario.underwater else 1.0),
+    "Nest Ball": (3, _nest),
+    "Repeat Ball": (3, lambda c: (3.5 if c.generation >= 7 else 3.0) if c.scenario.caught else 1.0),
+    "Timer Ball": (3, _timer),
+    "Luxury Ball": (3, lambda c: 1.0),
+    "Premier Ball": (3, lambda c: 1.0),
+    "Dusk Ball": (4, lambda c: (3.0 if c.generation >= 7 else 3.5) if c.scenario.dark else 1.0),
+    "Heal Ball": (4, lambda c: 1.0),
+    "Quick Ball": (4, lambda c: (4.0 if c.generation <= 4 else 5.0) if c.scenario.turn <= 1 else 1.0),
+    "Cherish Ball": (4, lambda c: 1.0),
+    "Park Ball": (4, lambda c: None),
+    # Gen 5-7: only usable in the Entree Forest / Dream World, where it never fails
+    "Dream Ball": (5, lambda c: np.where(c.asleep, 4.0, 1.0)[None, :] if c.generation >= 8 else None),
+    "Beast Ball": (7, lambda c: np.where(c.ultra_beast, 5.0, 0.1)[:, None]),
+    "Strange Ball": (8, lambda c: 1.0),
+}
+
+
+def _heavy_ball(c: BallContext) -> np.ndarray:
+    """Catch rate bonus by weight (kg); unknown weights get no bonus"""
+    if c.generation >= 7:
+        steps = ((100, -20), (200, 0), (300, 20), (np.inf, 30))
+    else:
+        steps = ((204.8, -20), (307.2, 20), (409.6, 30), (np.inf, 40))
+    bonus = np.zeros(len(c.weight))
+    for limit, value in reversed(steps):
+        bonus = np.where(c.weight < limit, value, bonus)
+    return np.where(np.isnan(c.weight), 0, bonus)
+
+
+BALL_BONUS: Dict[str, Callable[[BallContext], np.ndarray]] = {"Heavy Ball": _heavy_ball}
+
+
+def status_multipliers(generation: int) -> np.ndarray:
+    """Multiplicative status bonus per STATUSES entry (Gen 3+)"""
+    sleep = 2.5 if generation >= 5 else 2.0
+    return np.array([1.0 if s == "none" else sleep if s in ("sleep", "freeze") else 1.5 for s in STATUSES])
+
+
+def capture_probability(generation: int, max_hp: np.ndarray, hp: np.ndarray, rate: np.ndarray,
+                        ball: np.ndarray, level: int) -> np.ndarray:
+    """Gen 3+ capture probability; all inputs broadcast together and `ball`
+    already includes the status multiplier"""
+    hp_term = 3 * max_hp - 2 * hp
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if generation <= 4:
+            a = np.floor(np.floor(hp_term * rate * ball) / (3 * max_hp))
+            b = np.floor(1048560 / np.floor(np.sqrt(np.floor(np.sqrt(np.floor(16711680 / a))))))
+            shake = np.minimum(b / 65536, 1.0)
+            probability = np.where(a >= 255, 1.0, np.where(a > 0, shake ** 4, 0.0))
+        else:
+            x = np.floor(hp_term * 4096 * rate * ball / (3 * max_hp))
+            if generation >= 8 and level < 20:
+                x = np.floor(x * (30 - level) / 10)
+            a = x / 4096
+            # Gen 5 makes three shake checks, Gen 6+ four; both land on (a/255)^0.75
+            shakes = 3 if generation == 5 else 4
+            shake = np.floor(65536 / (255 / a) ** (0.75 / shakes)) / 65536
+            probability = np.where(a >= 255, 1.0, np.where(a > 0, shake ** shakes, 0.0))
+    return probability
+
+
+class CatchCalculator:
+    """Catch probability tables over the Pokemon table for every supported ball"""
+
+    def __init__(self, table, balls: Optional[List[Dict]] = None, moon_stone: Sequence[str] = ()):
+        self.table = table
+        self.names: List[str] = table.text["name"].tolist()
+        self.rows = {PokeDataUtils.normalize_key(name): row for row, name in enumerate(self.names)}
+        self.catch_rate = table.numeric["game_mechanics.catch_rate"]
+        self.base_stats = np.column_stack(
+            [table.numeric[f"base_stats.{stat}"] for stat in STATS]
+        ) if len(table) else np.empty((0, len(STATS)))
+        self.speed = table.numeric["base_stats.speed"]
+        self.weight = table.numeric["physical_info.weight_kilograms"]
+        self.water_or_bug = table.mask("types in (Water, Bug)")
+        self.ultra_beast = table.mask(f"abilities has {ULTRA_BEAST_ABILITY}")
+        moon_keys = {PokeDataUtils.normalize_key(name) for name in moon_stone}
+        self.moon = np.array([PokeDataUtils.normalize_key(name) in moon_keys for name in self.names], dtype=bool)
+
+        # Balls from the items data that have a known modifier, in data order;
+        # the full list when no items data is given
+        known = {PokeDataUtils.normalize_key(name): name for name in BALLS}
+        names = [ball.get("name", "") for ball in balls] if balls else list(BALLS)
+        self.balls: List[str] = []
+        self.unsupported: List[str] = []
+        for name in names:
+            ball = known.get(PokeDataUtils.normalize_key(name))
+            if ball is None:
+                if name not in self.unsupported:
+                    self.unsupported.append(name)
+            elif ball not in self.balls:
+                self.balls.append(ball)
+        self.ball_index = {PokeDataUtils.normalize_key(ball): i for i, ball in enumerate(self.balls)}
+        self._tables: Dict[Tuple, np.ndarray] = {}
+
+    def row(self, name: str) -> int:
+        row = self.rows.get(PokeDataUtils.normalize_key(name))
+        if row is None:
+            raise ValueError(f"Unknown Pokemon '{name}'")
+        return row
+
+    def _ball(self, ball: str) -> int:
+        index = self.ball_index.get(PokeDataUtils.normalize_key(ball))
+        if index is None:
+            raise ValueError(f"Unknown or unsupported ball '{ball}'")
+        return index
+
+    @staticmethod
+    def _status(status: Optional[str]) -> int:
+        status = (status or "none").lower()
+        if status not in STATUSES:
+            raise ValueError(f"Unknown status '{status}' (expected one of {', '.join(STATUSES)})")
+        return STATUSES.index(status)
+
+    def available_balls(self, generation: int) -> List[str]:
+        if generation == 1:
+            return [ball for ball in self.balls if ball in GEN1_BALLS or ball == "Master Ball"]
+        return [ball for ball in self.balls if BALLS[ball][0] <= generation]
+
+    def compute(
+        self,
+        generation: int = MOVE_GENERATIONS[-1],
+        scenario: Optional[Scenario] = None,
+        rows: Optional[np.ndarray] = None,
+        hp_fractions: Sequence[float] = HP_FRACTIONS,
+    ) -> np.ndarray:
+        """Probabilities as a (species, ball, status, hp) array.
+
+        Balls not available in the generation and species without a catch
+        rate are NaN.
+        """
+        scenario = scenario or Scenario()
+        rows = np.arange(len(self.names)) if rows is None else np.asarray(rows, dtype=int)
+        rate = self.catch_rate[rows]
+        max_hp = calculate_stats(self.base_stats[rows], Spread(scenario.level), generation)[:, 0]
+        max_hp = np.nan_to_num(max_hp, nan=1.0)
+        fractions = np.asarray(hp_fractions, dtype=float)
+        hp = np.maximum(np.floor(max_hp[:, None] * fractions[None, :]), 1)  # (species, hp)
+
+        result = np.full((len(rows), len(self.balls), len(STATUSES), len(fractions)), np.nan)
+        available = set(self.available_balls(generation))
+        context = BallContext(self, rows, generation, scenario)
+        m, h = max_hp[:, None, None], hp[:, None, :]  # (species, status, hp)
+        for b, ball in enumerate(self.balls):
+            if ball not in available:
+                continue
+            if generation == 1:
+                result[:, b] = self._gen1(ball, rate, m, h)
+                continue
+            modifier = BALLS[ball][1](context)
+            if modifier is None:
+                result[:, b] = 1.0
+                continue
+            modifier = np.broadcast_to(np.asarray(modifier, dtype=float), (len(rows), len(STATUSES)))
+            ball_rate = rate
+            if ball in BALL_BONUS:
+                ball_rate = np.clip(rate + BALL_BONUS[ball](context), 1, 255)
+            if generation == 2:
+                result[:, b] = self._gen2(ball_rate, modifier, m, h)
+            else:
+                multiplier = modifier * status_multipliers(generation)[None, :]
+                result[:, b] = capture_probability(
+                    generation, m, h, ball_rate[:, None, None], multiplier[:, :, None], scenario.level
+                )
+        result[np.isnan(rate)] = np.nan
+        return result
+
+    @staticmethod
+    def _gen1(ball: str, rate: np.ndarray, max_hp: np.ndarray, hp: np.ndarray) -> np.ndarray:
+        """Gen 1: status check, then catch rate check, then HP check"""
+        if ball not in GEN1_BALLS:
+            return np.ones((len(rate), len(STATUSES), hp.shape[-1]))
+        n, divisor = GEN1_BALLS[ball]
+        bonus = np.array([GEN1_STATUS_BONUS.get(status, 0) for status in STATUSES])[None, :, None]
+        f = np.minimum(np.floor(np.floor(max_hp * 255 / divisor) / np.maximum(np.floor(hp / 4), 1)), 255)
+        passes_rate = np.minimum(rate[:, None, None] + 1, n + 1 - bonus) / (n + 1)
+        return bonus / (n + 1) + passes_rate * (f + 1) / 256
+
+    @staticmethod
+    def _gen2(rate: np.ndarray, modifier: np.ndarray, max_hp: np.ndarray, hp: np.ndarray) -> np.ndarray:
+        """Gen 2: one roll against a (only sleep and freeze add a bonus)"""
+        modified = np.clip(np.floor(rate[:, None] * modifier), 1, 255)[:, :, None]
+        a = np.maximum(np.floor((3 * max_hp - 2 * hp) * modified / (3 * max_hp)), 1)
+        bonus = np.array([10 if status in ("sleep", "freeze") else 0 for status in STATUSES])[None, :, None]
+        return (np.minimum(a + bonus, 255) + 1) / 256
+
+    def tables(self, generation: int = MOVE_GENERATIONS[-1], scenario: Optional[Scenario] = None) -> np.ndarray:
+        """Cached compute() for every species at HP_FRACTIONS"""
+        scenario = scenario or Scenario()
+        key = (generation, scenario.key())
+        if key not in self._tables:
+            self._tables[key] = self.compute(generation, scenario)
+        return self._tables[key]
+
+    def probability(self, name: str, ball: str = "Poke Ball", status: Optional[str] = None,
+                    hp: float = 1.0, generation: int = MOVE_GENERATIONS[-1],
+                    scenario: Optional[Scenario] = None) -> float:
+        """Chance that one throw catches `name`; `hp` is the remaining HP fraction (0 = 1 HP)"""
+        row, b, s = self.row(name), self._ball(ball), self._status(status)
+        if hp in HP_FRACTIONS:
+            return float(self.tables(generation, scenario)[row, b, s, HP_FRACTIONS.index(hp)])
+        return float(self.compute(generation, scenario, [row], [hp])[0, b, s, 0])
+
+    def best_balls(self, name: str, status: Optional[str] = None, hp: float = 1.0,
+                   generation: int = MOVE_GENERATIONS[-1], scenario: Optional[Scenario] = None,
+                   limit: int = 5) -> List[Dict]:
+        """Balls ranked by catch chance, with the expected number of throws"""
+        row, s = self.row(name), self._status(status)
+        if hp in HP_FRACTIONS:
+            chances = self.tables(generation, scenario)[row, :, s, HP_FRACTIONS.index(hp)]
+        else:
+            chances = self.compute(generation, scenario, [row], [hp])[0, :, s, 0]
+        order = [b for b in np.argsort(-np.nan_to_num(chances, nan=-1.0), kind="stable") if not np.isnan(chances[b])]
+        return [
+            {
+                "ball": self.balls[b],
+                "probability": round(float(chances[b]), 4),
+                "expected_throws": round(1 / float(chances[b]), 1) if chances[b] > 0 else None,
+            }
+            for b in order[:limit]
+        ]
+
+    def to_dict(self, generation: int = MOVE_GENERATIONS[-1], statuses: Sequence[str] = ("none", "paralysis", "sleep"),
+                hp_fractions: Sequence[float] = (1.0, 0.0)) -> Dict:
+        """Compact table for the web app: probabilities in tenths of a percent,
+        indexed [species][ball][status][hp]; -1 where unavailable"""
+        balls = self.available_balls(generation)
+        table = self.tables(generation)
+        ball_columns = [self.balls.index(ball) for ball in balls]
+        status_columns = [self._status(status) for status in statuses]
+        hp_columns = [HP_FRACTIONS.index(hp) for hp in hp_fractions]
+        grid = table[:, ball_columns][:, :, status_columns][:, :, :, hp_columns]
+        values = np.where(np.isnan(grid), -1, np.round(np.nan_to_num(grid) * 1000)).astype(int)
+        return {
+            "version": 1,
+            "generation": generation,
+            "scenario": vars(Scenario()),
+            "balls": balls,
+            "statuses": list(statuses),
+            "hp": list(hp_fractions),
+            "names": self.names,
+            "catch_rate": [None if np.isnan(r) else int(r) for r in self.catch_rate],
+            "probability": values.tolist(),
+        }
+
+
+def moon_stone_species(graph) -> List[str]:
+    """Species that evolve with a Moon Stone (Moon Ball targets)"""
+    return sorted(
+        {step["from"] for method in graph.by_method if MOON_STONE in method for step in graph.evolutions_by_method(method)}
+    )
+
+
+if __name__ == "__main__":
+    import time
+    from data_store import get_store
+
+    calculator = get_store().catch_calculator()
+    generation = MOVE_GENERATIONS[-1]
+    start = time.perf_counter()
+    table = calculator.tables(generation)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{table.size:,} probabilities ({' x '.join(map(str, table.shape))}) in {elapsed:.0f} ms")
+    if calculator.unsupported:
+        print(f"Unsupported balls: {', '.join(calculator.unsupported)}")
+
+    name = sys.argv[1] if len(sys.argv) > 1 else calculator.names[0]
+    start = time.perf_counter()
+    for _ in range(10000):
+        calculator.probability(name, "Ultra Ball", "sleep", 0.0, generation)
+    print(f"Lookup: {(time.perf_counter() - start) * 100:.1f} µs")
+    for status, hp in (("none", 1.0), ("sleep", 0.0)):
+        print(f"{name} ({status}, {'1 HP' if hp == 0 else f'{hp:.0%} HP'}):")
+        for entry in calculator.best_balls(name, status, hp, generation):
+            print(f"  {entry['ball']:<13} {entry['probability']:.2%}  ~{entry['expected_throws']} throws")
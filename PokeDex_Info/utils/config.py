@@ -4,12 +4,18 @@ Pokemon Data Collection System - Configuration and Utilities
 Central configuration and shared utilities for all scrapers
 """
 
-import json
+import os
+import sys
+import tempfile
 import time
 import requests
 from bs4 import BeautifulSoup
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 
+sys.path.append(os.path.dirname(__file__))
+import serialization
+
 # Configuration
 BASE_URLS = {
     "serebii_pokemon": "https://www.serebii.net/pokemon/",
@@ -27,11 +33,71 @@ DATA_FILES = {
     "games": "data/games/pokemon_games.json",
 }
 
+# Per-generation moves files and per-category items files
+MOVES_FILE_TEMPLATE = "data/moves/moves_data_gen{generation}.json"
+ITEMS_CATEGORY_DIR = "data/items/by_category"
+MOVE_GENERATIONS = list(range(1, 10))
+
+# Precomputed indexes and tables written by build_derived_data.py
+DERIVED_DATA_DIR = "data/derived"
+
+# Optional SQLite copy of every dataset (utils/sqlite_store.py)
+SQLITE_DB_FILE = "data/pokedex.db"
+
+# Columnar Parquet copy written by utils/parquet_export.py (needs pyarrow)
+PARQUET_DATA_DIR = "data/parquet"
+
+# Last national dex number introduced in each generation
+GENERATION_LAST_DEX = {1: 151, 2: 251, 3: 386, 4: 493, 5: 649, 6: 721, 7: 809, 8: 905, 9: 1025}
+
 # Request settings
 REQUEST_DELAY = 0.5  # Seconds between requests
 REQUEST_TIMEOUT = 10  # Timeout for requests
 
 
+@contextmanager
+def atomic_write(file_path: str, encoding: str = "utf-8", binary: bool = False):
+    """Open a temporary file for writing that replaces file_path on success.
+
+    The data is flushed and fsynced before os.replace, so readers see either
+    the old file or the complete new one. On error the target is untouched.
+    """
+    file_path = os.fspath(file_path)
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(file_path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with (os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", encoding=encoding)) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file as 0600; keep the target's permissions
+        try:
+            os.chmod(temp_path, os.stat(file_path).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(temp_path, 0o644)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    # Persist the rename itself (not supported on every platform)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
 class PokeDataUtils:
     """Utility class for Pokemon data operations"""
 
@@ -39,22 +105,29 @@ class PokeDataUtils:
     def load_json_data(file_path: str) -> List[Dict] | Dict:
         """Load JSON data from file"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return serialization.load(file_path)
         except FileNotFoundError:
             return []
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             print(f"Error loading {file_path}: {e}")
             return []
 
     @staticmethod
-    def save_json_data(data: List[Dict] | Dict, file_path: str):
-        """Save data to JSON file"""
+    def save_json_data(data: List[Dict] | Dict, file_path: str, compact: bool = False):
+        """Save data to JSON file atomically.
+
+        The JSON is written (streamed, with the stdlib backend) to a
+        temporary file next to the target, which replaces the target only
+        once fully written, so a crash never leaves a truncated file.
+        compact=True drops indentation and spaces. Errors are reported and
+        re-raised; the existing file is left untouched.
+        """
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with atomic_write(file_path, binary=True) as f:
+                serialization.dump(data, f, compact)
         except Exception as e:
             print(f"Error saving {file_path}: {e}")
+            raise
 
     @staticmethod
     def format_pokemon_name_for_url(name: str) -> str:
@@ -67,6 +140,15 @@ class PokeDataUtils:
             .replace("-", "")
         )
 
+    @staticmethod
+    def normalize_key(name: str) -> str:
+        """Normalize a name for lookups ('Flabébé' -> 'flabebe', 'thick-fat' -> 'thickfat')"""
+        import unicodedata
+
+        name = name.replace("♀", "f").replace("♂", "m")
+        decomposed = unicodedata.normalize("NFKD", name.casefold())
+        return "".join(ch for ch in decomposed if ch.isalnum() and ch.isascii())
+
     @staticmethod
     def safe_request(url: str, delay: float = REQUEST_DELAY) -> Optional[BeautifulSoup]:
         """Make a safe HTTP request with error handling"""
@@ -148,6 +230,16 @@ def get_all_game_names() -> List[str]:
     return all_games
 
 
+def generation_for_dex_number(number: Optional[int]) -> Optional[int]:
+    """Return the generation a national dex number was introduced in"""
+    if not number:
+        return None
+    for generation, last_dex in GENERATION_LAST_DEX.items():
+        if number <= last_dex:
+            return generation
+    return max(GENERATION_LAST_DEX)
+
+
 def get_pokemon_names() -> List[str]:
     """Get list of all Pokemon names from existing data"""
     pokemon_data = PokeDataUtils.load_json_data(DATA_FILES["pokemon"])
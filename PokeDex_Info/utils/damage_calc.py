@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Batch Damage Calculator
+Vectorized main-series damage formula (Gen 5+) over attacker x defender x move
+grids: level, nature, IV/EV spreads, STAB, type effectiveness, weather,
+critical hits and burn. Returns damage ranges over the 16 random rolls and
+one-hit KO probabilities (including accuracy) for the whole grid at once.
+"""
+
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils, MOVE_GENERATIONS
+from type_chart import TYPE_INDEX
+from stat_calc import STATS, Spread, calculate_stats
+
+RANDOM_ROLLS = np.arange(85, 101)
+WEATHER_MODIFIERS = {
+    "sun": {"Fire": 1.5, "Water": 0.5},
+    "rain": {"Water": 1.5, "Fire": 0.5},
+}
+CRIT_MULTIPLIER = 1.5
+STAB_MULTIPLIER = 1.5
+
+
+class DamageGrid:
+    """Damage ranges and KO chances for every (attacker, defender, move)"""
+
+    def __init__(self, attackers: List[str], defenders: List[str], moves: List[Dict],
+                 minimum: np.ndarray, maximum: np.ndarray, ko_chance: np.ndarray,
+                 defender_hp: np.ndarray, effectiveness: np.ndarray):
+        self.attackers = attackers
+        self.defenders = defenders
+        self.moves = moves
+        self.min = minimum
+        self.max = maximum
+        self.ko_chance = ko_chance
+        self.defender_hp = defender_hp
+        self.effectiveness = effectiveness
+
+    @property
+    def shape(self):
+        return self.min.shape
+
+    def results(self, limit: Optional[int] = None, min_ko_chance: float = 0.0) -> List[Dict]:
+        """Flattened results, best KO chance and damage first.
+
+        damage and percent are None where an attacker or defender has no
+        base stats (the grid holds NaN there)."""
+        order = np.lexsort((-self.max.ravel(), -self.ko_chance.ravel()))
+        order = order[self.ko_chance.ravel()[order] >= min_ko_chance]
+        if limit is not None:
+            order = order[:limit]
+        results = []
+        for a, d, m in zip(*np.unravel_index(order, self.shape)):
+            hp = self.defender_hp[d]
+            low, high = self.min[a, d, m], self.max[a, d, m]
+            known = not np.isnan(low + high + hp)
+            results.append(
+                {
+                    "attacker": self.attackers[a],
+                    "defender": self.defenders[d],
+                    "move": self.moves[m].get("name"),
+                    "damage": [int(low), int(high)] if known else None,
+                    "percent": [
+                        round(float(low / hp * 100), 1),
+                        round(float(high / hp * 100), 1),
+                    ] if known else None,
+                    "effectiveness": float(self.effectiveness[d, m]),
+                    "ko_chance": round(float(self.ko_chance[a, d, m]), 3),
+                    "priority": self.moves[m].get("speed_priority") or 0,
+                }
+            )
+        return results
+
+
+class DamageCalculator:
+    """Batch damage calculations over the Pokemon table and one generation's moves"""
+
+    def __init__(self, matchups, moves: List[Dict]):
+        self.matchups = matchups
+        self.table = matchups.table
+        self.base_stats = np.column_stack(
+            [self.table.numeric[f"base_stats.{stat}"] for stat in STATS]
+        ) if len(self.table) else np.empty((0, len(STATS)))
+        self.moves_by_name = {}
+        for move in moves:
+            self.moves_by_name.setdefault(PokeDataUtils.normalize_key(move.get("name", "")), move)
+
+    def _rows(self, names: Union[str, Sequence[str]]) -> np.ndarray:
+        """Row indices for a list of names or a query expression"""
+        if isinstance(names, str):
+            return self.table.rows(names)
+        return np.array([self.matchups._row(name) for name in names], dtype=int)
+
+    def _moves(self, moves: Sequence[Union[str, Dict]]) -> List[Dict]:
+        resolved = []
+        for move in moves:
+            if isinstance(move, dict):
+                resolved.append(move)
+                continue
+            found = self.moves_by_name.get(PokeDataUtils.normalize_key(move))
+            if found is None:
+                raise ValueError(f"Unknown move '{move}'")
+            resolved.append(found)
+        return resolved
+
+    def damaging_moves(self, battle_type: Optional[str] = None) -> List[Dict]:
+        return [
+            move
+            for move in self.moves_by_name.values()
+            if move.get("category") in ("Physical", "Special")
+            and move.get("base_power")
+            and (battle_type is None or move.get("battle_type") == battle_type)
+        ]
+
+    def calculate(
+        self,
+        attackers: Union[str, Sequence[str]],
+        defenders: Union[str, Sequence[str]],
+        moves: Sequence[Union[str, Dict]],
+        attacker_spread: Optional[Spread] = None,
+        defender_spread: Optional[Spread] = None,
+        weather: Optional[str] = None,
+        critical: bool = False,
+        burned: bool = False,
+    ) -> DamageGrid:
+        """Damage for every attacker x defender x move.
+
+        attackers and defenders are lists of names or query expressions
+        ("game in Scarlet"); moves are names or move dicts.
+        """
+        attacker_spread = attacker_spread or Spread()
+        defender_spread = defender_spread or Spread()
+        attacker_rows = self._rows(attackers)
+        defender_rows = self._rows(defenders)
+        moves = self._moves(moves)
+
+        attacker_stats = calculate_stats(self.base_stats[attacker_rows], attacker_spread)
+        defender_stats = calculate_stats(self.base_stats[defender_rows], defender_spread)
+
+        power = np.array([move.get("base_power") or 0 for move in moves], dtype=float)
+        physical = np.array([move.get("category") == "Physical" for move in moves])
+        accuracy = np.array(
+            [(move.get("accuracy") or 100) / 100 for move in moves], dtype=float
+        )
+        type_codes = np.array(
+            [TYPE_INDEX.get(PokeDataUtils.normalize_key(move.get("battle_type") or ""), -1) for move in moves]
+        )
+        known = type_codes >= 0
+        type_codes = np.where(known, type_codes, 0)
+
+        # (attacker, move) attacking stat and (defender, move) defending stat
+        attack = np.where(physical, attacker_stats[:, [1]], attacker_stats[:, [3]])
+        defense = np.where(physical, defender_stats[:, [2]], defender_stats[:, [4]])
+        stab = self.matchups.type_members[attacker_rows][:, type_codes] & known
+        effectiveness = np.where(
+            known, self.matchups.multipliers[defender_rows][:, type_codes], 1.0
+        )
+
+        level_factor = np.floor(2 * attacker_spread.level / 5 + 2)
+        base = np.floor(
+            np.floor(level_factor * power * attack[:, None, :] / defense[None, :, :]) / 50
+        ) + 2
+
+        if weather:
+            modifiers = np.ones(len(moves))
+            for type_name, multiplier in WEATHER_MODIFIERS.get(weather.lower(), {}).items():
+                modifiers[(type_codes == TYPE_INDEX[PokeDataUtils.normalize_key(type_name)]) & known] = multiplier
+            base = np.floor(base * modifiers)
+        if critical:
+            base = np.floor(base * CRIT_MULTIPLIER)
+
+        shape = base.shape
+        stab_multiplier = np.broadcast_to(np.where(stab, STAB_MULTIPLIER, 1.0)[:, None, :], shape)
+        type_multiplier = np.broadcast_to(effectiveness[None, :, :], shape)
+        burn_multiplier = np.broadcast_to(np.where(physical & burned, 0.5, 1.0), shape)
+        hits = np.broadcast_to(power > 0, shape) & (type_multiplier > 0)
+        hp = defender_stats[:, 0]
+        target_hp = np.broadcast_to(hp[None, :, None], shape)
+
+        def damage_for(roll, cells=...):
+            damage = np.floor(base[cells] * roll / 100)
+            damage = np.floor(damage * stab_multiplier[cells])
+            damage = np.floor(damage * type_multiplier[cells])
+            damage = np.floor(damage * burn_multiplier[cells])
+            return np.where(hits[cells], np.maximum(damage, 1), 0)
+
+        # Damage never decreases with the roll, so only cells whose KO depends
+        # on the roll need all 16 of them
+        minimum = damage_for(RANDOM_ROLLS[0])
+        maximum = damage_for(RANDOM_ROLLS[-1])
+        ko_rolls = np.where(minimum >= target_hp, float(len(RANDOM_ROLLS)), 0.0)
+        partial = (maximum >= target_hp) & (minimum < target_hp)
+        if partial.any():
+            partial_hp = target_hp[partial]
+            ko_rolls[partial] = sum(
+                damage_for(roll, partial) >= partial_hp for roll in RANDOM_ROLLS
+            )
+
+        ko_chance = ko_rolls / len(RANDOM_ROLLS) * accuracy
+        names = self.table.text["name"]
+        return DamageGrid(
+            names[attacker_rows].tolist(),
+            names[defender_rows].tolist(),
+            moves,
+            minimum,
+            maximum,
+            ko_chance,
+            hp,
+            effectiveness,
+        )
+
+
+if __name__ == "__main__":
+    import time
+    from data_store import get_store
+
+    store = get_store()
+    calculator = store.damage_calculator(MOVE_GENERATIONS[-1])
+    names = store.pokemon_table().text["name"]
+    attacker = sys.argv[1] if len(sys.argv) > 1 else (names[0] if len(names) else "Garchomp")
+    moves = calculator.damaging_moves()
+
+    start = time.perf_counter()
+    grid = calculator.calculate(
+        [attacker], "game in Scarlet", moves, attacker_spread=Spread(evs={"attack": 252, "sp_attack": 252})
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{attacker}: {len(moves)} moves x {len(grid.defenders)} defenders in {elapsed:.1f} ms")
+    for result in grid.results(limit=10):
+        print(f"  {result}")
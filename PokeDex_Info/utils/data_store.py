@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - In-Memory Data Store
+Process-wide cache that parses each JSON dataset once and serves it from memory.
+A dataset is only re-parsed when its file changes on disk (mtime/size first,
+then a content hash so a touched-but-identical file is not parsed again).
+"""
+
+import glob
+import hashlib
+import os
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(__file__))
+from config import (
+    PokeDataUtils,
+    DATA_FILES,
+    MOVES_FILE_TEMPLATE,
+    MOVE_GENERATIONS,
+    ITEMS_CATEGORY_DIR,
+)
+import serialization
+from lookup import PokemonLookup
+from inverted_index import PokemonInvertedIndex
+from search_index import SearchIndex, build_search_index
+from text_search import FullTextIndex, sync_text_index
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+class _CachedDataset:
+    """A parsed dataset plus the file signature it was loaded from"""
+
+    __slots__ = ("signature", "digest", "data", "version")
+
+    def __init__(self, signature, digest: Optional[str], data: Any, version: int):
+        self.signature = signature
+        self.digest = digest
+        self.data = data
+        self.version = version
+
+
+class DataStore:
+    """Loads datasets once and caches them (and anything derived from them)"""
+
+    def __init__(self, root: str = PROJECT_ROOT):
+        self.root = root
+        self._entries: Dict[str, _CachedDataset] = {}
+        self._derived: Dict[Tuple, Tuple[Tuple, Any]] = {}
+        self._lock = threading.RLock()
+        self._next_version = 1
+        self._text_index: Optional[FullTextIndex] = None
+
+    def resolve(self, key: str) -> str:
+        """Resolve a DATA_FILES key or a project-relative path to an absolute path"""
+        path = DATA_FILES.get(key, key)
+        if not os.path.isabs(path):
+            path = os.path.join(self.root, path)
+        return os.path.normpath(path)
+
+    @staticmethod
+    def _signature(path: str):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _entry(self, key: str) -> _CachedDataset:
+        path = self.resolve(key)
+        signature = self._signature(path)
+        entry = self._entries.get(path)
+        if entry is not None and entry.signature == signature:
+            return entry
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.signature == signature:
+                return entry
+
+            if signature is None:
+                digest, data = None, []
+            else:
+                with open(path, "rb") as f:
+                    raw = f.read()
+                digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+                if entry is not None and entry.digest == digest:
+                    # File was touched but the content is unchanged
+                    entry.signature = signature
+                    return entry
+                try:
+                    data = serialization.loads(raw)
+                except ValueError as e:
+                    print(f"Error loading {path}: {e}")
+                    data = []
+
+            entry = _CachedDataset(signature, digest, data, self._next_version)
+            self._next_version += 1
+            self._entries[path] = entry
+            return entry
+
+    def load(self, key: str) -> Any:
+        """Return the parsed dataset for a DATA_FILES key or project-relative path.
+
+        The returned object is shared by every caller in the process, so treat
+        it as read-only unless you save it back through save().
+        """
+        return self._entry(key).data
+
+    def version(self, key: str) -> int:
+        """Return a number that changes every time the dataset is re-parsed"""
+        return self._entry(key).version
+
+    def derived(self, keys: List[str], name: str, builder: Callable[..., Any]) -> Any:
+        """Return builder(*datasets), cached until any of the datasets change"""
+        versions = tuple(self._entry(key).version for key in keys)
+        cache_key = (name, tuple(keys))
+        cached = self._derived.get(cache_key)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+
+        with self._lock:
+            value = builder(*(self._entry(key).data for key in keys))
+            self._derived[cache_key] = (versions, value)
+            return value
+
+    def save(self, key: str, data: Any):
+        """Write a dataset to disk and keep the in-memory copy in sync.
+
+        The cache is only updated once the write succeeded; errors propagate.
+        """
+        path = self.resolve(key)
+        with self._lock:
+            try:
+                PokeDataUtils.save_json_data(data, path)
+            except Exception:
+                # The file is unchanged but `data` may have been edited in
+                # place; drop the cached copy so the next load re-reads disk
+                self._entries.pop(path, None)
+                raise
+            signature = self._signature(path)
+            if signature is None:
+                return
+            with open(path, "rb") as f:
+                digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+            self._entries[path] = _CachedDataset(
+                signature, digest, data, self._next_version
+            )
+            self._next_version += 1
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one cached dataset (or everything) so the next access re-reads it"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._derived.clear()
+                self._text_index = None
+            else:
+                self._entries.pop(self.resolve(key), None)
+
+    # Dataset accessors
+    def pokemon(self) -> List[Dict]:
+        data = self.load("pokemon")
+        return data if isinstance(data, list) else []
+
+    def pokemon_lookup(self) -> PokemonLookup:
+        """Name/number/slug/form hash indexes over the cached Pokemon records"""
+        return self.derived(["pokemon"], "pokemon_lookup", PokemonLookup)
+
+    def pokemon_index(self) -> PokemonInvertedIndex:
+        """Type/ability/game/egg group/generation posting lists over the Pokemon"""
+        return self.derived(["pokemon"], "pokemon_index", PokemonInvertedIndex)
+
+    def pokemon_table(self):
+        """Columnar NumPy view of the Pokemon for compiled filter queries"""
+        from query_engine import PokemonTable
+
+        return self.derived(["pokemon"], "pokemon_table", PokemonTable)
+
+    def stat_matrix(self):
+        """Base stat matrix with rank/percentile/z-score/top-k analytics"""
+        from stat_analytics import StatMatrix
+
+        return self.derived(
+            ["pokemon"], "stat_matrix", lambda data: StatMatrix(self.pokemon_table())
+        )
+
+    def type_matchups(self, generation: Optional[int] = None):
+        """Defensive type multipliers of every Pokemon (latest chart by default)"""
+        from type_chart import DefensiveMatchups, LATEST_GENERATION
+
+        generation = generation or LATEST_GENERATION
+        return self.derived(
+            ["pokemon"],
+            f"type_matchups:{generation}",
+            lambda data: DefensiveMatchups(self.pokemon_table(), generation),
+        )
+
+    def team_coverage(self, generation: int = MOVE_GENERATIONS[-1]):
+        """Team coverage analyzer using the moves learnable in a generation"""
+        from team_coverage import TeamCoverage, attack_type_learnsets
+
+        moves_key = MOVES_FILE_TEMPLATE.format(generation=generation)
+        return self.derived(
+            ["pokemon", moves_key],
+            "team_coverage",
+            lambda pokemon, moves_file: TeamCoverage(
+                self.type_matchups(generation),
+                attack_type_learnsets(self.moves(generation)),
+            ),
+        )
+
+    def team_builder(self, generation: int = MOVE_GENERATIONS[-1]):
+        """Branch-and-bound team search over a generation's learnsets"""
+        from team_builder import TeamBuilder
+
+        return TeamBuilder(self.team_coverage(generation))
+
+    def damage_calculator(self, generation: int = MOVE_GENERATIONS[-1]):
+        """Batch damage calculator over one generation's moves"""
+        from damage_calc import DamageCalculator
+
+        moves_key = MOVES_FILE_TEMPLATE.format(generation=generation)
+        return self.derived(
+            ["pokemon", moves_key],
+            "damage_calculator",
+            lambda pokemon, moves_file: DamageCalculator(
+                self.type_matchups(generation), self.moves(generation)
+            ),
+        )
+
+    def move_recommender(self, generation: int = MOVE_GENERATIONS[-1]):
+        """Species x move scores and top moves for one generation"""
+        from move_recommender import MoveRecommender
+
+        moves_key = MOVES_FILE_TEMPLATE.format(generation=generation)
+        return self.derived(
+            ["pokemon", moves_key],
+            "move_recommender",
+            lambda pokemon, moves_file: MoveRecommender(
+                self.type_matchups(generation), self.moves(generation), generation
+            ),
+        )
+
+    def similarity_index(self):
+        """k-NN index over stat distribution, typing and abilities"""
+        from similarity import SimilarityIndex
+
+        return self.derived(
+            ["pokemon"], "similarity_index", lambda data: SimilarityIndex(self.pokemon_table())
+        )
+
+    def learner_space(self):
+        """Global species/form IDs for every Pokemon that learns a move"""
+        from learnsets import LearnerSpace
+
+        moves = [MOVES_FILE_TEMPLATE.format(generation=g) for g in MOVE_GENERATIONS]
+        return self.derived(
+            moves,
+            "learner_space",
+            lambda *files: LearnerSpace.from_moves(self.moves(g) for g in MOVE_GENERATIONS),
+        )
+
+    def move_learners(self, generation: int = MOVE_GENERATIONS[-1]):
+        """Per-move learner bitsets for a generation (IDs shared across generations)"""
+        from learnsets import learner_indexes
+
+        moves = [MOVES_FILE_TEMPLATE.format(generation=g) for g in MOVE_GENERATIONS]
+        indexes = self.derived(moves, "move_learners", lambda *files: learner_indexes(self))
+        return indexes[generation]
+
+    def learnset_table(self):
+        """Normalized learnset rows for every generation with per-Pokemon slices"""
+        from learnsets import learnset_table
+
+        moves = [MOVES_FILE_TEMPLATE.format(generation=g) for g in MOVE_GENERATIONS]
+        return self.derived(moves, "learnset_table", lambda *files: learnset_table(self))
+
+    def evolution_graph(self):
+        """Evolution DAG with families, stages, ancestors and descendants"""
+        from evolution_graph import EvolutionGraph
+
+        return self.derived(["pokemon"], "evolution_graph", EvolutionGraph)
+
+    def breeding_index(self):
+        """Egg-group bitsets for compatible-partner lookups"""
+        from breeding import BreedingIndex
+
+        return self.derived(
+            ["pokemon"], "breeding_index", lambda data: BreedingIndex(self.pokemon_table())
+        )
+
+    def egg_move_search(self, generation: int = MOVE_GENERATIONS[-1]):
+        """Shortest egg move chain search over a generation's learnsets"""
+        moves_key = MOVES_FILE_TEMPLATE.format(generation=generation)
+        return self.derived(
+            ["pokemon", moves_key],
+            "egg_move_search",
+            lambda pokemon, moves_file: self.breeding_index().egg_move_search(self.moves(generation)),
+        )
+
+    def games(self) -> List[Dict]:
+        data = self.load("games")
+        return data if isinstance(data, list) else []
+
+    def game_matrix(self):
+        """Per-game species bitsets and the dex completion planner"""
+        from game_matrix import GameMatrix
+
+        return self.derived(
+            ["pokemon", "games"],
+            "game_matrix",
+            lambda pokemon, games: GameMatrix(self.pokemon_table(), self.games()),
+        )
+
+    def catch_calculator(self):
+        """Catch probability tables for every species x Poke Ball x status"""
+        from catch_calc import CatchCalculator, POKE_BALL_CATEGORY, moon_stone_species
+
+        def build(*datasets):
+            balls = [item for item in self.items() if item.get("category") == POKE_BALL_CATEGORY]
+            return CatchCalculator(self.pokemon_table(), balls, moon_stone_species(self.evolution_graph()))
+
+        return self.derived(["pokemon", *self.item_category_files()], "catch_calculator", build)
+
+    def abilities(self) -> List[Dict]:
+        data = self.load("abilities")
+        if isinstance(data, dict):
+            return data.get("abilities", [])
+        return data if isinstance(data, list) else []
+
+    def moves_file(self, generation: int) -> Dict:
+        """Return the whole moves file (metadata + moves) for a generation"""
+        data = self.load(MOVES_FILE_TEMPLATE.format(generation=generation))
+        return data if isinstance(data, dict) else {"metadata": {}, "moves": []}
+
+    def moves(self, generation: int) -> List[Dict]:
+        return self.moves_file(generation).get("moves", [])
+
+    def item_category_files(self) -> List[str]:
+        pattern = os.path.join(self.root, ITEMS_CATEGORY_DIR, "*.json")
+        return sorted(
+            os.path.relpath(path, self.root) for path in glob.glob(pattern)
+        )
+
+    def items(self) -> List[Dict]:
+        """Return the items from every category file as one list"""
+        files = self.item_category_files()
+
+        def merge(*category_files):
+            merged = []
+            for data in category_files:
+                if isinstance(data, dict):
+                    merged.extend(data.get("items", []))
+            return merged
+
+        return self.derived(files, "items", merge)
+
+    def all_dataset_keys(self) -> List[str]:
+        """Keys for every dataset (used by structures built from all of them)"""
+        moves = [MOVES_FILE_TEMPLATE.format(generation=g) for g in MOVE_GENERATIONS]
+        return ["pokemon", "abilities", *moves, *self.item_category_files()]
+
+    def search_index(self) -> SearchIndex:
+        """Prefix/fuzzy name search over Pokemon, moves, abilities and items"""
+        return self.derived(
+            self.all_dataset_keys(),
+            "search_index",
+            lambda *datasets: build_search_index(self),
+        )
+
+    def text_index(self) -> FullTextIndex:
+        """BM25 full-text index over move, ability and item descriptions.
+
+        Kept up to date incrementally: only files that changed since the last
+        call are re-indexed.
+        """
+        with self._lock:
+            if self._text_index is None:
+                self._text_index = FullTextIndex()
+            return sync_text_index(self._text_index, self)
+
+
+_store: Optional[DataStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> DataStore:
+    """Return the process-wide DataStore"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = DataStore()
+    return _store
+
+
+if __name__ == "__main__":
+    store = get_store()
+    print(f"Data root: {store.root}")
+    print(f"Pokemon: {len(store.pokemon())}")
+    print(f"Games: {len(store.games())}")
+    print(f"Abilities: {len(store.abilities())}")
+    print(f"Items: {len(store.items())}")
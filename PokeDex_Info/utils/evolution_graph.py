@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Evolution Graph
+One global evolution DAG built from the per-Pokemon evolution lists, with
+species IDs, method edges and precomputed family ID, stage depth, ancestors
+and descendants per node. "All members of this family" and "everything that
+evolves by trade" become dictionary lookups instead of re-walking the JSON.
+"""
+
+import os
+import sys
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils
+from lookup import BASE_FORM, form_key, normalize_dex_number
+
+# Method text prefix -> trigger used by the trigger index
+TRIGGERS = (
+    ("Level", "Level Up"),
+    ("Trade", "Trade"),
+    ("Use ", "Item"),
+    ("Spin", "Item"),
+)
+
+
+def method_trigger(method: str) -> str:
+    """Coarse trigger for a method string ('Level 16' -> 'Level Up', 'Use Fire Stone' -> 'Item')"""
+    method = method or ""
+    if "friendship" in method.lower():
+        return "Friendship"
+    for prefix, trigger in TRIGGERS:
+        if method.startswith(prefix):
+            return trigger
+    return "Other"
+
+
+class EvolutionGraph:
+    """Evolution DAG over species (base forms), keyed by normalized name"""
+
+    def __init__(self, records: Optional[List[Dict]] = None):
+        self.names: List[str] = []
+        self.dex: List[Optional[int]] = []
+        self.ids: Dict[str, int] = {}
+        self.methods: List[str] = []
+        self.method_codes: Dict[str, int] = {}
+        self.edges: List[Tuple[int, int, int]] = []  # (from, to, method code)
+        self.build(records or [])
+
+    def _node(self, name: str, dex: Optional[int] = None) -> int:
+        key = PokeDataUtils.normalize_key(name)
+        node = self.ids.get(key)
+        if node is None:
+            node = self.ids[key] = len(self.names)
+            self.names.append(name)
+            self.dex.append(dex)
+        elif dex is not None and self.dex[node] is None:
+            self.dex[node] = dex
+        return node
+
+    def _method(self, method: str) -> int:
+        if method not in self.method_codes:
+            self.method_codes[method] = len(self.methods)
+            self.methods.append(method)
+        return self.method_codes[method]
+
+    def build(self, records: List[Dict]):
+        """Rebuild direct edges from the flattened evolution lists.
+
+        Entries name their parent in a 'from' field. Data built before that
+        field existed only lists a chain's species in depth-first order,
+        which cannot tell a three-stage line from a branching one, so such
+        entries are skipped unless the list holds a single species (then the
+        parent is the species the list belongs to).
+        """
+        ordered = sorted(
+            (r for r in records if form_key(r) == BASE_FORM),
+            key=lambda r: normalize_dex_number(r.get("number") or r.get("ref_id")) or 0,
+        )
+        for record in ordered:
+            self._node(record.get("name", ""), normalize_dex_number(record.get("number") or record.get("ref_id")))
+
+        seen: Set[Tuple[int, int, str]] = set()
+        skipped: Set[Tuple[int, int]] = set()
+        for record in ordered:
+            evolution = record.get("evolution") or {}
+            source = self._node(evolution.get("name") or record.get("name", ""))
+            entries = evolution.get("evolutions", [])
+            unlinked = {
+                PokeDataUtils.normalize_key(entry.get("name", "")) for entry in entries if not entry.get("from")
+            }
+            for entry in entries:
+                child = self._node(entry.get("name", ""))
+                method = entry.get("method") or ""
+                if entry.get("from"):
+                    parent = self._node(entry["from"])
+                elif len(unlinked) == 1:
+                    parent = source
+                else:
+                    skipped.add((source, child))
+                    continue
+                if (parent, child, method) not in seen:
+                    seen.add((parent, child, method))
+                    self.edges.append((parent, child, self._method(method)))
+        if skipped:
+            print(
+                f"Warning: skipped {len(skipped)} evolution entries without a 'from' field; "
+                "re-run build_evolution_data.py to rebuild the evolution data"
+            )
+        self._index()
+
+    def _index(self):
+        """Family, depth, closures and trigger index from the edge list"""
+        count = len(self.names)
+        self.parents: List[List[int]] = [[] for _ in range(count)]
+        self.children: List[List[int]] = [[] for _ in range(count)]
+        for parent, child, _ in self.edges:
+            if child not in self.children[parent]:
+                self.children[parent].append(child)
+                self.parents[child].append(parent)
+
+        # Topological order (Kahn); stage depth is the longest path from a root
+        remaining = [len(parents) for parents in self.parents]
+        queue = deque(node for node in range(count) if not remaining[node])
+        order = []
+        self.depth = [0] * count
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for child in self.children[node]:
+                self.depth[child] = max(self.depth[child], self.depth[node] + 1)
+                remaining[child] -= 1
+                if not remaining[child]:
+                    queue.append(child)
+
+        self.ancestors: List[frozenset] = [frozenset()] * count
+        self.descendants: List[frozenset] = [frozenset()] * count
+        for node in order:
+            for parent in self.parents[node]:
+                self.ancestors[node] = self.ancestors[node] | self.ancestors[parent] | {parent}
+        for node in reversed(order):
+            for child in self.children[node]:
+                self.descendants[node] = self.descendants[node] | self.descendants[child] | {child}
+
+        # Families are connected components (union-find), numbered by their
+        # first species
+        root = list(range(count))
+
+        def find(node: int) -> int:
+            while root[node] != node:
+                root[node] = root[root[node]]
+                node = root[node]
+            return node
+
+        for parent, child, _ in self.edges:
+            a, b = find(parent), find(child)
+            if a != b:
+                root[max(a, b)] = min(a, b)
+        self.family = [find(node) for node in range(count)]
+        self.families: Dict[int, List[int]] = {}
+        for node, family in enumerate(self.family):
+            self.families.setdefault(family, []).append(node)
+
+        self.by_trigger: Dict[str, List[int]] = {}
+        self.by_method: Dict[str, List[int]] = {}
+        for edge, (_, _, method) in enumerate(self.edges):
+            self.by_trigger.setdefault(method_trigger(self.methods[method]), []).append(edge)
+            self.by_method.setdefault(self.methods[method], []).append(edge)
+
+    def node(self, name: str) -> int:
+        node = self.ids.get(PokeDataUtils.normalize_key(name))
+        if node is None:
+            raise ValueError(f"Unknown Pokemon '{name}'")
+        return node
+
+    def _names(self, nodes) -> List[str]:
+        return [self.names[node] for node in sorted(nodes)]
+
+    def family_members(self, name: str) -> List[str]:
+        return self._names(self.families[self.family[self.node(name)]])
+
+    def ancestors_of(self, name: str) -> List[str]:
+        return self._names(self.ancestors[self.node(name)])
+
+    def descendants_of(self, name: str) -> List[str]:
+        return self._names(self.descendants[self.node(name)])
+
+    def stage(self, name: str) -> int:
+        """0 for unevolved species, 1 for first evolutions, ..."""
+        return self.depth[self.node(name)]
+
+    def evolves_into(self, name: str, other: str) -> bool:
+        return self.node(other) in self.descendants[self.node(name)]
+
+    def _edge_dicts(self, edges: List[int]) -> List[Dict]:
+        return [
+            {
+                "from": self.names[self.edges[e][0]],
+                "to": self.names[self.edges[e][1]],
+                "method": self.methods[self.edges[e][2]],
+            }
+            for e in edges
+        ]
+
+    def evolutions_by_trigger(self, trigger: str) -> List[Dict]:
+        """Evolution steps with a trigger ('Trade', 'Item', 'Level Up', 'Friendship', 'Other')"""
+        return self._edge_dicts(self.by_trigger.get(trigger, []))
+
+    def evolutions_by_method(self, method: str) -> List[Dict]:
+        """Evolution steps with an exact method ('Use Fire Stone')"""
+        return self._edge_dicts(self.by_method.get(method, []))
+
+    # Serialization
+    def to_dict(self) -> Dict:
+        """Compact form: nodes are [name, dex, family, depth], edges are
+        [from, to, method code]; closures are rebuilt on load"""
+        return {
+            "version": 1,
+            "nodes": [
+                [name, dex, family, depth]
+                for name, dex, family, depth in zip(self.names, self.dex, self.family, self.depth)
+            ],
+            "methods": self.methods,
+            "edges": [list(edge) for edge in self.edges],
+            "triggers": {trigger: edges for trigger, edges in sorted(self.by_trigger.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "EvolutionGraph":
+        graph = cls()
+        for name, dex, _, _ in data.get("nodes", []):
+            graph._node(name, dex)
+        for method in data.get("methods", []):
+            graph._method(method)
+        graph.edges = [tuple(edge) for edge in data.get("edges", [])]
+        graph._index()
+        return graph
+
+
+if __name__ == "__main__":
+    from data_store import get_store
+
+    graph = get_store().evolution_graph()
+    name = sys.argv[1] if len(sys.argv) > 1 else "Eevee"
+    print(f"{len(graph.names)} species, {len(graph.edges)} evolution steps, {len(graph.families)} families")
+    try:
+        print(f"{name} (stage {graph.stage(name)}) family: {', '.join(graph.family_members(name))}")
+    except ValueError as e:
+        print(e)
+    for trigger, edges in sorted(graph.by_trigger.items()):
+        print(f"  {trigger}: {len(edges)}")
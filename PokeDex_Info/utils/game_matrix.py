@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Game Availability Matrix
+Species x game availability as one bitset per game (bit = national dex
+number), so "in Sword but not Scarlet" is a single AND NOT. Also plans dex
+completion: a greedy set cover picks the fewest games that together hold a
+target set of species, optionally restricted by platform or generation.
+"""
+
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils
+from lookup import BASE_FORM
+
+GameNames = Union[str, Iterable[str]]
+
+
+class GameMatrix:
+    """Per-game species bitsets over the Pokemon table"""
+
+    def __init__(self, table, games_data: Optional[List[Dict]] = None):
+        self.table = table
+        self.names: Dict[int, str] = {}
+        numbers = table.numeric["number"]
+        for number, name, form in zip(numbers, table.text["name"], table.text["form"]):
+            if np.isnan(number):
+                continue
+            dex = int(number)
+            if form == BASE_FORM or dex not in self.names:
+                self.names[dex] = name
+
+        # Release metadata from pokemon_games.json; release order follows the file
+        self.info: Dict[str, Dict] = {}
+        for generation in games_data or []:
+            for game in generation.get("games", []):
+                self.info[PokeDataUtils.normalize_key(game)] = {
+                    "generation": generation.get("generation"),
+                    "platform": generation.get("platform"),
+                    "order": len(self.info),
+                }
+
+        self.games: List[str] = list(table.labels["games"])
+        self.game_keys = {PokeDataUtils.normalize_key(game): i for i, game in enumerate(self.games)}
+        self.bits: List[int] = []
+        membership = table.sets["games"]
+        valid = ~np.isnan(numbers)
+        for column in range(len(self.games)):
+            bits = 0
+            for dex in np.unique(numbers[valid & membership[:, column]]).astype(int):
+                bits |= 1 << int(dex)
+            self.bits.append(bits)
+        self.all_species = sum(1 << dex for dex in self.names)
+
+    def _column(self, game: str) -> int:
+        column = self.game_keys.get(PokeDataUtils.normalize_key(game))
+        if column is None:
+            raise ValueError(f"Unknown game '{game}'")
+        return column
+
+    def game_info(self, game: str) -> Dict:
+        return self.info.get(PokeDataUtils.normalize_key(game), {})
+
+    def available(self, game: str) -> int:
+        """Bitset of the species available in a game"""
+        return self.bits[self._column(game)]
+
+    def species_bits(self, where: Optional[str] = None) -> int:
+        """Bitset of the species with any row matching a query expression"""
+        if where is None:
+            return self.all_species
+        numbers = self.table.numeric["number"][self.table.rows(where)]
+        return sum(1 << int(dex) for dex in np.unique(numbers[~np.isnan(numbers)]).astype(int))
+
+    def decode(self, bits: int) -> List[str]:
+        """Species names for a bitset, in dex order"""
+        names = []
+        while bits:
+            low = bits & -bits
+            names.append(self.names.get(low.bit_length() - 1, str(low.bit_length() - 1)))
+            bits ^= low
+        return names
+
+    def query_bits(self, all_of: GameNames = (), any_of: GameNames = (), exclude: GameNames = ()) -> int:
+        """Species in every game of all_of, at least one of any_of and none of exclude"""
+        result = self.all_species
+        for game in self._as_list(all_of):
+            result &= self.available(game)
+        any_games = self._as_list(any_of)
+        if any_games:
+            either = 0
+            for game in any_games:
+                either |= self.available(game)
+            result &= either
+        for game in self._as_list(exclude):
+            result &= ~self.available(game)
+        return result
+
+    def query(self, all_of: GameNames = (), any_of: GameNames = (), exclude: GameNames = ()) -> List[str]:
+        """query(all_of="Sword", exclude="Scarlet") -> species in Sword but not Scarlet"""
+        return self.decode(self.query_bits(all_of, any_of, exclude))
+
+    @staticmethod
+    def _as_list(value: GameNames) -> List[str]:
+        if isinstance(value, str):
+            return [value]
+        return list(value)
+
+    def candidate_games(
+        self,
+        platforms: Optional[Sequence[str]] = None,
+        generations: Optional[Sequence[int]] = None,
+        games: Optional[Sequence[str]] = None,
+    ) -> List[int]:
+        """Columns of the games allowed by the platform/generation/game filters"""
+        platform_keys = {PokeDataUtils.normalize_key(p) for p in platforms or []}
+        allowed = {self._column(game) for game in games} if games else None
+        columns = []
+        for column, game in enumerate(self.games):
+            info = self.game_info(game)
+            if allowed is not None and column not in allowed:
+                continue
+            if platform_keys and PokeDataUtils.normalize_key(info.get("platform") or "") not in platform_keys:
+                continue
+            if generations and info.get("generation") not in generations:
+                continue
+            columns.append(column)
+        return columns
+
+    def plan(
+        self,
+        target: Optional[str] = None,
+        platforms: Optional[Sequence[str]] = None,
+        generations: Optional[Sequence[int]] = None,
+        games: Optional[Sequence[str]] = None,
+    ) -> Dict:
+        """Greedy set cover: fewest games that together hold the target species.
+
+        target is a query expression ("gen <= 4"); the whole National Dex by
+        default. Each step takes the game adding the most uncovered species
+        (ties go to the earlier release). Species no allowed game has are
+        reported as missing.
+        """
+        wanted = self.species_bits(target)
+        columns = self.candidate_games(platforms, generations, games)
+        reachable = 0
+        for column in columns:
+            reachable |= self.bits[column]
+        uncovered = wanted & reachable
+
+        steps = []
+        covered = 0
+        while uncovered:
+            best = max(
+                columns,
+                key=lambda c: (
+                    (self.bits[c] & uncovered).bit_count(),
+                    -self.game_info(self.games[c]).get("order", len(self.info)),
+                ),
+            )
+            new = self.bits[best] & uncovered
+            covered |= new
+            uncovered &= ~new
+            steps.append(
+                {
+                    "game": self.games[best],
+                    "new": new.bit_count(),
+                    "cumulative": covered.bit_count(),
+                }
+            )
+
+        missing = wanted & ~covered
+        return {
+            "target": wanted.bit_count(),
+            "covered": covered.bit_count(),
+            "games": steps,
+            "missing": self.decode(missing),
+        }
+
+    # Serialization
+    def to_dict(self) -> Dict:
+        """Per-game dex numbers (delta-encoded) plus dex completion plans
+        overall and per platform"""
+        platforms = sorted({info["platform"] for info in self.info.values() if info.get("platform")})
+        games = {}
+        for game, bits in zip(self.games, self.bits):
+            dexes = [int(dex) for dex in np.flatnonzero(self._bit_array(bits))]
+            games[game] = {
+                **{k: v for k, v in self.game_info(game).items() if k != "order"},
+                "species": [dex - previous for previous, dex in zip([0] + dexes[:-1], dexes)],
+            }
+        return {
+            "version": 1,
+            "encoding": "delta",
+            "games": games,
+            "plans": {
+                "all": self.plan(),
+                **{platform: self.plan(platforms=[platform]) for platform in platforms},
+            },
+        }
+
+    @staticmethod
+    def _bit_array(bits: int) -> np.ndarray:
+        raw = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        return np.unpackbits(np.frombuffer(raw, dtype=np.uint8), bitorder="little").astype(bool)
+
+
+if __name__ == "__main__":
+    import time
+    from data_store import get_store
+
+    matrix = get_store().game_matrix()
+    start = time.perf_counter()
+    plan = matrix.plan()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"National Dex: {plan['covered']}/{plan['target']} species in {len(plan['games'])} games ({elapsed:.1f} ms)")
+    for step in plan["games"]:
+        print(f"  + {step['game']}: {step['new']} new ({step['cumulative']} total)")
+    if plan["missing"]:
+        print(f"  Not in any game: {len(plan['missing'])}")
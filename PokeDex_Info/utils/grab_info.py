@@ -1,90 +1,93 @@
-import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+from data_store import get_store
 
 
 def _load_pokemon_data():
-    """Helper function to load Pokemon data once and reuse it."""
-    import os
+    """Helper function to load Pokemon data once and reuse it.
 
-    data_path = os.path.join(
-        os.path.dirname(__file__), "..", "data", "pokemon_data.json"
-    )
-    with open(data_path, "r") as file:
-        return json.load(file)
+    Served from the process-wide DataStore, so repeated calls don't re-parse
+    the file. Treat the returned records as read-only.
+    """
+    return get_store().pokemon()
 
 
 def _load_games_data():
     """Helper function to load Pokemon games data once and reuse it."""
-    import os
+    return get_store().games()
 
-    data_path = os.path.join(
-        os.path.dirname(__file__), "..", "data", "pokemon_games.json"
+
+def _pokemon_column(field):
+    """Cached list of one field across all Pokemon (rebuilt when the file changes)."""
+    return get_store().derived(
+        ["pokemon"],
+        f"column:{field}",
+        lambda data: [pokemon[field] for pokemon in data],
     )
-    with open(data_path, "r") as file:
-        return json.load(file)
 
 
 def pk_names():
     """Returns a list of all Pokemon names."""
-    data = _load_pokemon_data()
-    return [pokemon["name"] for pokemon in data]
+    return list(_pokemon_column("name"))
 
 
 def pk_nat_numbers():
     """Returns a list of all Pokemon numbers in #0001 format."""
-    data = _load_pokemon_data()
-    return [pokemon["number"] for pokemon in data]
+    return list(_pokemon_column("number"))
 
 
 def pk_abilities():
     """Returns a list of all Pokemon abilities (each item is a list of abilities for that Pokemon)."""
-    data = _load_pokemon_data()
-    return [pokemon["abilities"] for pokemon in data]
+    return list(_pokemon_column("abilities"))
 
 
 def pk_types():
     """Returns a list of all Pokemon types (each item is a list of types for that Pokemon)."""
-    data = _load_pokemon_data()
-    return [pokemon["types"] for pokemon in data]
+    return list(_pokemon_column("types"))
 
 
 def pk_base_stats():
     """Returns a list of all Pokemon base stats (each item is a dict with hp, attack, etc.)."""
-    data = _load_pokemon_data()
-    return [pokemon["base_stats"] for pokemon in data]
+    return list(_pokemon_column("base_stats"))
+
+
+def pokemon_lookup():
+    """Returns the shared name/number/slug/form index over all Pokemon."""
+    return get_store().pokemon_lookup()
 
 
 def get_pokemon_by_name(name):
     """Returns the complete data for a specific Pokemon by name."""
-    data = _load_pokemon_data()
-    for pokemon in data:
-        if pokemon["name"].lower() == name.lower():
-            return pokemon
-    return None
+    return pokemon_lookup().by_name(name)
 
 
 def get_pokemon_by_number(number):
     """Returns the complete data for a specific Pokemon by number (e.g., '#0001' or '1')."""
-    data = _load_pokemon_data()
-    # Handle both '#0001' and '1' formats
-    if isinstance(number, int):
-        number = f"#{number:04d}"
-    elif not number.startswith("#"):
-        number = f"#{int(number):04d}"
-
-    for pokemon in data:
-        if pokemon["number"] == number:
-            return pokemon
-    return None
+    return pokemon_lookup().by_number(number)
+
+
+def get_pokemon_by_slug(slug):
+    """Returns the complete data for a Pokemon by URL slug (e.g., 'mr-mime')."""
+    return pokemon_lookup().by_slug(slug)
+
+
+def get_pokemon_forms(number):
+    """Returns every form sharing a national dex number, base form first."""
+    return pokemon_lookup().forms(number)
 
 
 # Pokemon Games Functions
 def get_all_games():
     """Returns a list of all Pokemon games across all generations."""
-    data = _load_games_data()
-    all_games = []
-    for generation in data:
-        all_games.extend(generation["games"])
-    return all_games
+    return list(
+        get_store().derived(
+            ["games"],
+            "all_games",
+            lambda data: [game for generation in data for game in generation["games"]],
+        )
+    )
 
 
 def get_games_by_generation(gen_number):
@@ -125,15 +128,16 @@ def get_games_by_platform(platform_name):
 
 
 # Game Appearance Functions
-def get_pokemon_in_game(game_name):
-    """Returns all Pokemon available in a specific game with their dex numbers."""
-    data = _load_pokemon_data()
+def _build_pokemon_in_game(data, game_name):
+    lookup = pokemon_lookup()
+    index = get_store().pokemon_index()
     pokemon_in_game = []
 
-    for pokemon in data:
-        if "game_appearances" in pokemon and game_name in pokemon["game_appearances"]:
-            game_data = pokemon["game_appearances"][game_name]
-            if game_data["available"]:
+    # Only visit the Pokemon in the game's posting list instead of scanning all
+    for dex in index.posting("games", game_name):
+        for pokemon in lookup.forms(dex):
+            game_data = pokemon.get("game_appearances", {}).get(game_name)
+            if game_data and game_data["available"]:
                 pokemon_in_game.append(
                     {
                         "name": pokemon["name"],
@@ -148,15 +152,42 @@ def get_pokemon_in_game(game_name):
     )
 
 
-def get_pokemon_game_availability(pokemon_name):
-    """Returns all games where a specific Pokemon appears with dex numbers."""
-    data = _load_pokemon_data()
+def get_pokemon_in_game(game_name):
+    """Returns all Pokemon available in a specific game with their dex numbers."""
+    return list(
+        get_store().derived(
+            ["pokemon"],
+            f"in_game:{game_name}",
+            lambda data: _build_pokemon_in_game(data, game_name),
+        )
+    )
+
 
-    for pokemon in data:
-        if pokemon["name"].lower() == pokemon_name.lower():
-            if "game_appearances" in pokemon:
-                return pokemon["game_appearances"]
+def find_pokemon(**filters):
+    """Returns every Pokemon matching all filters, in national dex order.
 
+    Filters are index fields: types, abilities, hidden_abilities, games,
+    egg_groups and generations. A list means "all of these", e.g.
+    find_pokemon(types=["Fire", "Flying"], abilities="Levitate", games="Scarlet").
+    """
+    lookup = pokemon_lookup()
+    dexes = get_store().pokemon_index().query(**filters)
+    return [lookup.by_number(dex) for dex in dexes]
+
+
+def search_descriptions(query, corpora=None, limit=20):
+    """Returns moves, abilities and items whose descriptions match the query.
+
+    Ranked by BM25, e.g. search_descriptions("raises Speed", corpora=["move"]).
+    """
+    return get_store().text_index().search(query, corpora=corpora, limit=limit)
+
+
+def get_pokemon_game_availability(pokemon_name):
+    """Returns all games where a specific Pokemon appears with dex numbers."""
+    pokemon = pokemon_lookup().by_name(pokemon_name)
+    if pokemon and "game_appearances" in pokemon:
+        return pokemon["game_appearances"]
     return None
 
 
@@ -170,3 +201,4 @@ def count_pokemon_in_game(game_name):
 # print(get_all_games())
 # print(get_games_by_generation(1))
 # print(get_pokemon_in_game("Scarlet")[:5])  # First 5 Pokemon in Scarlet
+# print(search_descriptions("protects from priority"))
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Inverted Indexes
+Posting lists (national dex numbers, sorted ascending) for types, abilities,
+hidden abilities, game availability, egg groups and generation. Multi-filter
+questions like "Fire/Flying with Levitate available in Scarlet" become set
+intersections over a few short lists instead of full scans.
+"""
+
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Union
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils
+from lookup import BASE_FORM, display_label, form_key, normalize_dex_number, pokemon_generation, record_sets
+
+INDEX_FIELDS = (
+    "types",
+    "abilities",
+    "hidden_abilities",
+    "games",
+    "egg_groups",
+    "generations",
+)
+
+FilterValue = Union[str, int, Iterable[Union[str, int]]]
+
+
+def _record_values(record: Dict) -> Dict[str, List]:
+    """Extract the indexed values of one Pokemon record"""
+    generation = pokemon_generation(record)
+    return {**record_sets(record), "generations": [generation] if generation else []}
+
+
+def intersect(postings: List[List[int]]) -> List[int]:
+    """Intersect sorted posting lists, starting from the shortest"""
+    if not postings:
+        return []
+    ordered = sorted(postings, key=len)
+    result = set(ordered[0])
+    for posting in ordered[1:]:
+        result.intersection_update(posting)
+        if not result:
+            return []
+    return sorted(result)
+
+
+def union(postings: List[List[int]]) -> List[int]:
+    """Union of sorted posting lists"""
+    result = set()
+    for posting in postings:
+        result.update(posting)
+    return sorted(result)
+
+
+class PokemonInvertedIndex:
+    """Inverted indexes over Pokemon records keyed by national dex number"""
+
+    def __init__(self, records: Optional[List[Dict]] = None):
+        self.postings: Dict[str, Dict[str, List[int]]] = {f: {} for f in INDEX_FIELDS}
+        self.labels: Dict[str, Dict[str, str]] = {f: {} for f in INDEX_FIELDS}
+        self.names: Dict[int, str] = {}
+        if records:
+            self.build(records)
+
+    @staticmethod
+    def _key(value) -> str:
+        return PokeDataUtils.normalize_key(str(value))
+
+    def build(self, records: List[Dict]):
+        """Index base-form records; other forms fold into their species"""
+        postings = {f: {} for f in INDEX_FIELDS}
+        for record in records:
+            dex = normalize_dex_number(record.get("number") or record.get("ref_id"))
+            if dex is None:
+                continue
+            if form_key(record) == BASE_FORM or dex not in self.names:
+                self.names[dex] = record.get("name", "")
+            for field, values in _record_values(record).items():
+                for value in values:
+                    key = self._key(value)
+                    if not key:
+                        continue
+                    postings[field].setdefault(key, set()).add(dex)
+                    self.labels[field].setdefault(key, display_label(value))
+
+        for field, by_key in postings.items():
+            self.postings[field] = {key: sorted(dexes) for key, dexes in by_key.items()}
+
+    def values(self, field: str) -> List[str]:
+        """Return the display labels indexed for a field"""
+        return sorted(self.labels[field].values())
+
+    def posting(self, field: str, value) -> List[int]:
+        """Return the sorted dex numbers for one field value"""
+        if field not in self.postings:
+            raise ValueError(f"Unknown index field '{field}'. Choose from {INDEX_FIELDS}")
+        return self.postings[field].get(self._key(value), [])
+
+    def query(
+        self,
+        exclude: Optional[Dict[str, FilterValue]] = None,
+        any_of: Optional[Dict[str, FilterValue]] = None,
+        **filters: FilterValue,
+    ) -> List[int]:
+        """Return dex numbers matching every filter.
+
+        Each keyword is an index field; a list value means "all of these"
+        (types=["Fire", "Flying"] is Fire/Flying). any_of matches at least one
+        value per field and exclude removes matches, e.g.
+        query(types=["Fire", "Flying"], abilities="Levitate", games="Scarlet").
+        """
+        postings = []
+        for field, value in filters.items():
+            for item in self._as_list(value):
+                postings.append(self.posting(field, item))
+        for field, value in (any_of or {}).items():
+            postings.append(union([self.posting(field, item) for item in self._as_list(value)]))
+
+        if postings:
+            result = intersect(postings)
+        else:
+            result = sorted(self.names)
+
+        for field, value in (exclude or {}).items():
+            excluded = set(union([self.posting(field, item) for item in self._as_list(value)]))
+            result = [dex for dex in result if dex not in excluded]
+        return result
+
+    @staticmethod
+    def _as_list(value: FilterValue) -> List:
+        if isinstance(value, (str, int)):
+            return [value]
+        return list(value)
+
+    # Serialization
+    def to_dict(self) -> Dict:
+        """Compact form: posting lists are delta-encoded (gaps between dex numbers)"""
+        fields = {}
+        for field, by_key in self.postings.items():
+            fields[field] = {
+                self.labels[field][key]: [
+                    dex - previous for previous, dex in zip([0] + dexes[:-1], dexes)
+                ]
+                for key, dexes in sorted(by_key.items())
+            }
+        return {
+            "version": 1,
+            "encoding": "delta",
+            "names": {str(dex): name for dex, name in sorted(self.names.items())},
+            "fields": fields,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PokemonInvertedIndex":
+        index = cls()
+        index.names = {int(dex): name for dex, name in data.get("names", {}).items()}
+        for field, by_label in data.get("fields", {}).items():
+            for label, gaps in by_label.items():
+                dexes, total = [], 0
+                for gap in gaps:
+                    total += gap
+                    dexes.append(total)
+                key = cls._key(label)
+                index.postings.setdefault(field, {})[key] = dexes
+                index.labels.setdefault(field, {})[key] = label
+        return index
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Learnset Indexes
+Each move's learners are stored as a bitset (a Python int) over a global
+species/form ID space shared by every generation, overall and per learn
+method. "Which Pokemon learn Stealth Rock AND U-turn AND NOT Knock Off"
+becomes a few integer ANDs instead of intersecting lists of dicts.
+The same learnsets are also normalized into one integer-coded table
+(species, form, move, generation, method, level) with a per-Pokemon
+inverted view: moves by generation and method, level-sorted.
+"""
+
+import base64
+import os
+import sys
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils, MOVE_GENERATIONS
+from lookup import normalize_dex_number
+from team_coverage import learner_name
+
+BASE_FORM = "Normal"
+NO_LEVEL = -1
+MoveNames = Union[str, Iterable[str]]
+
+
+def learner_key(learner: Dict) -> Tuple[int, str]:
+    """(dex number, form) identifying a species/form across generations"""
+    return normalize_dex_number(learner.get("dex_number")) or 0, learner.get("form") or BASE_FORM
+
+
+class LearnerSpace:
+    """Global species/form ID space: IDs follow dex order, base form first"""
+
+    def __init__(self, learners: Dict[Tuple[int, str], str]):
+        self.keys = sorted(learners, key=lambda key: (key[0], key[1] != BASE_FORM, key[1]))
+        self.names = [learners[key] for key in self.keys]
+        self.ids = {key: i for i, key in enumerate(self.keys)}
+        self.name_ids = {PokeDataUtils.normalize_key(name): i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def from_moves(cls, move_lists: Iterable[List[Dict]]) -> "LearnerSpace":
+        learners: Dict[Tuple[int, str], str] = {}
+        for moves in move_lists:
+            for move in moves:
+                for learner in move.get("learned_by", []):
+                    learners.setdefault(learner_key(learner), learner_name(learner))
+        return cls(learners)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def id_of(self, name: str) -> Optional[int]:
+        return self.name_ids.get(PokeDataUtils.normalize_key(name))
+
+    def decode(self, bits: int) -> List[str]:
+        """Names of the learners set in a bitset, in ID order"""
+        names = []
+        while bits:
+            low = bits & -bits
+            names.append(self.names[low.bit_length() - 1])
+            bits ^= low
+        return names
+
+
+def encode_bits(bits: int) -> str:
+    """Bitset -> zlib-compressed base64 text"""
+    raw = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    return base64.b64encode(zlib.compress(raw)).decode("ascii")
+
+
+def decode_bits(text: str) -> int:
+    return int.from_bytes(zlib.decompress(base64.b64decode(text)), "little")
+
+
+class MoveLearnerIndex:
+    """Per-move learner bitsets (overall and by method) for one generation"""
+
+    def __init__(self, space: LearnerSpace, moves: Optional[List[Dict]] = None, generation: Optional[int] = None):
+        self.space = space
+        self.generation = generation
+        self.move_names: Dict[str, str] = {}
+        self.bits: Dict[str, int] = {}
+        self.method_bits: Dict[str, Dict[str, int]] = {}
+        if moves:
+            self.build(moves)
+
+    @staticmethod
+    def _key(value: str) -> str:
+        return PokeDataUtils.normalize_key(value)
+
+    def build(self, moves: List[Dict]):
+        for move in moves:
+            key = self._key(move.get("name", ""))
+            if not key:
+                continue
+            self.move_names.setdefault(key, move["name"])
+            for learner in move.get("learned_by", []):
+                bit = 1 << self.space.ids[learner_key(learner)]
+                self.bits[key] = self.bits.get(key, 0) | bit
+                methods = self.method_bits.setdefault(key, {})
+                method = learner.get("method") or "Unknown"
+                methods[method] = methods.get(method, 0) | bit
+
+    def methods(self) -> List[str]:
+        return sorted({method for by_method in self.method_bits.values() for method in by_method})
+
+    def learners(self, move: str, method: Optional[str] = None) -> int:
+        """Bitset of the Pokemon that learn a move (by one method, if given)"""
+        key = self._key(move)
+        if key not in self.move_names:
+            raise ValueError(f"Unknown move '{move}'")
+        if method is None:
+            return self.bits.get(key, 0)
+        return self.method_bits.get(key, {}).get(method, 0)
+
+    def can_learn(self, pokemon: str, move: str, method: Optional[str] = None) -> bool:
+        learner_id = self.space.id_of(pokemon)
+        return learner_id is not None and bool(self.learners(move, method) >> learner_id & 1)
+
+    def query_bits(
+        self,
+        all_of: MoveNames = (),
+        any_of: MoveNames = (),
+        exclude: MoveNames = (),
+        method: Optional[str] = None,
+    ) -> int:
+        """Bitset of Pokemon that learn every move in all_of, at least one
+        move in any_of and none of the moves in exclude"""
+        result = (1 << len(self.space)) - 1
+        for move in self._as_list(all_of):
+            result &= self.learners(move, method)
+        any_moves = self._as_list(any_of)
+        if any_moves:
+            either = 0
+            for move in any_moves:
+                either |= self.learners(move, method)
+            result &= either
+        for move in self._as_list(exclude):
+            result &= ~self.learners(move, method)
+        return result
+
+    def query(self, all_of: MoveNames = (), any_of: MoveNames = (), exclude: MoveNames = (), method: Optional[str] = None) -> List[str]:
+        """Names of the Pokemon matching query_bits, in dex order"""
+        return self.space.decode(self.query_bits(all_of, any_of, exclude, method))
+
+    @staticmethod
+    def _as_list(value: MoveNames) -> List[str]:
+        if isinstance(value, str):
+            return [value]
+        return list(value)
+
+    # Serialization
+    def to_dict(self) -> Dict:
+        """Compact form: bitsets are zlib-compressed little-endian bytes in base64"""
+        return {
+            "version": 1,
+            "generation": self.generation,
+            "encoding": "zlib-base64",
+            "learners": [[dex, form, name] for (dex, form), name in zip(self.space.keys, self.space.names)],
+            "moves": {
+                self.move_names[key]: {
+                    "all": encode_bits(self.bits.get(key, 0)),
+                    "methods": {
+                        method: encode_bits(bits)
+                        for method, bits in sorted(self.method_bits.get(key, {}).items())
+                    },
+                }
+                for key in sorted(self.move_names)
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "MoveLearnerIndex":
+        space = LearnerSpace({(dex, form): name for dex, form, name in data.get("learners", [])})
+        index = cls(space, generation=data.get("generation"))
+        for name, entry in data.get("moves", {}).items():
+            key = cls._key(name)
+            index.move_names[key] = name
+            index.bits[key] = decode_bits(entry["all"])
+            index.method_bits[key] = {
+                method: decode_bits(text) for method, text in entry.get("methods", {}).items()
+            }
+        return index
+
+
+class LearnsetTable:
+    """Every (species/form, move, generation, method, level) row as integer columns.
+
+    learner indexes the LearnerSpace; species and form are the learner's dex
+    number and a code into forms; move and method are codes into moves and
+    methods; level is NO_LEVEL when the method has none.
+    """
+
+    COLUMNS = ("species", "form", "move", "generation", "method", "level")
+
+    def __init__(self, space: LearnerSpace, moves_by_generation: Dict[int, List[Dict]]):
+        self.space = space
+        self.forms = sorted({form for _, form in space.keys}, key=lambda form: (form != BASE_FORM, form))
+        form_codes = {form: i for i, form in enumerate(self.forms)}
+        self.moves: List[str] = []
+        self.methods: List[str] = []
+        move_codes: Dict[str, int] = {}
+        method_codes: Dict[str, int] = {}
+
+        learners, moves, generations, methods, levels = [], [], [], [], []
+        for generation, move_list in sorted(moves_by_generation.items()):
+            for move in move_list:
+                key = PokeDataUtils.normalize_key(move.get("name", ""))
+                if not key:
+                    continue
+                if key not in move_codes:
+                    move_codes[key] = len(self.moves)
+                    self.moves.append(move["name"])
+                move_code = move_codes[key]
+                for learner in move.get("learned_by", []):
+                    method = learner.get("method") or "Unknown"
+                    if method not in method_codes:
+                        method_codes[method] = len(self.methods)
+                        self.methods.append(method)
+                    learners.append(space.ids[learner_key(learner)])
+                    moves.append(move_code)
+                    generations.append(generation)
+                    methods.append(method_codes[method])
+                    level = learner.get("level")
+                    levels.append(level if isinstance(level, int) else NO_LEVEL)
+
+        self.learner = np.array(learners, dtype=np.int32)
+        self.move = np.array(moves, dtype=np.int32)
+        self.generation = np.array(generations, dtype=np.int8)
+        self.method = np.array(methods, dtype=np.int8)
+        self.level = np.array(levels, dtype=np.int16)
+        learner_species = np.array([dex for dex, _ in space.keys] or [0], dtype=np.int32)
+        learner_forms = np.array([form_codes[form] for _, form in space.keys] or [0], dtype=np.int16)
+        self.species = learner_species[self.learner]
+        self.form = learner_forms[self.learner]
+
+        # Rows grouped by learner, then generation, method, level and move name
+        # (learner_slice and the inverted index read contiguous runs)
+        move_order = np.argsort(np.argsort(np.array([m.casefold() for m in self.moves] or [""])))
+        self._order = np.lexsort((move_order[self.move] if len(self.move) else self.move,
+                                  self.level, self.method, self.generation, self.learner))
+        self._starts = np.searchsorted(self.learner[self._order], np.arange(len(space) + 1))
+
+    def __len__(self) -> int:
+        return len(self.learner)
+
+    def learner_rows(self, name: str) -> np.ndarray:
+        """Row indices of one species/form, in inverted-index order"""
+        learner_id = self.space.id_of(name)
+        if learner_id is None:
+            raise ValueError(f"Unknown Pokemon '{name}'")
+        return self._order[self._starts[learner_id]:self._starts[learner_id + 1]]
+
+    def learnset(self, name: str) -> Dict[str, Dict[str, List]]:
+        """generation -> method -> [[move, level], ...] for one species/form"""
+        learnset: Dict[str, Dict[str, List]] = {}
+        for row in self.learner_rows(name):
+            level = int(self.level[row])
+            learnset.setdefault(str(int(self.generation[row])), {}).setdefault(
+                self.methods[self.method[row]], []
+            ).append([self.moves[self.move[row]], level if level != NO_LEVEL else None])
+        return learnset
+
+    def learner_slices(self):
+        """(learner id, name, learnset) for every species/form with moves"""
+        for learner_id, name in enumerate(self.space.names):
+            if self._starts[learner_id + 1] > self._starts[learner_id]:
+                yield learner_id, name, self.learnset(name)
+
+    # Serialization
+    def to_dict(self) -> Dict:
+        """Compact columnar form; string columns are codes into the vocab lists"""
+        return {
+            "version": 1,
+            "columns": list(self.COLUMNS),
+            "forms": self.forms,
+            "moves": self.moves,
+            "methods": self.methods,
+            "rows": {
+                column: getattr(self, column)[self._order].tolist() for column in self.COLUMNS
+            },
+        }
+
+
+def learner_indexes(store) -> Dict[int, MoveLearnerIndex]:
+    """One MoveLearnerIndex per generation over the store's shared LearnerSpace"""
+    space = store.learner_space()
+    return {
+        generation: MoveLearnerIndex(space, store.moves(generation), generation)
+        for generation in MOVE_GENERATIONS
+    }
+
+
+def learnset_table(store) -> LearnsetTable:
+    return LearnsetTable(
+        store.learner_space(),
+        {generation: store.moves(generation) for generation in MOVE_GENERATIONS},
+    )
+
+
+if __name__ == "__main__":
+    import time
+    from data_store import get_store
+
+    generation = MOVE_GENERATIONS[-1]
+    index = get_store().move_learners(generation)
+    moves = sys.argv[1:] or list(index.move_names.values())[:3]
+    index.query(all_of=moves)
+    start = time.perf_counter()
+    matches = index.query(all_of=moves)
+    elapsed = (time.perf_counter() - start) * 1e6
+    print(f"Gen {generation}: {len(index.space)} species/forms, {len(index.move_names)} moves")
+    print(f"Learn all of {', '.join(moves)}: {len(matches)} ({elapsed:.0f} µs)")
+    for name in matches[:20]:
+        print(f"  {name}")
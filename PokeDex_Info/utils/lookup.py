@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Lookup Indexes
+Hash indexes over Pokemon records by name, national dex number, slug and form.
+Built once per dataset and kept in sync as records are added or replaced, so
+lookups are O(1) instead of a linear scan over every Pokemon.
+"""
+
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Union
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils, generation_for_dex_number
+
+BASE_FORM = "00"
+
+
+def normalize_dex_number(number: Union[int, str, None]) -> Optional[int]:
+    """Normalize '#0001', '0001', '1', 1 or '0001-00' to the integer 1"""
+    if number is None or isinstance(number, bool):
+        return None
+    if isinstance(number, int):
+        return number
+    match = re.match(r"\s*#?\s*(\d+)", str(number))
+    return int(match.group(1)) if match else None
+
+
+def form_key(record: Dict) -> str:
+    """Return the form suffix of a record ('0026-01' -> '01'); base forms are '00'"""
+    ref_id = record.get("ref_id") or ""
+    if "-" in ref_id:
+        return ref_id.split("-", 1)[1]
+    return BASE_FORM
+
+
+def pokemon_generation(record: Dict) -> Optional[int]:
+    """Return a record's generation, derived from its dex number when not stored"""
+    generation = record.get("generation")
+    if generation:
+        return int(generation)
+    return generation_for_dex_number(
+        normalize_dex_number(record.get("number") or record.get("ref_id"))
+    )
+
+
+def record_sets(record: Dict) -> Dict[str, List]:
+    """The multi-valued fields of a record (types, abilities, games, ...) as lists"""
+    abilities_info = record.get("abilities_info") or {}
+    hidden = abilities_info.get("hidden")
+    return {
+        "types": record.get("types") or [],
+        "abilities": abilities_info.get("normal") or record.get("abilities") or [],
+        "hidden_abilities": [hidden] if hidden else [],
+        "games": [
+            game
+            for game, info in (record.get("game_appearances") or {}).items()
+            if isinstance(info, dict) and info.get("available")
+        ],
+        "egg_groups": (record.get("breeding_info") or {}).get("egg_groups") or [],
+    }
+
+
+def display_label(value) -> str:
+    """Turn slug-style values ('thick-fat') into display labels ('Thick Fat')"""
+    label = str(value)
+    if label.islower() and "-" in label:
+        return label.replace("-", " ").title()
+    return label
+
+
+class PokemonLookup:
+    """Hash indexes over a list of Pokemon records.
+
+    The lookup keeps a reference to the list it was built from; use add(),
+    replace() and reindex() to change records so the indexes stay in sync.
+    """
+
+    def __init__(self, records: Optional[List[Dict]] = None):
+        self.records: List[Dict] = records if records is not None else []
+        # Records sharing a name/slug (forms), in list order; the first wins
+        self._by_name: Dict[str, List[Dict]] = {}
+        self._by_slug: Dict[str, List[Dict]] = {}
+        self._by_ref_id: Dict[str, Dict] = {}
+        self._by_number: Dict[int, Dict[str, Dict]] = {}
+        self._positions: Dict[int, int] = {}
+        self._keys: Dict[int, tuple] = {}
+
+        for position, record in enumerate(self.records):
+            self._index(record, position)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _insert(self, index: Dict[str, List[Dict]], key: str, record: Dict, position: int):
+        records = index.setdefault(key, [])
+        at = len(records)
+        while at and self._positions[id(records[at - 1])] > position:
+            at -= 1
+        records.insert(at, record)
+
+    @staticmethod
+    def _remove(index: Dict[str, List[Dict]], key: str, record: Dict):
+        records = index.get(key)
+        if not records:
+            return
+        records[:] = [other for other in records if other is not record]
+        if not records:
+            del index[key]
+
+    def _index(self, record: Dict, position: int):
+        name = record.get("name") or ""
+        name_key = name.casefold()
+        slug = PokeDataUtils.normalize_key(name)
+        ref_id = record.get("ref_id")
+        number = normalize_dex_number(record.get("number") or ref_id)
+        form = form_key(record)
+
+        self._positions[id(record)] = position
+        if name_key:
+            self._insert(self._by_name, name_key, record, position)
+        if slug:
+            self._insert(self._by_slug, slug, record, position)
+        if ref_id:
+            self._by_ref_id[ref_id] = record
+        if number is not None:
+            self._by_number.setdefault(number, {})[form] = record
+
+        self._keys[id(record)] = (name_key, slug, ref_id, number, form)
+
+    def _unindex(self, record: Dict):
+        keys = self._keys.pop(id(record), None)
+        self._positions.pop(id(record), None)
+        if keys is None:
+            return
+        name_key, slug, ref_id, number, form = keys
+        self._remove(self._by_name, name_key, record)
+        self._remove(self._by_slug, slug, record)
+        if ref_id and self._by_ref_id.get(ref_id) is record:
+            del self._by_ref_id[ref_id]
+        forms = self._by_number.get(number)
+        if forms and forms.get(form) is record:
+            del forms[form]
+            if not forms:
+                del self._by_number[number]
+
+    # Maintenance
+    def add(self, record: Dict):
+        """Append a new record to the underlying list and index it"""
+        self.records.append(record)
+        self._index(record, len(self.records) - 1)
+
+    def replace(self, old: Dict, new: Dict):
+        """Swap a record for a new one in place, updating every index"""
+        position = self._positions.get(id(old))
+        if position is None:
+            self.add(new)
+            return
+        self._unindex(old)
+        self.records[position] = new
+        self._index(new, position)
+
+    def reindex(self, record: Dict):
+        """Refresh the index keys of a record whose name/number was edited in place"""
+        position = self._positions.get(id(record))
+        if position is None:
+            return
+        self._unindex(record)
+        self._index(record, position)
+
+    # Lookups
+    def by_name(self, name: str) -> Optional[Dict]:
+        """Case-insensitive exact name lookup ('bulbasaur' -> Bulbasaur)"""
+        records = self._by_name.get(name.casefold()) if name else None
+        return records[0] if records else None
+
+    def by_slug(self, slug: str) -> Optional[Dict]:
+        """Punctuation-insensitive lookup ('mr-mime', 'mrmime' -> Mr. Mime)"""
+        records = self._by_slug.get(PokeDataUtils.normalize_key(slug)) if slug else None
+        return records[0] if records else None
+
+    def by_ref_id(self, ref_id: str) -> Optional[Dict]:
+        return self._by_ref_id.get(ref_id)
+
+    def by_number(self, number: Union[int, str], form: str = BASE_FORM) -> Optional[Dict]:
+        """Lookup by national dex number ('#0001', '1' or 1); base form by default"""
+        forms = self._by_number.get(normalize_dex_number(number))
+        if not forms:
+            return None
+        return forms.get(form) or next(iter(forms.values()))
+
+    def forms(self, number: Union[int, str]) -> List[Dict]:
+        """Return every form sharing a national dex number, base form first"""
+        forms = self._by_number.get(normalize_dex_number(number), {})
+        return [forms[key] for key in sorted(forms)]
+
+    def position(self, record: Dict) -> Optional[int]:
+        """Return the index of a record in the underlying list"""
+        return self._positions.get(id(record))
+
+    def find(self, query: Union[int, str]) -> Optional[Dict]:
+        """Resolve a name, slug, ref_id or dex number to a record"""
+        if isinstance(query, int):
+            return self.by_number(query)
+        return (
+            self.by_name(query)
+            or self.by_ref_id(query)
+            or self.by_slug(query)
+            or (self.by_number(query) if normalize_dex_number(query) is not None else None)
+        )
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Move Recommender
+Ranks the damaging moves each species can learn in a generation. One NumPy
+pass scores the whole species x move matrix from power x accuracy, STAB, the
+attacking stat the move uses, coverage (how many species the move's type
+hits super effectively that the user's own types do not) and priority;
+the top k per species are extracted with argpartition.
+"""
+
+import os
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils, MOVE_GENERATIONS
+from type_chart import TYPE_INDEX, DefensiveMatchups
+from team_coverage import learner_name
+
+TOP_K = 10
+STAB_MULTIPLIER = 1.5
+# Score multiplier per unit of extra coverage (fraction of all species) and
+# per priority level
+COVERAGE_WEIGHT = 1.0
+PRIORITY_WEIGHT = 0.25
+
+
+class MoveRecommender:
+    """Species x move score matrix for one generation's learnsets"""
+
+    def __init__(self, matchups: DefensiveMatchups, moves: List[Dict], generation: Optional[int] = None):
+        self.matchups = matchups
+        self.table = matchups.table
+        self.generation = generation
+        self.names: List[str] = self.table.text["name"].tolist()
+        self.rows = {PokeDataUtils.normalize_key(name): row for row, name in enumerate(self.names)}
+
+        self.moves = [
+            move
+            for move in moves
+            if move.get("category") in ("Physical", "Special")
+            and isinstance(move.get("base_power"), (int, float))
+            and move["base_power"] > 0
+            and PokeDataUtils.normalize_key(move.get("battle_type") or "") in TYPE_INDEX
+        ]
+        self.move_names = [move.get("name", "") for move in self.moves]
+        self.power = np.array([move["base_power"] for move in self.moves], dtype=float)
+        # Moves without an accuracy never miss
+        self.accuracy = np.array([move.get("accuracy") or 100 for move in self.moves], dtype=float) / 100
+        self.move_types = np.array(
+            [TYPE_INDEX[PokeDataUtils.normalize_key(move["battle_type"])] for move in self.moves], dtype=int
+        )
+        self.physical = np.array([move.get("category") == "Physical" for move in self.moves], dtype=bool)
+        self.priority = np.array([move.get("speed_priority") or 0 for move in self.moves], dtype=float)
+
+        self.learnable = np.zeros((len(self.names), len(self.moves)), dtype=bool)
+        rows, columns = [], []
+        for column, move in enumerate(self.moves):
+            for learner in move.get("learned_by", []):
+                row = self.rows.get(PokeDataUtils.normalize_key(learner_name(learner)))
+                if row is not None:
+                    rows.append(row)
+                    columns.append(column)
+        self.learnable[rows, columns] = True
+        self.scores, self.stab, self.coverage = self._score()
+
+    def _score(self):
+        """(species, move) scores plus the STAB and coverage components"""
+        own_types = self.matchups.type_members  # (species, type)
+        super_effective = (self.matchups.multipliers > 1).astype(float)  # (defender, type)
+        defenders = max(len(super_effective), 1)
+        # Defenders each species already hits super effectively with its own types
+        stab_hits = own_types.astype(float) @ super_effective.T > 0  # (species, defender)
+        extra = (~stab_hits).astype(float) @ super_effective / defenders  # (species, type)
+
+        stab = own_types[:, self.move_types]  # (species, move)
+        coverage = extra[:, self.move_types]
+        attack = np.nan_to_num(self.table.numeric["base_stats.attack"], nan=1.0)
+        sp_attack = np.nan_to_num(self.table.numeric["base_stats.sp_attack"], nan=1.0)
+        best = np.maximum(np.maximum(attack, sp_attack), 1.0)
+        stat_factor = np.where(self.physical[None, :], attack[:, None], sp_attack[:, None]) / best[:, None]
+
+        scores = (
+            (self.power * self.accuracy)[None, :]
+            * np.where(stab, STAB_MULTIPLIER, 1.0)
+            * stat_factor
+            * (1 + COVERAGE_WEIGHT * coverage)
+            * (1 + PRIORITY_WEIGHT * np.maximum(self.priority, 0))[None, :]
+        )
+        return np.where(self.learnable, scores, -np.inf), stab, coverage
+
+    def top_moves(self, k: int = TOP_K) -> np.ndarray:
+        """(species, k) move columns, best first; -1 pads species with fewer moves"""
+        k = min(k, len(self.moves))
+        if k == 0:
+            return np.empty((len(self.names), 0), dtype=int)
+        top = np.argpartition(-self.scores, k - 1, axis=1)[:, :k]
+        # Best first, ties in move order (same as recommend)
+        order = np.lexsort((top, -np.take_along_axis(self.scores, top, axis=1)))
+        top = np.take_along_axis(top, order, axis=1)
+        return np.where(np.isfinite(np.take_along_axis(self.scores, top, axis=1)), top, -1)
+
+    def _entry(self, row: int, column: int) -> Dict:
+        move = self.moves[column]
+        return {
+            "move": self.move_names[column],
+            "type": move.get("battle_type"),
+            "category": move.get("category"),
+            "power": move.get("base_power"),
+            "accuracy": move.get("accuracy"),
+            "priority": int(self.priority[column]),
+            "score": round(float(self.scores[row, column]), 1),
+            "stab": bool(self.stab[row, column]),
+            "coverage": round(float(self.coverage[row, column]) * 100, 1),
+        }
+
+    def recommend(self, name: str, k: int = TOP_K) -> List[Dict]:
+        """Best k learnable damaging moves for one Pokemon"""
+        row = self.rows.get(PokeDataUtils.normalize_key(name))
+        if row is None:
+            raise ValueError(f"Unknown Pokemon '{name}'")
+        order = np.argsort(-self.scores[row], kind="stable")[:k]
+        return [self._entry(row, int(column)) for column in order if np.isfinite(self.scores[row, column])]
+
+    def recommendations(self, k: int = TOP_K) -> Dict[str, List[List]]:
+        """name -> [[move, type, category, power, accuracy, priority, score, stab, coverage %]]
+        for every species with at least one learnable damaging move"""
+        result = {}
+        for row, columns in enumerate(self.top_moves(k)):
+            entries = [self._entry(row, int(column)) for column in columns if column >= 0]
+            if entries:
+                result[self.names[row]] = [list(entry.values()) for entry in entries]
+        return result
+
+
+def recommendation_slices(recommenders: Dict[int, MoveRecommender], k: int = TOP_K) -> Dict[str, Dict]:
+    """Per-Pokemon slices across generations: name -> {generation: entries}"""
+    slices: Dict[str, Dict] = {}
+    for generation, recommender in sorted(recommenders.items()):
+        for name, entries in recommender.recommendations(k).items():
+            slices.setdefault(name, {})[str(generation)] = entries
+    return slices
+
+
+if __name__ == "__main__":
+    import time
+    from data_store import get_store
+
+    store = get_store()
+    generation = MOVE_GENERATIONS[-1]
+    start = time.perf_counter()
+    recommender = store.move_recommender(generation)
+    top = recommender.top_moves()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(
+        f"Gen {generation}: {len(recommender.names)} species x {len(recommender.moves)} damaging moves "
+        f"scored in {elapsed:.0f} ms"
+    )
+    names = sys.argv[1:] or [recommender.names[row] for row in np.flatnonzero(top[:, 0] >= 0)[:3]]
+    for name in names:
+        print(f"{name}:")
+        for entry in recommender.recommend(name, 5):
+            flags = " STAB" if entry["stab"] else ""
+            print(
+                f"  {entry['move']:<16} {entry['type']:<9} {entry['score']:>7.1f}{flags}"
+                f"  +{entry['coverage']:.1f}% coverage"
+            )
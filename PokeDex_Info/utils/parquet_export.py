@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Parquet Export
+Flattens the Pokemon, moves (every generation), learnsets and item category
+datasets into typed columnar Parquet datasets under data/parquet/:
+
+    pokemon/generation=N/     one row per Pokemon form
+    moves/generation=N/       one row per move
+    learnsets/generation=N/   one row per (move, learner)
+    items/category=.../       one row per item
+
+Repeated strings (types, categories, methods, learner names) are
+dictionary-encoded, and the hive-style partitions let readers skip whole
+generations or categories. read_dataset() loads only the requested columns
+and partitions, e.g. just base stats or just Gen 9 learnsets.
+
+Requires pyarrow (optional: pip install pyarrow).
+"""
+
+import os
+import shutil
+import sys
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pads
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pads = pq = None
+
+sys.path.append(os.path.dirname(__file__))
+from config import MOVE_GENERATIONS, PARQUET_DATA_DIR
+from lookup import normalize_dex_number, record_sets
+from query_engine import PokemonTable
+
+# Dataset -> (partition column, its type when read back)
+PARTITIONS = {
+    "pokemon": ("generation", "int8"),
+    "moves": ("generation", "int8"),
+    "learnsets": ("generation", "int8"),
+    "items": ("category", "string"),
+}
+# PokemonTable numeric column -> (Parquet column, integer type or None for float)
+POKEMON_NUMERIC = {
+    "number": ("number", "int16"),
+    "generation": ("generation", "int8"),
+    "base_stats.hp": ("hp", "int16"),
+    "base_stats.attack": ("attack", "int16"),
+    "base_stats.defense": ("defense", "int16"),
+    "base_stats.sp_attack": ("sp_attack", "int16"),
+    "base_stats.sp_defense": ("sp_defense", "int16"),
+    "base_stats.speed": ("speed", "int16"),
+    "base_stats.total": ("total", "int16"),
+    "game_mechanics.catch_rate": ("catch_rate", "int16"),
+    "game_mechanics.base_exp": ("base_exp", "int16"),
+    "physical_info.weight_kilograms": ("weight_kilograms", None),
+    "breeding_info.egg_cycles": ("egg_cycles", "int16"),
+    "breeding_info.base_friendship": ("base_friendship", "int16"),
+}
+STAT_COLUMNS = ["name", "form", "hp", "attack", "defense", "sp_attack", "sp_defense", "speed", "total"]
+COMPRESSION = "zstd"
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Parquet export needs pyarrow: pip install pyarrow")
+
+
+def _dictionary():
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def _as_int(value) -> Optional[int]:
+    """Integer from scraped values (80, 80.0, '80'); None for '--' and the like"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value == value else None
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
+
+
+def _text(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def pokemon_table(records: List[Dict], table: Optional[PokemonTable] = None) -> "pa.Table":
+    """One row per Pokemon record; `table` is the PokemonTable of the same records"""
+    _require_pyarrow()
+    table = table if table is not None else PokemonTable(records)
+    columns = {
+        "ref_id": pa.array(table.text["ref_id"].tolist(), pa.string()),
+        "name": pa.array(table.text["name"].tolist(), pa.string()),
+        "form": pa.array(table.text["form"].tolist(), _dictionary()),
+    }
+    for source, (name, integer) in POKEMON_NUMERIC.items():
+        values = table.numeric[source]
+        array = pa.array(values, mask=np.isnan(values))
+        columns[name] = array.cast(integer or pa.float32())
+
+    sets = [record_sets(record) for record in records]
+    types = [row["types"] for row in sets]
+    columns["type_1"] = pa.array([t[0] if t else None for t in types], _dictionary())
+    columns["type_2"] = pa.array([t[1] if len(t) > 1 else None for t in types], _dictionary())
+    for name in ("abilities", "hidden_abilities", "egg_groups", "games"):
+        columns[name] = pa.array([row[name] for row in sets], pa.list_(_dictionary()))
+    columns["species"] = pa.array(
+        [_text((record.get("physical_info") or {}).get("species")) for record in records], pa.string()
+    )
+    columns["growth_rate"] = pa.array(
+        [_text((record.get("game_mechanics") or {}).get("growth_rate")) for record in records], _dictionary()
+    )
+    return pa.table(columns)
+
+
+def moves_table(generation: int, moves: List[Dict]) -> "pa.Table":
+    """One row per move of a generation (learners are in learnsets_table)"""
+    _require_pyarrow()
+    return pa.table({
+        "generation": pa.array([generation] * len(moves), pa.int8()),
+        "name": pa.array([_text(move.get("name")) for move in moves], pa.string()),
+        "type": pa.array([_text(move.get("battle_type")) for move in moves], _dictionary()),
+        "category": pa.array([_text(move.get("category")) for move in moves], _dictionary()),
+        "power_points": pa.array([_as_int(move.get("power_points")) for move in moves], pa.int8()),
+        "base_power": pa.array([_as_int(move.get("base_power")) for move in moves], pa.int16()),
+        "accuracy": pa.array([_as_int(move.get("accuracy")) for move in moves], pa.int16()),
+        "priority": pa.array([_as_int(move.get("speed_priority")) or 0 for move in moves], pa.int8()),
+        "effect_rate": pa.array([_text(move.get("effect_rate")) for move in moves], _dictionary()),
+        "battle_effect": pa.array([_text(move.get("battle_effect")) for move in moves], pa.string()),
+        "secondary_effect": pa.array([_text(move.get("secondary_effect")) for move in moves], pa.string()),
+        "learners": pa.array([len(move.get("learned_by") or []) for move in moves], pa.int32()),
+    })
+
+
+def learnsets_table(generation: int, moves: List[Dict]) -> "pa.Table":
+    """One row per (move, learner) of a generation"""
+    _require_pyarrow()
+    columns: Dict[str, list] = {name: [] for name in ("move", "pokemon", "dex_number", "form", "method", "level")}
+    for move in moves:
+        for learner in move.get("learned_by") or []:
+            columns["move"].append(move.get("name"))
+            columns["pokemon"].append(_text(learner.get("name")))
+            columns["dex_number"].append(normalize_dex_number(learner.get("dex_number")))
+            columns["form"].append(_text(learner.get("form")))
+            columns["method"].append(_text(learner.get("method")))
+            columns["level"].append(_as_int(learner.get("level")))
+    rows = len(columns["move"])
+    return pa.table({
+        "generation": pa.array([generation] * rows, pa.int8()),
+        "move": pa.array(columns["move"], _dictionary()),
+        "pokemon": pa.array(columns["pokemon"], _dictionary()),
+        "dex_number": pa.array(columns["dex_number"], pa.int16()),
+        "form": pa.array(columns["form"], _dictionary()),
+        "method": pa.array(columns["method"], _dictionary()),
+        "level": pa.array(columns["level"], pa.int8()),
+    })
+
+
+def items_table(items: List[Dict]) -> "pa.Table":
+    """One row per item across every category file"""
+    _require_pyarrow()
+    prices = [item.get("price") if isinstance(item.get("price"), dict) else {} for item in items]
+    return pa.table({
+        "category": pa.array([_text(item.get("category")) for item in items], _dictionary()),
+        "name": pa.array([_text(item.get("name")) for item in items], pa.string()),
+        "url": pa.array([_text(item.get("url")) for item in items], pa.string()),
+        "effect": pa.array([_text(item.get("effect")) for item in items], pa.string()),
+        "purchase_price": pa.array([_as_int(price.get("purchase")) for price in prices], pa.int32()),
+        "sell_price": pa.array([_as_int(price.get("sell")) for price in prices], pa.int32()),
+        "generation_introduced": pa.array([_as_int(item.get("generation_introduced")) for item in items], pa.int8()),
+        "games": pa.array(
+            [[str(game) for game in item.get("games") or []] for item in items], pa.list_(_dictionary())
+        ),
+    })
+
+
+def write_dataset(table: "pa.Table", path: str, partition: str):
+    """Write a partitioned dataset, replacing the directory only once complete"""
+    _require_pyarrow()
+    staging = path + ".tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    pq.write_to_dataset(
+        table,
+        staging,
+        partition_cols=[partition],
+        basename_template="part-{i}.parquet",
+        compression=COMPRESSION,
+    )
+    previous = path + ".old"
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(path):
+        os.replace(path, previous)
+    os.replace(staging, path)
+    shutil.rmtree(previous, ignore_errors=True)
+
+
+def build_tables(store, datasets: Optional[Sequence[str]] = None) -> Dict[str, "pa.Table"]:
+    """Arrow tables for the selected datasets (all by default) from a DataStore"""
+    _require_pyarrow()
+    datasets = list(datasets or PARTITIONS)
+    unknown = [name for name in datasets if name not in PARTITIONS]
+    if unknown:
+        raise ValueError(f"Unknown dataset(s): {', '.join(unknown)} (choose from {', '.join(PARTITIONS)})")
+    tables = {}
+    if "pokemon" in datasets:
+        tables["pokemon"] = pokemon_table(store.pokemon(), store.pokemon_table())
+    if "moves" in datasets:
+        tables["moves"] = pa.concat_tables(
+            [moves_table(g, store.moves(g)) for g in MOVE_GENERATIONS]
+        )
+    if "learnsets" in datasets:
+        tables["learnsets"] = pa.concat_tables(
+            [learnsets_table(g, store.moves(g)) for g in MOVE_GENERATIONS]
+        )
+    if "items" in datasets:
+        tables["items"] = items_table(store.items())
+    return tables
+
+
+def export_parquet(store=None, datasets: Optional[Sequence[str]] = None, root: Optional[str] = None) -> Dict[str, str]:
+    """Write the selected datasets under data/parquet; dataset -> directory"""
+    if store is None:
+        from data_store import get_store
+
+        store = get_store()
+    output_dir = os.path.join(root or store.root, PARQUET_DATA_DIR)
+    written = {}
+    for name, table in build_tables(store, datasets).items():
+        path = os.path.join(output_dir, name)
+        write_dataset(table, path, PARTITIONS[name][0])
+        written[name] = path
+        print(f"  {name}: {table.num_rows} rows -> {path}")
+    return written
+
+
+def read_dataset(name: str, columns: Optional[List[str]] = None, filters=None, root: Optional[str] = None) -> "pa.Table":
+    """Load an exported dataset, reading only `columns` and the partitions
+    (and row groups) matching `filters`, e.g. [("generation", "=", 9)]"""
+    _require_pyarrow()
+    if root is None:
+        from data_store import PROJECT_ROOT
+
+        root = PROJECT_ROOT
+    column, kind = PARTITIONS[name]
+    partitioning = pads.partitioning(pa.schema([(column, pa.type_for_alias(kind))]), flavor="hive")
+    return pq.read_table(
+        os.path.join(root, PARQUET_DATA_DIR, name), columns=columns, filters=filters, partitioning=partitioning
+    )
+
+
+if __name__ == "__main__":
+    import time
+
+    selected = sys.argv[1:] or None
+    start = time.perf_counter()
+    export_parquet(datasets=selected)
+    print(f"Exported in {time.perf_counter() - start:.1f}s")
+
+    if not selected or "pokemon" in selected:
+        start = time.perf_counter()
+        stats = read_dataset("pokemon", columns=STAT_COLUMNS)
+        print(f"Base stats: {stats.num_rows} rows in {(time.perf_counter() - start) * 1000:.1f} ms "
+              f"({stats.nbytes / 1e6:.2f} MB)")
+    if not selected or "learnsets" in selected:
+        generation = MOVE_GENERATIONS[-1]
+        start = time.perf_counter()
+        learnsets = read_dataset("learnsets", filters=[("generation", "=", generation)])
+        print(f"Gen {generation} learnsets: {learnsets.num_rows} rows in "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms ({learnsets.nbytes / 1e6:.2f} MB)")
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Columnar Query Engine
+Loads Pokemon records into columnar NumPy arrays (stats as numbers, types,
+abilities, games and egg groups as membership matrices, presence flags) and
+compiles filter expressions into vectorized masks:
+
+    types has Fire and base_stats.speed > 100 and game in Scarlet
+    (generation <= 4 or types has Dragon) and not has_evolution
+    abilities in (Levitate, Flash Fire) and base_stats.total >= 500
+
+Results can be sorted and projected onto a subset of columns.
+"""
+
+import os
+import re
+import sys
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils
+from lookup import display_label, form_key, normalize_dex_number, pokemon_generation, record_sets
+
+NUMERIC_COLUMNS = (
+    "number",
+    "generation",
+    "base_stats.hp",
+    "base_stats.attack",
+    "base_stats.defense",
+    "base_stats.sp_attack",
+    "base_stats.sp_defense",
+    "base_stats.speed",
+    "base_stats.total",
+    "game_mechanics.catch_rate",
+    "game_mechanics.base_exp",
+    "physical_info.weight_kilograms",
+    "breeding_info.egg_cycles",
+    "breeding_info.base_friendship",
+)
+TEXT_COLUMNS = ("name", "ref_id", "form")
+SET_COLUMNS = ("types", "abilities", "hidden_abilities", "games", "egg_groups")
+# Top-level fields exposed as has_<field> boolean columns
+FLAG_FIELDS = (
+    "types",
+    "abilities",
+    "base_stats",
+    "physical_info",
+    "breeding_info",
+    "game_mechanics",
+    "game_appearances",
+    "evolution",
+    "evolution_info",
+)
+
+# Query shorthands: "game in Scarlet" means "games has Scarlet"
+COLUMN_ALIASES = {
+    "type": "types",
+    "ability": "abilities",
+    "hidden_ability": "hidden_abilities",
+    "game": "games",
+    "egg_group": "egg_groups",
+    "gen": "generation",
+    "bst": "base_stats.total",
+}
+
+_COMPARISONS = {
+    "==": np.equal,
+    "=": np.equal,
+    "!=": np.not_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+}
+_KEYWORDS = {"and", "or", "not", "has", "in"}
+_TOKEN_PATTERN = re.compile(
+    r"""\s*(?:
+        (?P<number>-?\d+(?:\.\d+)?)(?![\w.])
+        |(?P<string>"[^"]*"|'[^']*')
+        |(?P<op><=|>=|!=|==|=|<|>)
+        |(?P<punct>[(),])
+        |(?P<word>[^\s()<>=!,"]+)
+    )""",
+    re.VERBOSE,
+)
+
+
+class QueryError(ValueError):
+    """Raised for malformed filter expressions or unknown columns"""
+
+
+def _to_number(value) -> float:
+    """Best-effort conversion of scraped values ('45', '#0001', 45) to float"""
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        match = re.search(r"-?\d+(?:\.\d+)?", value.replace(",", ""))
+        if match:
+            return float(match.group())
+    return np.nan
+
+
+class PokemonTable:
+    """Columnar view of the Pokemon records"""
+
+    def __init__(self, records: Optional[List[Dict]] = None):
+        records = records or []
+        self.size = len(records)
+        self.numeric: Dict[str, np.ndarray] = {}
+        self.text: Dict[str, np.ndarray] = {}
+        self.flags: Dict[str, np.ndarray] = {}
+        # Set-valued columns: a boolean row x value matrix plus its vocabulary
+        self.sets: Dict[str, np.ndarray] = {}
+        self.vocab: Dict[str, Dict[str, int]] = {}
+        self.labels: Dict[str, List[str]] = {}
+        self._compiled: Dict[str, Callable[["PokemonTable"], np.ndarray]] = {}
+        self._build(records)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _build(self, records: List[Dict]):
+        # Collect plain lists first; per-element writes into NumPy arrays are slow
+        n = self.size
+        numeric = {name: [np.nan] * n for name in NUMERIC_COLUMNS}
+        text = {name: [""] * n for name in TEXT_COLUMNS}
+        flags = {field: [False] * n for field in FLAG_FIELDS}
+        hits = {name: ([], []) for name in SET_COLUMNS}
+        # Values repeat heavily (types, games), so normalize each string once
+        keys: Dict[str, str] = {}
+
+        def normalize(value) -> str:
+            key = keys.get(value)
+            if key is None:
+                key = keys[value] = PokeDataUtils.normalize_key(str(value))
+            return key
+
+        for name in SET_COLUMNS:
+            self.vocab[name] = {}
+            self.labels[name] = []
+        stat_columns = [(name, *name.split(".")) for name in NUMERIC_COLUMNS[2:]]
+
+        for row, record in enumerate(records):
+            dex = normalize_dex_number(record.get("number") or record.get("ref_id"))
+            if dex is not None:
+                numeric["number"][row] = dex
+            generation = pokemon_generation(record)
+            if generation:
+                numeric["generation"][row] = generation
+            for name, section, field in stat_columns:
+                value = (record.get(section) or {}).get(field)
+                if value is not None:
+                    numeric[name][row] = _to_number(value)
+
+            text["name"][row] = record.get("name", "")
+            text["ref_id"][row] = record.get("ref_id", "")
+            text["form"][row] = form_key(record)
+
+            for field in FLAG_FIELDS:
+                if record.get(field):
+                    flags[field][row] = True
+
+            for name, values in record_sets(record).items():
+                vocab = self.vocab[name]
+                rows, codes = hits[name]
+                for value in values:
+                    key = normalize(value)
+                    if not key:
+                        continue
+                    if key not in vocab:
+                        vocab[key] = len(vocab)
+                        self.labels[name].append(display_label(value))
+                    rows.append(row)
+                    codes.append(vocab[key])
+
+        self.numeric = {name: np.array(values, dtype=float) for name, values in numeric.items()}
+        self.text = {name: np.array(values, dtype=object) for name, values in text.items()}
+        self._text_keys = {
+            name: np.array([normalize(v) for v in values], dtype=object)
+            for name, values in text.items()
+        }
+        self.flags = {
+            f"has_{field}": np.array(values, dtype=bool) for field, values in flags.items()
+        }
+        for name, (rows, codes) in hits.items():
+            matrix = np.zeros((n, len(self.vocab[name])), dtype=bool)
+            matrix[rows, codes] = True
+            self.sets[name] = matrix
+
+    # Column access
+    @property
+    def columns(self) -> List[str]:
+        return [*self.numeric, *self.text, *self.sets, *self.flags]
+
+    @staticmethod
+    def _resolve(name: str) -> str:
+        return COLUMN_ALIASES.get(name, name)
+
+    def _kind(self, name: str) -> str:
+        for kind, columns in (
+            ("numeric", self.numeric),
+            ("text", self.text),
+            ("set", self.sets),
+            ("flag", self.flags),
+        ):
+            if name in columns:
+                return kind
+        raise QueryError(f"Unknown column '{name}'. Choose from {', '.join(self.columns)}")
+
+    def member_mask(self, column: str, values: Sequence) -> np.ndarray:
+        """Rows whose set column contains any of the values"""
+        vocab = self.vocab[column]
+        codes = [
+            vocab[key]
+            for key in (PokeDataUtils.normalize_key(str(v)) for v in values)
+            if key in vocab
+        ]
+        if not codes:
+            return np.zeros(self.size, dtype=bool)
+        return self.sets[column][:, codes].any(axis=1)
+
+    def column_values(self, name: str, rows: np.ndarray) -> List:
+        """Python values of one column for the given row indices"""
+        name = self._resolve(name)
+        kind = self._kind(name)
+        if kind == "numeric":
+            return [
+                None if np.isnan(v) else (int(v) if float(v).is_integer() else float(v))
+                for v in self.numeric[name][rows]
+            ]
+        if kind == "text":
+            return self.text[name][rows].tolist()
+        if kind == "flag":
+            return self.flags[name][rows].tolist()
+        labels = self.labels[name]
+        return [[labels[code] for code in np.flatnonzero(hits)] for hits in self.sets[name][rows]]
+
+    # Queries
+    def compile(self, expression: str) -> Callable[["PokemonTable"], np.ndarray]:
+        """Compile a filter expression into a function returning a boolean mask"""
+        compiled = self._compiled.get(expression)
+        if compiled is None:
+            compiled = _Parser(expression, self).parse()
+            self._compiled[expression] = compiled
+        return compiled
+
+    def mask(self, where: Optional[str] = None) -> np.ndarray:
+        if not where or not where.strip():
+            return np.ones(self.size, dtype=bool)
+        return self.compile(where)(self)
+
+    def count(self, where: Optional[str] = None) -> int:
+        return int(np.count_nonzero(self.mask(where)))
+
+    def rows(
+        self,
+        where: Optional[str] = None,
+        order_by: Optional[Union[str, Sequence[str]]] = None,
+        limit: Optional[int] = None,
+    ) -> np.ndarray:
+        """Row indices matching the filter, sorted.
+
+        order_by takes column names; prefix one with '-' for descending
+        order. Ties keep national dex order.
+        """
+        rows = np.flatnonzero(self.mask(where))
+        if order_by:
+            keys = [order_by] if isinstance(order_by, str) else list(order_by)
+            sort_keys = []
+            # np.lexsort sorts by the last key first
+            for key in reversed(keys):
+                descending = key.startswith("-")
+                name = self._resolve(key.lstrip("-"))
+                kind = self._kind(name)
+                if kind == "numeric":
+                    values = self.numeric[name][rows]
+                    # Missing values always sort last
+                    values = np.where(np.isnan(values), np.inf, -values if descending else values)
+                elif kind == "text":
+                    order = np.argsort(self._text_keys[name][rows], kind="stable")
+                    values = np.empty(len(rows))
+                    values[order] = np.arange(len(rows))
+                    if descending:
+                        values = -values
+                else:
+                    raise QueryError(f"Cannot sort by {kind} column '{name}'")
+                sort_keys.append(values)
+            rows = rows[np.lexsort(sort_keys)]
+        if limit is not None:
+            rows = rows[:limit]
+        return rows
+
+    def query(
+        self,
+        where: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        order_by: Optional[Union[str, Sequence[str]]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """Filter, sort and project: returns one dict per matching row"""
+        rows = self.rows(where, order_by, limit)
+        columns = list(columns or ("number", "name", "types"))
+        values = [self.column_values(column, rows) for column in columns]
+        return [dict(zip(columns, row_values)) for row_values in zip(*values)]
+
+
+class _Parser:
+    """Recursive-descent parser producing a tree of vectorized closures.
+
+    expression := term ('or' term)*
+    term       := factor ('and' factor)*
+    factor     := 'not' factor | '(' expression ')' | predicate
+    predicate  := column [op value | 'has' values | 'in' values]
+    """
+
+    def __init__(self, expression: str, table: PokemonTable):
+        self.expression = expression
+        self.table = table
+        self.tokens = self._tokenize(expression)
+        self.position = 0
+
+    @staticmethod
+    def _tokenize(expression: str) -> List[tuple]:
+        tokens, position = [], 0
+        expression = expression.rstrip()
+        while position < len(expression):
+            match = _TOKEN_PATTERN.match(expression, position)
+            if not match or match.end() == position:
+                raise QueryError(f"Unexpected character at {position}: {expression[position:]!r}")
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "string":
+                value = value[1:-1]
+            elif kind == "number":
+                value = float(value)
+            elif kind == "word" and value.lower() in _KEYWORDS:
+                kind, value = "keyword", value.lower()
+            tokens.append((kind, value))
+            position = match.end()
+        return tokens
+
+    def _peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def _next(self):
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def _expect(self, kind, value=None):
+        token = self._next()
+        if token[0] != kind or (value is not None and token[1] != value):
+            raise QueryError(f"Expected {value or kind} in {self.expression!r}, got {token[1]!r}")
+        return token
+
+    def parse(self) -> Callable[[PokemonTable], np.ndarray]:
+        node = self._expression()
+        if self._peek()[0] is not None:
+            raise QueryError(f"Unexpected {self._peek()[1]!r} in {self.expression!r}")
+        return node
+
+    def _expression(self):
+        nodes = [self._term()]
+        while self._peek() == ("keyword", "or"):
+            self._next()
+            nodes.append(self._term())
+        if len(nodes) == 1:
+            return nodes[0]
+        return lambda table: np.logical_or.reduce([node(table) for node in nodes])
+
+    def _term(self):
+        nodes = [self._factor()]
+        while self._peek() == ("keyword", "and"):
+            self._next()
+            nodes.append(self._factor())
+        if len(nodes) == 1:
+            return nodes[0]
+        return lambda table: np.logical_and.reduce([node(table) for node in nodes])
+
+    def _factor(self):
+        token = self._peek()
+        if token == ("keyword", "not"):
+            self._next()
+            node = self._factor()
+            return lambda table: ~node(table)
+        if token == ("punct", "("):
+            self._next()
+            node = self._expression()
+            self._expect("punct", ")")
+            return node
+        return self._predicate()
+
+    def _value(self):
+        """A number, a quoted string or a run of bare words ('Legends Arceus')"""
+        kind, value = self._next()
+        if kind in ("number", "string"):
+            return value
+        if kind != "word":
+            raise QueryError(f"Expected a value in {self.expression!r}, got {value!r}")
+        words = [value]
+        while self._peek()[0] == "word":
+            words.append(self._next()[1])
+        return " ".join(words)
+
+    def _values(self) -> List:
+        if self._peek() != ("punct", "("):
+            return [self._value()]
+        self._next()
+        values = [self._value()]
+        while self._peek() == ("punct", ","):
+            self._next()
+            values.append(self._value())
+        self._expect("punct", ")")
+        return values
+
+    def _predicate(self):
+        kind, name = self._next()
+        if kind != "word":
+            raise QueryError(f"Expected a column name in {self.expression!r}, got {name!r}")
+        column = self.table._resolve(name)
+        column_kind = self.table._kind(column)
+        op_kind, op = self._peek()
+
+        if op_kind == "keyword" and op in ("has", "in"):
+            self._next()
+            values = self._values()
+            if column_kind == "set":
+                if op == "has" and len(values) > 1:
+                    # "types has (Fire, Flying)" means all of them
+                    return lambda table: np.logical_and.reduce(
+                        [table.member_mask(column, [v]) for v in values]
+                    )
+                return lambda table: table.member_mask(column, values)
+            if op == "has":
+                raise QueryError(f"'has' needs a list column, '{column}' is {column_kind}")
+            return self._membership(column, column_kind, values)
+
+        if op_kind == "op":
+            self._next()
+            value = self._value()
+            if column_kind == "numeric":
+                number = _to_number(value)
+                compare = _COMPARISONS[op]
+                return lambda table: compare(table.numeric[column], number)
+            if column_kind == "text" and op in ("=", "==", "!="):
+                key = PokeDataUtils.normalize_key(str(value))
+                negate = op == "!="
+                return lambda table: (table._text_keys[column] == key) ^ negate
+            if column_kind == "set" and op in ("=", "==", "!="):
+                negate = op == "!="
+                return lambda table: table.member_mask(column, [value]) ^ negate
+            raise QueryError(f"Operator '{op}' is not supported for {column_kind} column '{column}'")
+
+        if column_kind == "flag":
+            return lambda table: table.flags[column]
+        if column_kind == "set":
+            return lambda table: table.sets[column].any(axis=1)
+        raise QueryError(f"Column '{column}' needs a comparison in {self.expression!r}")
+
+    def _membership(self, column: str, column_kind: str, values: List):
+        if column_kind == "numeric":
+            numbers = np.array([_to_number(v) for v in values])
+            return lambda table: np.isin(table.numeric[column], numbers)
+        if column_kind == "text":
+            keys = [PokeDataUtils.normalize_key(str(v)) for v in values]
+            return lambda table: np.isin(table._text_keys[column], keys)
+        raise QueryError(f"'in' is not supported for {column_kind} column '{column}'")
+
+
+if __name__ == "__main__":
+    from data_store import get_store
+
+    table = get_store().pokemon_table()
+    expression = " ".join(sys.argv[1:]) or "types has Fire and base_stats.speed > 100"
+    print(f"{expression}  ->  {table.count(expression)} of {len(table)}")
+    for row in table.query(
+        expression,
+        columns=["number", "name", "types", "base_stats.speed"],
+        order_by="-base_stats.speed",
+        limit=20,
+    ):
+        print(f"  {row}")
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Name Search Index
+Prefix (trie) and typo-tolerant (character trigram) search over Pokemon names
+and forms, move names, ability names and item names. Built once from the
+DataStore and serialized compactly for the web SearchBar.
+"""
+
+import heapq
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils, MOVE_GENERATIONS
+
+ENTRY_TYPES = ("pokemon", "move", "ability", "item")
+
+# Ranking: exact > prefix of the full name > prefix of a word > fuzzy
+EXACT_SCORE, NAME_PREFIX_SCORE, WORD_PREFIX_SCORE = 1.0, 0.9, 0.8
+FUZZY_WEIGHT = 0.7
+FUZZY_THRESHOLD = 0.3
+_TERMINAL = ""
+
+
+def trigrams(key: str) -> List[str]:
+    """Character trigrams of a normalized key, padded so short words still match"""
+    padded = f"  {key} "
+    return sorted({padded[i : i + 3] for i in range(len(padded) - 2)})
+
+
+def _words(name: str) -> List[str]:
+    """Normalized words of a name ('Mr. Mime' -> ['mr', 'mime'])"""
+    words = []
+    for part in name.replace("-", " ").replace(".", " ").split():
+        key = PokeDataUtils.normalize_key(part)
+        if key:
+            words.append(key)
+    return words
+
+
+class SearchIndex:
+    """Trie + trigram index over named entries of several types"""
+
+    def __init__(self):
+        # Each entry is (type, name, description)
+        self.entries: List[Tuple[str, str, str]] = []
+        self.keys: List[str] = []
+        self._trie: Dict = {}
+        self._grams: Dict[str, List[int]] = {}
+        self._seen: Dict[Tuple[str, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, entry_type: str, name: str, description: str = "") -> Optional[int]:
+        """Add one entry; duplicates (same type and name) are ignored"""
+        key = PokeDataUtils.normalize_key(name)
+        if not key or (entry_type, key) in self._seen:
+            return None
+
+        entry_id = len(self.entries)
+        self.entries.append((entry_type, name, description or ""))
+        self.keys.append(key)
+        self._seen[(entry_type, key)] = entry_id
+
+        # Index the full key plus every word so "mime" finds "Mr. Mime"
+        for word in {key, *_words(name)}:
+            node = self._trie
+            for char in word:
+                node = node.setdefault(char, {})
+                ids = node.setdefault(_TERMINAL, [])
+                if not ids or ids[-1] != entry_id:
+                    ids.append(entry_id)
+
+        for gram in trigrams(key):
+            self._grams.setdefault(gram, []).append(entry_id)
+        return entry_id
+
+    def _prefix_ids(self, prefix: str) -> List[int]:
+        node = self._trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node.get(_TERMINAL, [])
+
+    def _fuzzy_scores(self, key: str) -> Dict[int, float]:
+        """Dice similarity between the query's trigrams and each candidate's"""
+        query_grams = trigrams(key)
+        overlap: Dict[int, int] = {}
+        for gram in query_grams:
+            for entry_id in self._grams.get(gram, ()):
+                overlap[entry_id] = overlap.get(entry_id, 0) + 1
+
+        scores = {}
+        for entry_id, shared in overlap.items():
+            entry_gram_count = len(self.keys[entry_id]) + 1
+            score = 2 * shared / (len(query_grams) + entry_gram_count)
+            if score >= FUZZY_THRESHOLD:
+                scores[entry_id] = score
+        return scores
+
+    def search(
+        self,
+        query: str,
+        types: Optional[Sequence[str]] = None,
+        limit: int = 20,
+    ) -> List[Dict]:
+        """Return ranked matches: exact, then name prefix, word prefix, fuzzy"""
+        key = PokeDataUtils.normalize_key(query)
+        if not key:
+            return []
+        allowed = set(types) if types else None
+
+        scores: Dict[int, float] = {}
+        for entry_id in self._prefix_ids(key):
+            entry_key = self.keys[entry_id]
+            if entry_key == key:
+                scores[entry_id] = EXACT_SCORE
+            elif entry_key.startswith(key):
+                scores[entry_id] = NAME_PREFIX_SCORE
+            else:
+                scores[entry_id] = WORD_PREFIX_SCORE
+
+        # Only fall back to fuzzy matching when prefixes don't fill the page
+        if len(scores) < limit:
+            for entry_id, similarity in self._fuzzy_scores(key).items():
+                scores.setdefault(entry_id, FUZZY_WEIGHT * similarity)
+
+        if allowed:
+            scores = {
+                entry_id: score
+                for entry_id, score in scores.items()
+                if self.entries[entry_id][0] in allowed
+            }
+
+        ranked = heapq.nsmallest(
+            limit,
+            scores.items(),
+            key=lambda item: (
+                -item[1],
+                ENTRY_TYPES.index(self.entries[item[0]][0]),
+                len(self.keys[item[0]]),
+                self.keys[item[0]],
+            ),
+        )
+
+        results = []
+        for entry_id, score in ranked:
+            entry_type, name, description = self.entries[entry_id]
+            results.append(
+                {
+                    "type": entry_type,
+                    "name": name,
+                    "description": description,
+                    "score": round(score, 3),
+                }
+            )
+        return results
+
+    # Serialization
+    def to_dict(self) -> Dict:
+        """Compact form for the web client.
+
+        entries: [type_index, name, description]
+        prefixes: sorted [key, entry_id] pairs (full names and words), so a
+            prefix lookup is a binary search over one array
+        grams: trigram -> delta-encoded entry ids
+        """
+        prefixes = set()
+        for entry_id, (_, name, _) in enumerate(self.entries):
+            for word in {self.keys[entry_id], *_words(name)}:
+                prefixes.add((word, entry_id))
+
+        grams = {}
+        for gram, ids in sorted(self._grams.items()):
+            grams[gram] = [b - a for a, b in zip([0] + ids[:-1], ids)]
+
+        return {
+            "version": 1,
+            "types": list(ENTRY_TYPES),
+            "entries": [
+                [ENTRY_TYPES.index(entry_type), name, description]
+                for entry_type, name, description in self.entries
+            ],
+            "prefixes": [list(pair) for pair in sorted(prefixes)],
+            "grams": grams,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SearchIndex":
+        index = cls()
+        types = data.get("types", list(ENTRY_TYPES))
+        for type_index, name, description in data.get("entries", []):
+            index.add(types[type_index], name, description)
+        return index
+
+
+def _pokemon_description(record: Dict) -> str:
+    return " / ".join(record.get("types") or [])
+
+
+def _move_description(move: Dict) -> str:
+    parts = [move.get("battle_type"), move.get("category")]
+    if move.get("base_power"):
+        parts.append(f"{move['base_power']} BP")
+    return " · ".join(part for part in parts if part)
+
+
+def _shorten(text: str, length: int = 100) -> str:
+    text = (text or "").strip()
+    return text if len(text) <= length else text[: length - 1].rstrip() + "…"
+
+
+def build_search_index(store) -> SearchIndex:
+    """Build the name search index from every dataset in the store"""
+    index = SearchIndex()
+
+    for record in store.pokemon():
+        index.add("pokemon", record.get("name", ""), _pokemon_description(record))
+
+    # Newest generation first so descriptions reflect current move data
+    learner_forms = []
+    for generation in reversed(MOVE_GENERATIONS):
+        for move in store.moves(generation):
+            index.add("move", move.get("name", ""), _move_description(move))
+            for learner in move.get("learned_by", []):
+                form = learner.get("form") or "Normal"
+                if form != "Normal" and learner.get("name"):
+                    learner_forms.append(f"{form} {learner['name']}")
+    for form_name in sorted(set(learner_forms)):
+        index.add("pokemon", form_name, "Form")
+
+    for ability in store.abilities():
+        description = ability.get("game_description") or ability.get("game_text", "")
+        index.add("ability", ability.get("name", ""), _shorten(description))
+
+    for item in store.items():
+        index.add("item", item.get("name", ""), item.get("category", ""))
+
+    return index
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Serialization
+One JSON layer for every loader and writer. Uses the fastest installed
+backend (orjson, then msgspec) and falls back to the stdlib json module;
+set POKEDEX_JSON_BACKEND=orjson|msgspec|json to force one. All backends
+write the same output: UTF-8 without escaping, 2-space indentation or
+compact separators.
+
+load_records() decodes a dataset straight into typed records (dataclasses
+below). With msgspec this validates and builds them in C; other backends
+convert the decoded dicts.
+"""
+
+import dataclasses
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, List, Optional, Union, get_args, get_origin, get_type_hints
+
+BACKEND_ENV = "POKEDEX_JSON_BACKEND"
+BACKENDS = ("orjson", "msgspec", "json")
+# Encoder chunks joined per write() by the streaming stdlib encoder
+WRITE_BATCH = 4096
+
+
+class StdlibBackend:
+    """json module; dumps stream chunk by chunk instead of building one string"""
+
+    name = "json"
+
+    def __init__(self):
+        self._pretty = json.JSONEncoder(ensure_ascii=False, indent=2)
+        self._compact = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def loads(self, raw: Union[bytes, str]) -> Any:
+        return json.loads(raw)
+
+    def dumps(self, data: Any, compact: bool = False) -> bytes:
+        return (self._compact if compact else self._pretty).encode(data).encode("utf-8")
+
+    def dump(self, data: Any, f: BinaryIO, compact: bool = False):
+        batch = []
+        for chunk in (self._compact if compact else self._pretty).iterencode(data):
+            batch.append(chunk)
+            if len(batch) >= WRITE_BATCH:
+                f.write("".join(batch).encode("utf-8"))
+                batch.clear()
+        f.write("".join(batch).encode("utf-8"))
+
+
+class OrjsonBackend:
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        # Non-string keys become strings like the json module does; NumPy
+        # scalars and arrays are encoded natively
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def loads(self, raw: Union[bytes, str]) -> Any:
+        return self._orjson.loads(raw)
+
+    def dumps(self, data: Any, compact: bool = False) -> bytes:
+        options = self._options if compact else self._options | self._orjson.OPT_INDENT_2
+        return self._orjson.dumps(data, option=options)
+
+    def dump(self, data: Any, f: BinaryIO, compact: bool = False):
+        f.write(self.dumps(data, compact))
+
+
+class MsgspecBackend:
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, raw: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(raw)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, data: Any, compact: bool = False) -> bytes:
+        encoded = self._encoder.encode(data)
+        return encoded if compact else self._msgspec.json.format(encoded, indent=2)
+
+    def dump(self, data: Any, f: BinaryIO, compact: bool = False):
+        f.write(self.dumps(data, compact))
+
+    def decode_typed(self, raw: Union[bytes, str], kind: type) -> Any:
+        return self._msgspec.json.decode(raw, type=kind)
+
+
+_BACKEND_CLASSES = {"orjson": OrjsonBackend, "msgspec": MsgspecBackend, "json": StdlibBackend}
+_backends: Dict[str, Any] = {}
+
+
+def get_backend(name: Optional[str] = None):
+    """The named backend, or the first installed one (POKEDEX_JSON_BACKEND wins)"""
+    names = [name] if name else ([os.environ[BACKEND_ENV]] if os.environ.get(BACKEND_ENV) else list(BACKENDS))
+    for candidate in names:
+        if candidate not in _BACKEND_CLASSES:
+            raise ValueError(f"Unknown JSON backend '{candidate}' (expected one of {', '.join(BACKENDS)})")
+        if candidate not in _backends:
+            try:
+                _backends[candidate] = _BACKEND_CLASSES[candidate]()
+            except ImportError:
+                if name:
+                    raise
+                continue
+        return _backends[candidate]
+    return get_backend("json")
+
+
+def available_backends() -> List[str]:
+    available = []
+    for name in BACKENDS:
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+    """Parse JSON text or UTF-8 bytes; raises ValueError on malformed input"""
+    return get_backend().loads(raw)
+
+
+def dumps(data: Any, compact: bool = False) -> bytes:
+    return get_backend().dumps(data, compact)
+
+
+def dump(data: Any, f: BinaryIO, compact: bool = False):
+    """Write JSON to a binary file"""
+    get_backend().dump(data, f, compact)
+
+
+def load(file_path: str) -> Any:
+    with open(file_path, "rb") as f:
+        return loads(f.read())
+
+
+# Typed records. Fields mirror what the scrapers write; values the scrapers
+# store inconsistently (numbers as text, nested sections) stay loosely typed.
+@dataclass
+class MoveLearner:
+    dex_number: str = ""
+    name: str = ""
+    form: str = "Normal"
+    method: str = ""
+    level: Optional[int] = None
+
+
+@dataclass
+class MoveRecord:
+    name: str = ""
+    battle_type: str = ""
+    category: str = ""
+    power_points: Optional[int] = None
+    base_power: Optional[int] = None
+    accuracy: Optional[int] = None
+    battle_effect: str = ""
+    secondary_effect: str = ""
+    effect_rate: str = ""
+    speed_priority: int = 0
+    learned_by: List[MoveLearner] = field(default_factory=list)
+
+
+@dataclass
+class PokemonRecord:
+    ref_id: str = ""
+    number: Union[str, int, None] = None
+    name: str = ""
+    types: List[str] = field(default_factory=list)
+    abilities: List[str] = field(default_factory=list)
+    abilities_info: Dict[str, Any] = field(default_factory=dict)
+    base_stats: Dict[str, Any] = field(default_factory=dict)
+    physical_info: Dict[str, Any] = field(default_factory=dict)
+    breeding_info: Dict[str, Any] = field(default_factory=dict)
+    game_mechanics: Dict[str, Any] = field(default_factory=dict)
+    game_appearances: Dict[str, Any] = field(default_factory=dict)
+    evolution: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class AbilityRecord:
+    name: str = ""
+    game_description: str = ""
+    technical_effect: str = ""
+    full_description: str = ""
+    interactions: Dict[str, Any] = field(default_factory=dict)
+    pokemon: List[Any] = field(default_factory=list)
+
+
+@dataclass
+class ItemRecord:
+    name: str = ""
+    category: str = ""
+    url: str = ""
+    effect: str = ""
+    price: Any = None
+    games: List[str] = field(default_factory=list)
+    flavor_text: Any = None
+    locations: Any = None
+    generation_introduced: Any = None
+
+
+@dataclass
+class MovesFile:
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    moves: List[MoveRecord] = field(default_factory=list)
+
+
+@dataclass
+class AbilitiesFile:
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    abilities: List[AbilityRecord] = field(default_factory=list)
+
+
+@dataclass
+class ItemsFile:
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    items: List[ItemRecord] = field(default_factory=list)
+
+
+# Dataset kind -> (file layout, attribute holding the records or None for a bare list)
+RECORD_LAYOUTS = {
+    "pokemon": (List[PokemonRecord], None),
+    "moves": (MovesFile, "moves"),
+    "abilities": (AbilitiesFile, "abilities"),
+    "items": (ItemsFile, "items"),
+}
+
+
+_converters: Dict[Any, Any] = {}
+
+
+def _converter(kind: Any):
+    """Function building `kind` from decoded JSON without validation (used
+    when msgspec is not installed); None when values pass through as is"""
+    if kind in _converters:
+        return _converters[kind]
+    convert = None
+    if dataclasses.is_dataclass(kind):
+        hints = get_type_hints(kind)
+        fields = [(f.name, _converter(hints[f.name])) for f in dataclasses.fields(kind)]
+
+        def convert(value, kind=kind, fields=fields):
+            if not isinstance(value, dict):
+                return kind()
+            return kind(**{
+                name: value[name] if field_converter is None else field_converter(value[name])
+                for name, field_converter in fields
+                if name in value
+            })
+    elif get_origin(kind) in (list, List):
+        item = _converter(get_args(kind)[0])
+        if item is not None:
+            def convert(value, item=item):
+                return [item(v) for v in value] if isinstance(value, list) else value
+    _converters[kind] = convert
+    return convert
+
+
+def decode_records(raw: Union[bytes, str], kind: str) -> list:
+    """Typed records ('pokemon', 'moves', 'abilities' or 'items') from JSON text.
+
+    Unknown fields are dropped. msgspec validates field types; if the data
+    does not match (scraped files are not always consistent) it falls back
+    to the unvalidated conversion.
+    """
+    layout, attribute = RECORD_LAYOUTS[kind]
+    backend = get_backend()
+    decoded = None
+    if isinstance(backend, MsgspecBackend):
+        try:
+            decoded = backend.decode_typed(raw, layout)
+        except backend._msgspec.ValidationError:
+            decoded = None
+    if decoded is None:
+        decoded = _converter(layout)(backend.loads(raw))
+    return getattr(decoded, attribute) if attribute else decoded
+
+
+def load_records(file_path: str, kind: str) -> list:
+    with open(file_path, "rb") as f:
+        return decode_records(f.read(), kind)
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.path.append(os.path.dirname(__file__))
+    from data_store import get_store
+
+    print(f"Backends: {', '.join(available_backends())} (using {get_backend().name})")
+    store = get_store()
+    pokemon = load_records(store.resolve("pokemon"), "pokemon")
+    print(f"{len(pokemon)} typed Pokemon records")
+    if pokemon:
+        print(f"  {pokemon[0].name}: {', '.join(pokemon[0].types)} {pokemon[0].base_stats}")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Similarity Search
+"Pokemon most similar to X" by stat distribution, typing and abilities.
+Feature vectors are built from the columnar PokemonTable; k-nearest-neighbour
+queries use a KD-tree when scipy is installed and a vectorized brute-force
+search otherwise. All-pairs top-k is computed in one batch for the sidecar.
+"""
+
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from query_engine import PokemonTable, QueryError
+from stat_calc import STATS
+
+# Relative weight of each feature group in the distance
+FEATURE_WEIGHTS = {"stats": 1.0, "bst": 0.5, "types": 1.0, "abilities": 0.5}
+BATCH_SIZE = 1024
+
+
+def _standardize(columns: np.ndarray) -> np.ndarray:
+    if len(columns) == 0:
+        return columns
+    mean = columns.mean(axis=0)
+    std = columns.std(axis=0)
+    return (columns - mean) / np.where(std > 0, std, 1)
+
+
+def build_features(table: PokemonTable, weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """Weighted feature matrix (rows x features) for every row of the table.
+
+    stats: each stat's share of the BST (the spread's shape), standardized
+    bst: the standardized total
+    types / abilities: multi-hot vectors scaled to unit length per Pokemon
+    """
+    weights = {**FEATURE_WEIGHTS, **(weights or {})}
+    base = np.nan_to_num(
+        np.column_stack([table.numeric[f"base_stats.{stat}"] for stat in STATS])
+    ) if len(table) else np.zeros((0, len(STATS)))
+    total = base.sum(axis=1, keepdims=True)
+    shares = base / np.where(total > 0, total, 1)
+
+    def unit_rows(matrix: np.ndarray) -> np.ndarray:
+        matrix = matrix.astype(float)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms > 0, norms, 1)
+
+    abilities = np.hstack([table.sets["abilities"], table.sets["hidden_abilities"]])
+    groups = [
+        weights["stats"] * _standardize(shares) / np.sqrt(len(STATS)),
+        weights["bst"] * _standardize(total),
+        weights["types"] * unit_rows(table.sets["types"]),
+        weights["abilities"] * unit_rows(abilities),
+    ]
+    return np.hstack(groups).astype(np.float32)
+
+
+class SimilarityIndex:
+    """k-NN index over Pokemon feature vectors"""
+
+    def __init__(self, table: PokemonTable, weights: Optional[Dict[str, float]] = None):
+        self.table = table
+        self.names = table.text["name"]
+        self.features = build_features(table, weights)
+        self._squared_norms = (self.features.astype(np.float64) ** 2).sum(axis=1)
+        self.tree = None
+        try:
+            from scipy.spatial import cKDTree
+
+            if len(self.features):
+                self.tree = cKDTree(self.features)
+        except ImportError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def _row(self, name: str) -> int:
+        rows = self.table.rows(f"name == {name!r}")
+        if not len(rows):
+            raise QueryError(f"Unknown Pokemon '{name}'")
+        return int(rows[0])
+
+    def _squared_distances(self, vectors: np.ndarray) -> np.ndarray:
+        """(queries x rows) squared Euclidean distances via one matrix product"""
+        vectors = vectors.astype(np.float64)
+        distances = (
+            (vectors ** 2).sum(axis=1)[:, None]
+            + self._squared_norms[None, :]
+            - 2 * vectors @ self.features.T.astype(np.float64)
+        )
+        return np.maximum(distances, 0)
+
+    def nearest(self, vector: np.ndarray, k: int = 10, exclude: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Row indices and distances of the k rows nearest to a feature vector"""
+        extra = 1 if exclude is not None else 0
+        count = min(k + extra, len(self))
+        if self.tree is not None:
+            distances, rows = self.tree.query(vector, k=count)
+            rows, distances = np.atleast_1d(rows), np.atleast_1d(distances)
+        else:
+            squared = self._squared_distances(vector[None, :])[0]
+            rows = np.argpartition(squared, count - 1)[:count] if count < len(self) else np.arange(len(self))
+            rows = rows[np.argsort(squared[rows], kind="stable")]
+            distances = np.sqrt(squared[rows])
+        if exclude is not None:
+            keep = rows != exclude
+            rows, distances = rows[keep][:k], distances[keep][:k]
+        return rows, distances
+
+    def similar(self, name: str, k: int = 10) -> List[Dict]:
+        """The k Pokemon most similar to `name` (itself excluded)"""
+        row = self._row(name)
+        rows, distances = self.nearest(self.features[row], k, exclude=row)
+        return [
+            {
+                "name": self.names[r],
+                "number": int(self.table.numeric["number"][r]),
+                "distance": round(float(d), 4),
+                "similarity": round(float(1 / (1 + d)), 4),
+            }
+            for r, d in zip(rows, distances)
+        ]
+
+    def all_neighbors(self, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k neighbours of every row: (rows x k) indices and distances"""
+        k = min(k, max(len(self) - 1, 0))
+        indices = np.zeros((len(self), k), dtype=np.int64)
+        distances = np.zeros((len(self), k))
+        for start in range(0, len(self), BATCH_SIZE):
+            stop = min(start + BATCH_SIZE, len(self))
+            squared = self._squared_distances(self.features[start:stop])
+            # Never return a Pokemon as its own neighbour
+            squared[np.arange(stop - start), np.arange(start, stop)] = np.inf
+            candidates = np.argpartition(squared, k, axis=1)[:, :k] if k < len(self) - 1 else np.argsort(squared, axis=1)[:, :k]
+            candidate_distances = np.take_along_axis(squared, candidates, axis=1)
+            order = np.argsort(candidate_distances, axis=1, kind="stable")
+            indices[start:stop] = np.take_along_axis(candidates, order, axis=1)
+            distances[start:stop] = np.sqrt(np.take_along_axis(candidate_distances, order, axis=1))
+        return indices, distances
+
+    # Serialization
+    def to_dict(self, k: int = 10) -> Dict:
+        """Compact form: neighbours are row indices into names, best first"""
+        indices, distances = self.all_neighbors(k)
+        return {
+            "version": 1,
+            "names": self.names.tolist(),
+            "neighbors": indices.tolist(),
+            "similarity": np.round(1 / (1 + distances), 3).tolist(),
+        }
+
+
+if __name__ == "__main__":
+    import time
+    from data_store import get_store
+
+    index = get_store().similarity_index()
+    if len(index):
+        name = sys.argv[1] if len(sys.argv) > 1 else index.names[0]
+        index.similar(name)
+        start = time.perf_counter()
+        results = index.similar(name)
+        elapsed = (time.perf_counter() - start) * 1e6
+        backend = "KD-tree" if index.tree is not None else "brute force"
+        print(f"Most similar to {name} ({backend}, {elapsed:.0f} µs):")
+        for result in results:
+            print(f"  {result}")
@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - SQLite Store
+Optional SQLite copy of the whole dataset (Pokemon, every moves generation,
+abilities, item categories and games) with indexes on name, dex number,
+type, game and move. Runs in WAL mode so readers keep querying while a
+scraper writes.
+
+Each record keeps its full JSON in a `data` column; the typed columns and
+side tables (types, abilities, games, move learners) are what the indexes
+cover. Move learners are stored only as rows, not inside the move JSON.
+The upsert_* methods take records exactly as the scrapers produce them,
+and import_json()/export_json() convert from and to the JSON files.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+sys.path.append(os.path.dirname(__file__))
+from config import (
+    PokeDataUtils,
+    DATA_FILES,
+    MOVES_FILE_TEMPLATE,
+    MOVE_GENERATIONS,
+    ITEMS_CATEGORY_DIR,
+    SQLITE_DB_FILE,
+)
+import serialization
+from lookup import normalize_dex_number, record_sets
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SCHEMA_VERSION = 1
+# Milliseconds a connection waits on a locked database before failing
+BUSY_TIMEOUT = 5000
+# Learner keys with their own columns; anything else goes to `extra`
+LEARNER_FIELDS = ("dex_number", "name", "form", "method", "level")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    path TEXT PRIMARY KEY,
+    metadata TEXT
+);
+
+CREATE TABLE IF NOT EXISTS pokemon (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    number INTEGER,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pokemon_name ON pokemon (name_key);
+CREATE INDEX IF NOT EXISTS pokemon_number ON pokemon (number);
+
+CREATE TABLE IF NOT EXISTS pokemon_types (
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon (id) ON DELETE CASCADE,
+    slot INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (pokemon_id, slot)
+);
+CREATE INDEX IF NOT EXISTS pokemon_types_type ON pokemon_types (type, pokemon_id);
+
+CREATE TABLE IF NOT EXISTS pokemon_abilities (
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon (id) ON DELETE CASCADE,
+    ability_key TEXT NOT NULL,
+    hidden INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pokemon_abilities_ability ON pokemon_abilities (ability_key, pokemon_id);
+CREATE INDEX IF NOT EXISTS pokemon_abilities_pokemon ON pokemon_abilities (pokemon_id);
+
+CREATE TABLE IF NOT EXISTS pokemon_games (
+    pokemon_id INTEGER NOT NULL REFERENCES pokemon (id) ON DELETE CASCADE,
+    game TEXT NOT NULL,
+    PRIMARY KEY (pokemon_id, game)
+);
+CREATE INDEX IF NOT EXISTS pokemon_games_game ON pokemon_games (game, pokemon_id);
+
+CREATE TABLE IF NOT EXISTS moves (
+    id INTEGER PRIMARY KEY,
+    generation INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    type TEXT,
+    category TEXT,
+    power INTEGER,
+    accuracy INTEGER,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (generation, name_key)
+);
+CREATE INDEX IF NOT EXISTS moves_name ON moves (name_key);
+CREATE INDEX IF NOT EXISTS moves_type ON moves (generation, type);
+
+CREATE TABLE IF NOT EXISTS move_learners (
+    move_id INTEGER NOT NULL REFERENCES moves (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    pokemon_key TEXT NOT NULL,
+    dex_number TEXT,
+    name TEXT,
+    form TEXT,
+    method TEXT,
+    level INTEGER,
+    extra TEXT,
+    PRIMARY KEY (move_id, position)
+);
+CREATE INDEX IF NOT EXISTS move_learners_pokemon ON move_learners (pokemon_key, move_id);
+
+CREATE TABLE IF NOT EXISTS abilities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL UNIQUE,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    category TEXT,
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (path, key)
+);
+CREATE INDEX IF NOT EXISTS items_name ON items (name_key);
+
+CREATE TABLE IF NOT EXISTS game_groups (
+    id INTEGER PRIMARY KEY,
+    generation INTEGER,
+    region TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (generation, region)
+);
+
+CREATE TABLE IF NOT EXISTS games (
+    name TEXT PRIMARY KEY,
+    group_id INTEGER NOT NULL REFERENCES game_groups (id) ON DELETE CASCADE,
+    generation INTEGER
+);
+"""
+
+
+def _encode(data: Any) -> str:
+    return serialization.dumps(data, compact=True).decode("utf-8")
+
+
+def _decode(text: Optional[str]) -> Any:
+    return serialization.loads(text) if text is not None else None
+
+
+def category_file(category: str) -> str:
+    """Project-relative items file for a category ('Poké Balls' -> .../poké_balls.json)"""
+    return f"{ITEMS_CATEGORY_DIR}/{category.lower().replace(' ', '_')}.json"
+
+
+def _item_key(item: Dict) -> str:
+    # The url tells apart items sharing a name (a Legends: Arceus Great Ball)
+    return item.get("url") or PokeDataUtils.normalize_key(item.get("name", ""))
+
+
+class SQLiteStore:
+    """SQLite database holding every dataset; one connection per thread"""
+
+    def __init__(self, path: Optional[str] = None, readonly: bool = False):
+        self.path = path or os.path.join(PROJECT_ROOT, SQLITE_DB_FILE)
+        self.readonly = readonly
+        self._local = threading.local()
+        if not readonly:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with self.connection() as conn:
+                conn.executescript(SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection (WAL mode, foreign keys on)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self.readonly:
+                conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            else:
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode = WAL")
+                # In WAL mode NORMAL cannot corrupt the database and skips an fsync per commit
+                conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT}")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # Upserts (one transaction per call)
+    def set_metadata(self, path: str, metadata: Optional[Dict]):
+        """Store the metadata block written at the top of a dataset file"""
+        with self.connection() as conn:
+            conn.execute(
+                "INSERT INTO datasets (path, metadata) VALUES (?, ?) "
+                "ON CONFLICT (path) DO UPDATE SET metadata = excluded.metadata",
+                (path, _encode(metadata) if metadata is not None else None),
+            )
+
+    def upsert_pokemon(self, records: Iterable[Dict]) -> int:
+        """Insert or replace Pokemon records (keyed by ref_id, else name)"""
+        count = 0
+        with self.connection() as conn:
+            for record in records:
+                name = record.get("name", "")
+                key = record.get("ref_id") or PokeDataUtils.normalize_key(name)
+                conn.execute(
+                    "INSERT INTO pokemon (key, number, name, name_key, position, data) "
+                    "VALUES (?, ?, ?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM pokemon), ?) "
+                    "ON CONFLICT (key) DO UPDATE SET number = excluded.number, name = excluded.name, "
+                    "name_key = excluded.name_key, data = excluded.data",
+                    (key, normalize_dex_number(record.get("number")), name,
+                     PokeDataUtils.normalize_key(name), _encode(record)),
+                )
+                pokemon_id = conn.execute("SELECT id FROM pokemon WHERE key = ?", (key,)).fetchone()[0]
+                self._index_pokemon(conn, pokemon_id, record)
+                count += 1
+        return count
+
+    @staticmethod
+    def _index_pokemon(conn: sqlite3.Connection, pokemon_id: int, record: Dict):
+        for table in ("pokemon_types", "pokemon_abilities", "pokemon_games"):
+            conn.execute(f"DELETE FROM {table} WHERE pokemon_id = ?", (pokemon_id,))
+        sets = record_sets(record)
+        conn.executemany(
+            "INSERT OR IGNORE INTO pokemon_types (pokemon_id, slot, type) VALUES (?, ?, ?)",
+            [(pokemon_id, slot, PokeDataUtils.normalize_key(t)) for slot, t in enumerate(sets["types"])],
+        )
+        abilities = [(a, 0) for a in sets["abilities"]] + [(a, 1) for a in sets["hidden_abilities"]]
+        conn.executemany(
+            "INSERT INTO pokemon_abilities (pokemon_id, ability_key, hidden) VALUES (?, ?, ?)",
+            [(pokemon_id, PokeDataUtils.normalize_key(a), hidden) for a, hidden in abilities],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO pokemon_games (pokemon_id, game) VALUES (?, ?)",
+            [(pokemon_id, PokeDataUtils.normalize_key(game)) for game in sets["games"]],
+        )
+
+    def upsert_moves(self, generation: int, moves: Iterable[Dict]) -> int:
+        """Insert or replace one generation's moves and their learners"""
+        count = 0
+        with self.connection() as conn:
+            for move in moves:
+                name = move.get("name", "")
+                name_key = PokeDataUtils.normalize_key(name)
+                data = {field: value for field, value in move.items() if field != "learned_by"}
+                power = move.get("base_power")
+                accuracy = move.get("accuracy")
+                conn.execute(
+                    "INSERT INTO moves (generation, name, name_key, type, category, power, accuracy, position, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, "
+                    "(SELECT COALESCE(MAX(position), -1) + 1 FROM moves WHERE generation = ?), ?) "
+                    "ON CONFLICT (generation, name_key) DO UPDATE SET name = excluded.name, type = excluded.type, "
+                    "category = excluded.category, power = excluded.power, accuracy = excluded.accuracy, "
+                    "data = excluded.data",
+                    (generation, name, name_key, move.get("battle_type"), move.get("category"),
+                     power if isinstance(power, int) else None,
+                     accuracy if isinstance(accuracy, int) else None,
+                     generation, _encode(data)),
+                )
+                move_id = conn.execute(
+                    "SELECT id FROM moves WHERE generation = ? AND name_key = ?", (generation, name_key)
+                ).fetchone()[0]
+                conn.execute("DELETE FROM move_learners WHERE move_id = ?", (move_id,))
+                conn.executemany(
+                    "INSERT INTO move_learners (move_id, position, pokemon_key, dex_number, name, form, method, "
+                    "level, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [self._learner_row(move_id, position, learner)
+                     for position, learner in enumerate(move.get("learned_by") or [])],
+                )
+                count += 1
+        return count
+
+    @staticmethod
+    def _learner_row(move_id: int, position: int, learner: Dict) -> tuple:
+        extra = {field: value for field, value in learner.items() if field not in LEARNER_FIELDS}
+        return (
+            move_id,
+            position,
+            PokeDataUtils.normalize_key(learner.get("name") or ""),
+            learner.get("dex_number"),
+            learner.get("name"),
+            learner.get("form"),
+            learner.get("method"),
+            learner.get("level"),
+            _encode(extra) if extra else None,
+        )
+
+    def upsert_abilities(self, abilities: Iterable[Dict]) -> int:
+        count = 0
+        with self.connection() as conn:
+            for ability in abilities:
+                name = ability.get("name", "")
+                conn.execute(
+                    "INSERT INTO abilities (name, name_key, position, data) "
+                    "VALUES (?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM abilities), ?) "
+                    "ON CONFLICT (name_key) DO UPDATE SET name = excluded.name, data = excluded.data",
+                    (name, PokeDataUtils.normalize_key(name), _encode(ability)),
+                )
+                count += 1
+        return count
+
+    def upsert_items(self, category: str, items: Iterable[Dict], path: Optional[str] = None) -> int:
+        """Insert or replace one category's items (keyed by url, else name).
+        Exact duplicates in a category file collapse into one row."""
+        path = path or category_file(category)
+        count = 0
+        with self.connection() as conn:
+            for item in items:
+                name = item.get("name", "")
+                conn.execute(
+                    "INSERT INTO items (path, category, key, name, name_key, position, data) "
+                    "VALUES (?, ?, ?, ?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM items WHERE path = ?), ?) "
+                    "ON CONFLICT (path, key) DO UPDATE SET category = excluded.category, name = excluded.name, "
+                    "name_key = excluded.name_key, data = excluded.data",
+                    (path, category, _item_key(item), name, PokeDataUtils.normalize_key(name), path, _encode(item)),
+                )
+                count += 1
+        return count
+
+    def upsert_games(self, groups: Iterable[Dict]) -> int:
+        """Insert or replace game groups as stored in pokemon_games.json"""
+        count = 0
+        with self.connection() as conn:
+            for group in groups:
+                generation = group.get("generation")
+                region = group.get("region") or ""
+                conn.execute(
+                    "INSERT INTO game_groups (generation, region, position, data) "
+                    "VALUES (?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM game_groups), ?) "
+                    "ON CONFLICT (generation, region) DO UPDATE SET data = excluded.data",
+                    (generation, region, _encode(group)),
+                )
+                group_id = conn.execute(
+                    "SELECT id FROM game_groups WHERE generation IS ? AND region = ?", (generation, region)
+                ).fetchone()[0]
+                conn.execute("DELETE FROM games WHERE group_id = ?", (group_id,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO games (name, group_id, generation) VALUES (?, ?, ?)",
+                    [(game, group_id, generation) for game in group.get("games", [])],
+                )
+                count += 1
+        return count
+
+    # JSON import/export
+    def import_file(self, path: str, data: Any) -> int:
+        """Upsert the parsed contents of one dataset file (project-relative path)"""
+        path = path.replace(os.sep, "/")
+        if path == DATA_FILES["pokemon"]:
+            return self.upsert_pokemon(data if isinstance(data, list) else [])
+        if path == DATA_FILES["games"]:
+            return self.upsert_games(data if isinstance(data, list) else [])
+        if not isinstance(data, dict):
+            return 0
+        self.set_metadata(path, data.get("metadata"))
+        if path == DATA_FILES["abilities"]:
+            return self.upsert_abilities(data.get("abilities", []))
+        for generation in MOVE_GENERATIONS:
+            if path == MOVES_FILE_TEMPLATE.format(generation=generation):
+                return self.upsert_moves(generation, data.get("moves", []))
+        if path.startswith(ITEMS_CATEGORY_DIR + "/"):
+            category = (data.get("metadata") or {}).get("category") or ""
+            return self.upsert_items(category, data.get("items", []), path)
+        raise ValueError(f"Not a dataset file: {path}")
+
+    def import_json(self, store=None) -> Dict[str, int]:
+        """Upsert every dataset file the DataStore knows about; path -> records"""
+        if store is None:
+            from data_store import get_store
+
+            store = get_store()
+        paths = [DATA_FILES["pokemon"], DATA_FILES["games"], DATA_FILES["abilities"]]
+        paths += [MOVES_FILE_TEMPLATE.format(generation=g) for g in MOVE_GENERATIONS]
+        paths += [path.replace(os.sep, "/") for path in store.item_category_files()]
+        counts = {}
+        for path in paths:
+            if os.path.exists(store.resolve(path)):
+                counts[path] = self.import_file(path, store.load(path))
+        return counts
+
+    def _metadata(self, path: str) -> Optional[Dict]:
+        row = self.connection().execute("SELECT metadata FROM datasets WHERE path = ?", (path,)).fetchone()
+        return _decode(row[0]) if row else None
+
+    def _moves(self, where: str, params: tuple) -> List[Dict]:
+        conn = self.connection()
+        rows = conn.execute(f"SELECT id, data FROM moves WHERE {where} ORDER BY generation, position", params).fetchall()
+        moves = []
+        for move_id, data in rows:
+            move = _decode(data)
+            move["learned_by"] = [
+                self._learner(*row)
+                for row in conn.execute(
+                    "SELECT dex_number, name, form, method, level, extra FROM move_learners "
+                    "WHERE move_id = ? ORDER BY position",
+                    (move_id,),
+                )
+            ]
+            moves.append(move)
+        return moves
+
+    @staticmethod
+    def _learner(dex_number, name, form, method, level, extra) -> Dict:
+        learner = {"dex_number": dex_number, "name": name, "form": form, "method": method}
+        if level is not None:
+            learner["level"] = level
+        if extra:
+            learner.update(_decode(extra))
+        return learner
+
+    def export_json(self, root: str = PROJECT_ROOT) -> List[str]:
+        """Write the JSON dataset files under `root` from the database"""
+        conn = self.connection()
+        written = []
+
+        def write(path: str, data: Any):
+            PokeDataUtils.save_json_data(data, os.path.join(root, path))
+            written.append(path)
+
+        pokemon = [_decode(data) for (data,) in conn.execute("SELECT data FROM pokemon ORDER BY position")]
+        if pokemon:
+            write(DATA_FILES["pokemon"], pokemon)
+        groups = [_decode(data) for (data,) in conn.execute("SELECT data FROM game_groups ORDER BY position")]
+        if groups:
+            write(DATA_FILES["games"], groups)
+        abilities = [_decode(data) for (data,) in conn.execute("SELECT data FROM abilities ORDER BY position")]
+        if abilities:
+            write(DATA_FILES["abilities"], {"metadata": self._metadata(DATA_FILES["abilities"]) or {},
+                                            "abilities": abilities})
+        for (generation,) in conn.execute("SELECT DISTINCT generation FROM moves ORDER BY generation").fetchall():
+            path = MOVES_FILE_TEMPLATE.format(generation=generation)
+            write(path, {"metadata": self._metadata(path) or {},
+                         "moves": self._moves("generation = ?", (generation,))})
+        for (path,) in conn.execute("SELECT DISTINCT path FROM items ORDER BY path").fetchall():
+            items = [_decode(data) for (data,) in
+                     conn.execute("SELECT data FROM items WHERE path = ? ORDER BY position", (path,))]
+            write(path, {"metadata": self._metadata(path) or {}, "items": items})
+        return written
+
+    # Indexed queries
+    def _pokemon(self, sql: str, params: tuple) -> List[Dict]:
+        return [_decode(data) for (data,) in self.connection().execute(sql, params)]
+
+    def pokemon_by_name(self, name: str) -> List[Dict]:
+        """Every form whose name matches (case, accents and punctuation ignored)"""
+        return self._pokemon(
+            "SELECT data FROM pokemon WHERE name_key = ? ORDER BY position", (PokeDataUtils.normalize_key(name),)
+        )
+
+    def pokemon_by_number(self, number) -> List[Dict]:
+        return self._pokemon(
+            "SELECT data FROM pokemon WHERE number = ? ORDER BY position", (normalize_dex_number(number),)
+        )
+
+    def pokemon_by_type(self, *types: str) -> List[Dict]:
+        """Pokemon having every given type"""
+        keys = [PokeDataUtils.normalize_key(t) for t in types]
+        return self._pokemon(
+            "SELECT data FROM pokemon WHERE id IN (SELECT pokemon_id FROM pokemon_types "
+            f"WHERE type IN ({', '.join('?' * len(keys))}) GROUP BY pokemon_id HAVING COUNT(DISTINCT type) = ?) "
+            "ORDER BY position",
+            (*keys, len(set(keys))),
+        )
+
+    def pokemon_with_ability(self, ability: str, hidden: Optional[bool] = None) -> List[Dict]:
+        sql = "SELECT pokemon_id FROM pokemon_abilities WHERE ability_key = ?"
+        params: tuple = (PokeDataUtils.normalize_key(ability),)
+        if hidden is not None:
+            sql += " AND hidden = ?"
+            params += (int(hidden),)
+        return self._pokemon(f"SELECT data FROM pokemon WHERE id IN ({sql}) ORDER BY position", params)
+
+    def pokemon_in_game(self, game: str) -> List[Dict]:
+        """Pokemon available in a game"""
+        return self._pokemon(
+            "SELECT data FROM pokemon WHERE id IN (SELECT pokemon_id FROM pokemon_games WHERE game = ?) "
+            "ORDER BY position",
+            (PokeDataUtils.normalize_key(game),),
+        )
+
+    def move(self, name: str, generation: int = MOVE_GENERATIONS[-1]) -> Optional[Dict]:
+        moves = self._moves("generation = ? AND name_key = ?", (generation, PokeDataUtils.normalize_key(name)))
+        return moves[0] if moves else None
+
+    def move_learners(self, move: str, generation: int = MOVE_GENERATIONS[-1]) -> List[Dict]:
+        found = self.move(move, generation)
+        return found["learned_by"] if found else []
+
+    def learnset(self, pokemon: str, generation: int = MOVE_GENERATIONS[-1]) -> List[Dict]:
+        """[{move, method, level, form}] for one Pokemon in a generation"""
+        rows = self.connection().execute(
+            "SELECT m.name, l.method, l.level, l.form FROM move_learners l JOIN moves m ON m.id = l.move_id "
+            "WHERE l.pokemon_key = ? AND m.generation = ? ORDER BY m.position, l.position",
+            (PokeDataUtils.normalize_key(pokemon), generation),
+        )
+        return [{"move": move, "method": method, "level": level, "form": form} for move, method, level, form in rows]
+
+    def ability(self, name: str) -> Optional[Dict]:
+        row = self.connection().execute(
+            "SELECT data FROM abilities WHERE name_key = ?", (PokeDataUtils.normalize_key(name),)
+        ).fetchone()
+        return _decode(row[0]) if row else None
+
+    def items_by_name(self, name: str) -> List[Dict]:
+        return [
+            _decode(data)
+            for (data,) in self.connection().execute(
+                "SELECT data FROM items WHERE name_key = ? ORDER BY path, position",
+                (PokeDataUtils.normalize_key(name),),
+            )
+        ]
+
+    def games(self, generation: Optional[int] = None) -> List[str]:
+        sql = "SELECT g.name FROM games g JOIN game_groups gg ON gg.id = g.group_id"
+        params: tuple = ()
+        if generation is not None:
+            sql += " WHERE g.generation = ?"
+            params = (generation,)
+        return [name for (name,) in self.connection().execute(sql + " ORDER BY gg.position, g.rowid", params)]
+
+    def counts(self) -> Dict[str, int]:
+        conn = self.connection()
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("pokemon", "moves", "move_learners", "abilities", "items", "games")
+        }
+
+
+if __name__ == "__main__":
+    import time
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "import"
+    db = SQLiteStore(sys.argv[2] if len(sys.argv) > 2 else None)
+    if command == "import":
+        start = time.perf_counter()
+        counts = db.import_json()
+        print(f"Imported {sum(counts.values())} records from {len(counts)} files "
+              f"in {time.perf_counter() - start:.1f}s -> {db.path}")
+        print(f"  {db.counts()}")
+    elif command == "export":
+        root = sys.argv[3] if len(sys.argv) > 3 else PROJECT_ROOT
+        for path in db.export_json(root):
+            print(f"  wrote {path}")
+    else:
+        print("Usage: sqlite_store.py [import|export] [database] [export root]")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    dragons = db.pokemon_by_type("Dragon")
+    print(f"Dragon types: {len(dragons)} ({(time.perf_counter() - start) * 1000:.2f} ms)")
+    learners = db.move_learners("Earthquake")
+    print(f"Earthquake learners (Gen {MOVE_GENERATIONS[-1]}): {len(learners)}")
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Base Stat Analytics
+A species x stat matrix (HP, Atk, Def, SpA, SpD, Spe, BST) built on the
+columnar PokemonTable, with vectorized rank, percentile, z-score and grouped
+top-k by type, generation and game availability. Groups can be any query
+expression, e.g. "BST percentile of Garchomp within types has Dragon".
+"""
+
+import os
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from query_engine import PokemonTable, QueryError
+
+STAT_NAMES = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed", "total")
+GROUP_COLUMNS = ("types", "generation", "games")
+
+
+class StatMatrix:
+    """Base stats of every row of a PokemonTable as one float matrix"""
+
+    def __init__(self, table: PokemonTable):
+        self.table = table
+        self.values = np.column_stack(
+            [table.numeric[f"base_stats.{stat}"] for stat in STAT_NAMES]
+        ) if len(table) else np.empty((0, len(STAT_NAMES)))
+        self.names = table.text["name"]
+        self.numbers = table.numeric["number"]
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    @staticmethod
+    def _stat_index(stat: str) -> int:
+        stat = "total" if stat in ("bst", "base_stats.total") else stat
+        stat = stat.replace("base_stats.", "")
+        if stat not in STAT_NAMES:
+            raise QueryError(f"Unknown stat '{stat}'. Choose from {', '.join(STAT_NAMES)}")
+        return STAT_NAMES.index(stat)
+
+    def _group_mask(self, within: Optional[str]) -> np.ndarray:
+        return self.table.mask(within)
+
+    def _row(self, name: str) -> int:
+        rows = self.table.rows(f"name == {name!r}")
+        if not len(rows):
+            raise QueryError(f"Unknown Pokemon '{name}'")
+        return int(rows[0])
+
+    # Vectorized statistics over a group (NaN stats are left out)
+    def ranks(self, within: Optional[str] = None) -> np.ndarray:
+        """Competition rank (1 = highest) of every row per stat within a group"""
+        group = self._group_mask(within)
+        ranks = np.full(self.values.shape, np.nan)
+        for column in range(len(STAT_NAMES)):
+            values = self.values[:, column]
+            valid = group & ~np.isnan(values)
+            ordered = np.sort(values[valid])
+            ranks[valid, column] = (
+                len(ordered) - np.searchsorted(ordered, values[valid], side="right") + 1
+            )
+        return ranks
+
+    def percentiles(self, within: Optional[str] = None) -> np.ndarray:
+        """Percent of the group at or below each row's value, per stat"""
+        group = self._group_mask(within)
+        percentiles = np.full(self.values.shape, np.nan)
+        for column in range(len(STAT_NAMES)):
+            values = self.values[:, column]
+            valid = group & ~np.isnan(values)
+            ordered = np.sort(values[valid])
+            if len(ordered):
+                percentiles[valid, column] = (
+                    np.searchsorted(ordered, values[valid], side="right") / len(ordered) * 100
+                )
+        return percentiles
+
+    def zscores(self, within: Optional[str] = None) -> np.ndarray:
+        """Standard score of every row per stat relative to the group"""
+        group = self._group_mask(within)
+        members = np.where(group[:, None], self.values, np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nanmean(members, axis=0)
+            std = np.nanstd(members, axis=0)
+            scores = (members - mean) / np.where(std > 0, std, np.nan)
+        return scores
+
+    def _top_rows(self, column: int, k: int, group: np.ndarray) -> np.ndarray:
+        values = self.values[:, column]
+        rows = np.flatnonzero(group & ~np.isnan(values))
+        return rows[np.lexsort((self.numbers[rows], -values[rows]))[:k]]
+
+    def _groups(self, group_by: str) -> Dict[str, np.ndarray]:
+        """Masks for every value of a group column (types, generation, games)"""
+        column = self.table._resolve(group_by)
+        if column == "generation":
+            generations = self.table.numeric["generation"]
+            return {
+                str(int(gen)): generations == gen
+                for gen in np.unique(generations)
+                if not np.isnan(gen)
+            }
+        if column not in self.table.sets:
+            raise QueryError(f"Cannot group by '{group_by}'. Choose from {GROUP_COLUMNS}")
+        labels = self.table.labels[column]
+        matrix = self.table.sets[column]
+        return {labels[code]: matrix[:, code] for code in np.argsort(labels)}
+
+    def top_k(self, stat: str, k: int = 10, within: Optional[str] = None) -> List[Dict]:
+        """Highest k rows for a stat within a group, ties in dex order"""
+        column = self._stat_index(stat)
+        return [
+            {
+                "name": self.names[row],
+                "number": int(self.numbers[row]),
+                stat: int(self.values[row, column]),
+            }
+            for row in self._top_rows(column, k, self._group_mask(within))
+        ]
+
+    def grouped_top_k(self, stat: str, group_by: str, k: int = 10) -> Dict[str, List[Dict]]:
+        """top_k for every value of a group column (types, generation, games)"""
+        column = self._stat_index(stat)
+        return {
+            label: [
+                {
+                    "name": self.names[row],
+                    "number": int(self.numbers[row]),
+                    stat: int(self.values[row, column]),
+                }
+                for row in self._top_rows(column, k, group)
+            ]
+            for label, group in self._groups(group_by).items()
+        }
+
+    def profile(self, name: str, within: Optional[str] = None) -> Dict[str, Dict]:
+        """Value, rank, percentile and z-score of one Pokemon for every stat"""
+        row = self._row(name)
+        ranks = self.ranks(within)[row]
+        percentiles = self.percentiles(within)[row]
+        zscores = self.zscores(within)[row]
+        group_size = int(np.count_nonzero(self._group_mask(within)))
+        profile = {}
+        for column, stat in enumerate(STAT_NAMES):
+            if np.isnan(self.values[row, column]):
+                continue
+            profile[stat] = {
+                "value": int(self.values[row, column]),
+                "rank": None if np.isnan(ranks[column]) else int(ranks[column]),
+                "percentile": None if np.isnan(percentiles[column]) else round(float(percentiles[column]), 1),
+                "zscore": None if np.isnan(zscores[column]) else round(float(zscores[column]), 2),
+                "group_size": group_size,
+            }
+        return profile
+
+    # Serialization
+    def to_dict(self, k: int = 10) -> Dict:
+        """Compact form for the web pages.
+
+        rows: [number, name, [stats], [overall percentiles]] per Pokemon
+        top: group column -> group value -> stat -> row indices (best first)
+        """
+        percentiles = self.percentiles()
+        rows = []
+        for row in range(len(self)):
+            rows.append(
+                [
+                    None if np.isnan(self.numbers[row]) else int(self.numbers[row]),
+                    self.names[row],
+                    [None if np.isnan(v) else int(v) for v in self.values[row]],
+                    [None if np.isnan(p) else int(round(p)) for p in percentiles[row]],
+                ]
+            )
+
+        top = {}
+        for group_by in GROUP_COLUMNS:
+            top[group_by] = {
+                label: {
+                    stat: self._top_rows(column, k, group).tolist()
+                    for column, stat in enumerate(STAT_NAMES)
+                }
+                for label, group in self._groups(group_by).items()
+            }
+
+        return {"version": 1, "stats": list(STAT_NAMES), "rows": rows, "top": top}
+
+
+if __name__ == "__main__":
+    from data_store import get_store
+
+    matrix = get_store().stat_matrix()
+    print("Top 10 Speed in Gen 4:")
+    for entry in matrix.top_k("speed", 10, "generation == 4"):
+        print(f"  {entry}")
+    if len(matrix):
+        name = matrix.names[len(matrix) // 2]
+        print(f"\n{name} within its first type:")
+        types = matrix.table.column_values("types", np.array([matrix._row(name)]))[0]
+        within = f"types has {types[0]!r}" if types else None
+        for stat, info in matrix.profile(name, within).items():
+            print(f"  {stat:<10} {info}")
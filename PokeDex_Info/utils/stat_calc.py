@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Stat Calculator
+Vectorized final-stat formulas for every species (and form) at once, for any
+level, IV/EV spread and nature. Gen 3+ uses IVs 0-31, EVs 0-252 and natures;
+Gen 1-2 use DVs 0-15 (HP DV derived from the others), stat experience 0-65535
+and no natures. Also builds per-generation speed tier tables.
+"""
+
+import os
+import sys
+from typing import Dict, Union
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from config import MOVE_GENERATIONS
+
+STATS = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed")
+HP, ATTACK, DEFENSE, SP_ATTACK, SP_DEFENSE, SPEED = range(len(STATS))
+
+# Nature -> (raised stat, lowered stat); neutral natures are omitted
+NATURES = {
+    "Lonely": ("attack", "defense"), "Brave": ("attack", "speed"),
+    "Adamant": ("attack", "sp_attack"), "Naughty": ("attack", "sp_defense"),
+    "Bold": ("defense", "attack"), "Relaxed": ("defense", "speed"),
+    "Impish": ("defense", "sp_attack"), "Lax": ("defense", "sp_defense"),
+    "Timid": ("speed", "attack"), "Hasty": ("speed", "defense"),
+    "Jolly": ("speed", "sp_attack"), "Naive": ("speed", "sp_defense"),
+    "Modest": ("sp_attack", "attack"), "Mild": ("sp_attack", "defense"),
+    "Quiet": ("sp_attack", "speed"), "Rash": ("sp_attack", "sp_defense"),
+    "Calm": ("sp_defense", "attack"), "Gentle": ("sp_defense", "defense"),
+    "Sassy": ("sp_defense", "speed"), "Careful": ("sp_defense", "sp_attack"),
+}
+MAX_DV = 15
+MAX_STAT_EXP = 65535
+
+SpreadValue = Union[int, Dict[str, int]]
+
+
+def nature_multipliers(nature: str) -> np.ndarray:
+    """Per-stat multipliers (1.1 / 0.9 / 1.0) for a nature name"""
+    multipliers = np.ones(len(STATS))
+    raised, lowered = NATURES.get((nature or "").title(), (None, None))
+    if raised:
+        multipliers[STATS.index(raised)] = 1.1
+        multipliers[STATS.index(lowered)] = 0.9
+    return multipliers
+
+
+def nature_table() -> Dict[str, np.ndarray]:
+    """Multipliers for all 25 natures (the five neutral ones included)"""
+    table = {name: nature_multipliers(name) for name in NATURES}
+    for neutral in ("Hardy", "Docile", "Serious", "Bashful", "Quirky"):
+        table[neutral] = np.ones(len(STATS))
+    return table
+
+
+class Spread:
+    """Level, IVs, EVs and nature shared by a batch of Pokemon.
+
+    For Gen 1-2 the IVs are read as DVs (capped at 15) and the EVs as stat
+    experience; natures are ignored.
+    """
+
+    def __init__(self, level: int = 50, ivs: SpreadValue = 31, evs: SpreadValue = 0, nature: str = "Hardy"):
+        self.level = level
+        self.ivs = self._per_stat(ivs)
+        self.evs = self._per_stat(evs)
+        self.nature = nature
+
+    @staticmethod
+    def _per_stat(value: SpreadValue) -> np.ndarray:
+        if isinstance(value, dict):
+            return np.array([value.get(stat, 0) for stat in STATS], dtype=float)
+        return np.full(len(STATS), float(value))
+
+    def nature_multipliers(self) -> np.ndarray:
+        return nature_multipliers(self.nature)
+
+
+def modern_stats(base, level, ivs, evs, natures) -> np.ndarray:
+    """Gen 3+ formula.
+
+    base, ivs, evs and natures broadcast as (..., 6); level broadcasts
+    against the same shape without the stat axis.
+    """
+    base = np.asarray(base, dtype=float)
+    level = np.asarray(level, dtype=float)
+    core = np.floor((2 * base + ivs + np.floor(np.asarray(evs) / 4)) * level[..., None] / 100)
+    stats = np.floor((core + 5) * natures)
+    # Shedinja (base HP 1) always has 1 HP
+    stats[..., HP] = np.where(base[..., HP] == 1, 1, core[..., HP] + level + 10)
+    return stats
+
+
+def legacy_stats(base, level, dvs, stat_exp, generation: int = 2) -> np.ndarray:
+    """Gen 1-2 formula with DVs and stat experience.
+
+    The HP DV is built from the low bits of the Attack, Defense, Speed and
+    Special DVs. Gen 1 has a single Special stat, taken from the Sp. Atk
+    base and shared by both special columns.
+    """
+    base = np.array(base, dtype=float)
+    level = np.asarray(level, dtype=float)
+    dvs = np.broadcast_to(np.minimum(np.asarray(dvs, dtype=int), MAX_DV), base.shape).copy()
+    stat_exp = np.minimum(np.asarray(stat_exp, dtype=float), MAX_STAT_EXP)
+
+    # Special shares one DV in both generations
+    dvs[..., SP_DEFENSE] = dvs[..., SP_ATTACK]
+    dvs[..., HP] = (
+        (dvs[..., ATTACK] & 1) * 8
+        + (dvs[..., DEFENSE] & 1) * 4
+        + (dvs[..., SPEED] & 1) * 2
+        + (dvs[..., SP_ATTACK] & 1)
+    )
+    if generation == 1:
+        base[..., SP_DEFENSE] = base[..., SP_ATTACK]
+
+    exp_bonus = np.floor(np.ceil(np.sqrt(stat_exp)) / 4)
+    core = np.floor(((base + dvs) * 2 + exp_bonus) * level[..., None] / 100)
+    stats = core + 5
+    stats[..., HP] = core[..., HP] + level + 10
+    return stats
+
+
+def calculate_stats(base_stats: np.ndarray, spread: Spread, generation: int = MOVE_GENERATIONS[-1]) -> np.ndarray:
+    """Final stats for a (species x 6) base stat matrix under one spread"""
+    if generation <= 2:
+        return legacy_stats(base_stats, spread.level, spread.ivs, spread.evs, generation)
+    return modern_stats(base_stats, spread.level, spread.ivs, spread.evs, spread.nature_multipliers())
+
+
+def calculate_stat_grid(
+    base_stats: np.ndarray,
+    levels: np.ndarray,
+    ivs: np.ndarray,
+    evs: np.ndarray,
+    natures: np.ndarray,
+) -> np.ndarray:
+    """Stats for every species under every spread: (spreads x species x 6).
+
+    levels is (spreads,), ivs/evs/natures are (spreads x 6).
+    """
+    return modern_stats(
+        base_stats[None, :, :],
+        np.asarray(levels, dtype=float)[:, None],
+        np.asarray(ivs)[:, None, :],
+        np.asarray(evs)[:, None, :],
+        np.asarray(natures)[:, None, :],
+    )
+
+
+# Speed tiers
+def tier_spreads(generation: int) -> Dict[str, Spread]:
+    """Benchmark speed investments for a generation"""
+    if generation <= 2:
+        return {
+            "max": Spread(100, MAX_DV, MAX_STAT_EXP),
+            "none": Spread(100, MAX_DV, 0),
+            "min": Spread(100, 0, 0),
+        }
+    return {
+        "max_positive": Spread(50, 31, 252, "Timid"),
+        "max_neutral": Spread(50, 31, 252, "Hardy"),
+        "neutral": Spread(50, 31, 0, "Hardy"),
+        "min_negative": Spread(50, 0, 0, "Brave"),
+    }
+
+
+def speed_tiers(table, generation: int) -> Dict:
+    """Speed of every species available by a generation under each benchmark spread.
+
+    Rows are sorted fastest first: [name, speed per spread...].
+    """
+    rows = np.flatnonzero(
+        (table.numeric["generation"] <= generation)
+        & ~np.isnan(table.numeric["base_stats.speed"])
+    )
+    base = np.column_stack([table.numeric[f"base_stats.{stat}"] for stat in STATS])[rows]
+    base = np.nan_to_num(base)
+    spreads = tier_spreads(generation)
+    speeds = np.column_stack(
+        [calculate_stats(base, spread, generation)[:, SPEED] for spread in spreads.values()]
+    ).astype(int)
+    names = table.text["name"][rows]
+    order = np.lexsort((table.numeric["number"][rows], -speeds[:, 0]))
+    return {
+        "level": next(iter(spreads.values())).level,
+        "spreads": list(spreads),
+        "rows": [[names[i], *speeds[i].tolist()] for i in order],
+    }
+
+
+def speed_tier_tables(table) -> Dict[str, Dict]:
+    """speed_tiers for every generation, keyed by generation number"""
+    return {str(generation): speed_tiers(table, generation) for generation in MOVE_GENERATIONS}
+
+
+if __name__ == "__main__":
+    from data_store import get_store
+
+    table = get_store().pokemon_table()
+    tiers = speed_tiers(table, MOVE_GENERATIONS[-1])
+    print(f"Gen {MOVE_GENERATIONS[-1]} speed tiers at level {tiers['level']} ({', '.join(tiers['spreads'])}):")
+    for row in tiers["rows"][:15]:
+        print(f"  {row}")
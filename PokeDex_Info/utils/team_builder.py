@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Team Builder
+Searches for six-member teams that maximize offensive type coverage (from
+learnsets) and minimize shared weaknesses, under user constraints. A
+branch-and-bound search over candidates prunes any partial team whose
+optimistic bound (best possible coverage from the remaining slots, scored
+with NumPy over every candidate at once) cannot beat the teams already
+found; top-level branches are split across a process pool.
+"""
+
+import heapq
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from type_chart import TYPES
+from team_coverage import TEAM_SIZE, TeamCoverage
+
+# Score = % of defenders hit super effectively - penalty per extra member
+# sharing a weakness (two members weak to Ground cost one penalty)
+WEAKNESS_PENALTY = 2.0
+MAX_NODES = 200_000
+
+
+class TeamProblem:
+    """Candidate matrices for one search; plain arrays so it pickles cheaply"""
+
+    def __init__(self, names: List[str], super_effective: np.ndarray, weak: np.ndarray,
+                 required: List[int], team_size: int, max_weak: int):
+        self.names = names
+        self.super_effective = super_effective  # (candidate, defender) bool
+        self.weak = weak  # (candidate, type) int
+        self.required = required
+        self.team_size = team_size
+        self.max_weak = max_weak
+        self.defenders = super_effective.shape[1]
+        self.optional = np.array([i for i in range(len(names)) if i not in set(required)], dtype=int)
+
+    def score(self, covered: int, weak_counts: np.ndarray) -> float:
+        shared = np.maximum(weak_counts - 1, 0).sum()
+        return covered / max(self.defenders, 1) * 100 - WEAKNESS_PENALTY * shared
+
+    def start(self) -> Tuple[List[int], np.ndarray, np.ndarray]:
+        covered = self.super_effective[self.required].any(axis=0)
+        weak_counts = self.weak[self.required].sum(axis=0)
+        return list(self.required), covered, weak_counts
+
+
+def _search(problem: TeamProblem, shard: int, shards: int, keep: int,
+            seed: Optional[Tuple[float, Tuple[int, ...]]], max_nodes: int) -> Tuple[List[Tuple[float, Tuple[int, ...]]], int]:
+    """Branch and bound over the top-level branches i with i % shards == shard.
+    Returns the best teams (score, members) and the number of nodes visited.
+
+    At every node the remaining candidates are ordered by marginal coverage
+    gain and each child only considers the siblings after it, so every team
+    is generated once and the bound shrinks along the sibling list.
+    """
+    best: List[Tuple[float, Tuple[int, ...]]] = []  # min-heap of (score, members)
+    kept = set()
+    nodes = 0
+    size = problem.team_size
+    defenders = max(problem.defenders, 1)
+
+    def bar() -> float:
+        return best[0][0] if len(best) >= keep else -np.inf
+
+    def offer(score: float, members: Tuple[int, ...]):
+        members = tuple(sorted(members))
+        if members in kept:
+            return
+        if len(best) < keep:
+            heapq.heappush(best, (score, members))
+        elif score > best[0][0]:
+            kept.discard(heapq.heapreplace(best, (score, members))[1])
+        else:
+            return
+        kept.add(members)
+
+    # A known good team (the greedy one) raises the bar from the start
+    if seed is not None:
+        offer(*seed)
+
+    def visit(candidates: np.ndarray, members: List[int], covered: np.ndarray,
+              weak_counts: np.ndarray, branch: Optional[Tuple[int, int]] = None):
+        nonlocal nodes
+        nodes += 1
+        slots = size - len(members)
+        # Drop candidates that would push some weakness past max_weak
+        counts = weak_counts[None, :] + problem.weak[candidates]
+        allowed = counts.max(axis=1, initial=0) <= problem.max_weak
+        candidates, counts = candidates[allowed], counts[allowed]
+        if len(candidates) < slots:
+            return
+        gains = (problem.super_effective[candidates] & ~covered).sum(axis=1)
+        base = int(covered.sum())
+        penalty = WEAKNESS_PENALTY * np.maximum(weak_counts - 1, 0).sum()
+
+        if slots == 1:
+            # Last slot: score every completion in one pass
+            scores = (base + gains) / defenders * 100 - WEAKNESS_PENALTY * np.maximum(counts - 1, 0).sum(axis=1)
+            for i in np.argsort(-scores, kind="stable"):
+                if scores[i] <= bar():
+                    break
+                offer(float(scores[i]), tuple(members) + (int(candidates[i]),))
+            return
+
+        order = np.argsort(-gains, kind="stable")
+        sorted_gains = gains[order]
+        # Optimistic bound for child i: its gain plus the next best gains,
+        # capped at full coverage; weaknesses only ever add penalty
+        window = np.convolve(sorted_gains, np.ones(slots, dtype=int), mode="valid")
+        for i in range(len(order) - slots + 1):
+            if nodes >= max_nodes:
+                return
+            if min(base + window[i], problem.defenders) / defenders * 100 - penalty <= bar():
+                return
+            if branch is not None and i % branch[1] != branch[0]:
+                continue
+            candidate = int(candidates[order[i]])
+            visit(candidates[order[i + 1:]], members + [candidate],
+                  covered | problem.super_effective[candidate], counts[order[i]])
+
+    members, covered, weak_counts = problem.start()
+    if len(members) >= size:
+        offer(problem.score(int(covered.sum()), weak_counts), tuple(members))
+        return best, nodes
+    visit(problem.optional, members, covered, weak_counts, (shard, shards))
+    return best, nodes
+
+
+def _search_task(task):
+    return _search(*task)
+
+
+class TeamBuilder:
+    """Team search over the species of a TeamCoverage analyzer"""
+
+    def __init__(self, coverage: TeamCoverage):
+        self.coverage = coverage
+        self.table = coverage.table
+
+    def problem(
+        self,
+        pool: Optional[str] = None,
+        defenders: Optional[str] = None,
+        required: Sequence[str] = (),
+        exclude: Sequence[str] = (),
+        team_size: int = TEAM_SIZE,
+        max_weak: int = TEAM_SIZE // 2,
+    ) -> TeamProblem:
+        """Candidates matching `pool` (a query expression, e.g. "game in Scarlet")
+        scored against the species matching `defenders` (the pool by default)"""
+        names = self.table.text["name"]
+        excluded = {self.coverage._row(name) for name in exclude}
+        rows = [row for row in self.table.rows(pool) if row not in excluded]
+        required_rows = [self.coverage._row(name) for name in required]
+        rows = required_rows + [row for row in rows if row not in set(required_rows)]
+
+        defender_rows = np.flatnonzero(self.table.mask(defenders if defenders is not None else pool))
+        defender_multipliers = self.coverage.matchups.multipliers[defender_rows]  # (defender, type)
+        attack = np.array([self.coverage.attack_types(names[row]) for row in rows]).reshape(len(rows), len(TYPES))
+        super_effective = (attack.astype(float) @ (defender_multipliers > 1).T.astype(float)) > 0
+        weak = (self.coverage.matchups.multipliers[rows] > 1).astype(int)
+        return TeamProblem(
+            names[rows].tolist(), super_effective, weak, list(range(len(required_rows))), team_size, max_weak
+        )
+
+    @staticmethod
+    def greedy(problem: TeamProblem) -> Tuple[float, Tuple[int, ...]]:
+        """Best-increment team, used as the starting bar for the search"""
+        members, covered, weak_counts = problem.start()
+        while len(members) < problem.team_size:
+            choices = [c for c in problem.optional if c not in members]
+            counts = weak_counts[None, :] + problem.weak[choices]
+            allowed = counts.max(axis=1, initial=0) <= problem.max_weak
+            if not allowed.any():
+                break
+            gains = (problem.super_effective[choices] & ~covered).sum(axis=1)
+            penalties = np.maximum(counts - 1, 0).sum(axis=1)
+            value = np.where(allowed, gains / max(problem.defenders, 1) * 100 - WEAKNESS_PENALTY * penalties, -np.inf)
+            pick = choices[int(np.argmax(value))]
+            members.append(int(pick))
+            covered = covered | problem.super_effective[pick]
+            weak_counts = weak_counts + problem.weak[pick]
+        if len(members) < problem.team_size:
+            return -np.inf, tuple(sorted(members))
+        return problem.score(int(covered.sum()), weak_counts), tuple(sorted(members))
+
+    def build(
+        self,
+        pool: Optional[str] = None,
+        defenders: Optional[str] = None,
+        required: Sequence[str] = (),
+        exclude: Sequence[str] = (),
+        team_size: int = TEAM_SIZE,
+        max_weak: int = TEAM_SIZE // 2,
+        keep: int = 5,
+        workers: Optional[int] = None,
+        max_nodes: int = MAX_NODES,
+    ) -> Dict:
+        """The `keep` best teams found, with their coverage reports.
+
+        Top-level branches are dealt round-robin to worker processes; each
+        worker stops after max_nodes nodes, so results are the best found
+        within that budget.
+        """
+        start = time.perf_counter()
+        problem = self.problem(pool, defenders, required, exclude, team_size, max_weak)
+        greedy = self.greedy(problem)
+        seed = greedy if np.isfinite(greedy[0]) else None
+
+        workers = workers or os.cpu_count() or 1
+        tasks = [(problem, shard, workers, keep, seed, max_nodes) for shard in range(workers)]
+        if len(tasks) <= 1:
+            results = [_search_task(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+                results = list(executor.map(_search_task, tasks))
+
+        teams = {}
+        for best, _ in results:
+            for score, members in best:
+                teams[members] = score
+        ranked = sorted(teams.items(), key=lambda item: (-item[1], item[0]))[:keep]
+        nodes = sum(n for _, n in results)
+        return {
+            "candidates": len(problem.names),
+            "defenders": problem.defenders,
+            "nodes": nodes,
+            "exhaustive": all(n < max_nodes for _, n in results),
+            "seconds": round(time.perf_counter() - start, 3),
+            "teams": [
+                {
+                    "members": [problem.names[i] for i in members],
+                    "score": round(float(score), 2),
+                    "report": self.coverage.analyze([problem.names[i] for i in members], defenders or pool),
+                }
+                for members, score in ranked
+            ],
+        }
+
+
+if __name__ == "__main__":
+    from data_store import get_store
+
+    builder = get_store().team_builder()
+    pool = " ".join(sys.argv[1:]) or "game in Scarlet"
+    result = builder.build(pool)
+    print(
+        f"{result['candidates']} candidates vs {result['defenders']} defenders: "
+        f"{result['nodes']:,} nodes in {result['seconds']} s"
+        f"{'' if result['exhaustive'] else ' (node budget reached)'}"
+    )
+    for team in result["teams"]:
+        offense, defense = team["report"]["offense"], team["report"]["defense"]
+        print(f"  {team['score']:6.2f}  {', '.join(team['members'])}")
+        print(f"          SE vs {offense['super_effective']}, shared weaknesses: {defense['shared_weaknesses']}")
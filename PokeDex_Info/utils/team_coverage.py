@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Team Coverage
+Offensive coverage (from the damaging moves each member can learn in a
+generation) and defensive overlap of a team of up to six, evaluated against
+every species at once by broadcasting over the species x attacking type
+multiplier matrix from type_chart.
+"""
+
+import os
+import sys
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from type_chart import TYPES, TYPE_INDEX, DefensiveMatchups, group_by_multiplier
+from config import PokeDataUtils
+
+TEAM_SIZE = 6
+
+
+def learner_name(learner: Dict) -> str:
+    """Name a move learner the way Pokemon are named elsewhere ('Alolan Vulpix')"""
+    form = learner.get("form") or "Normal"
+    name = learner.get("name", "")
+    return name if form == "Normal" else f"{form} {name}"
+
+
+def attack_type_learnsets(moves: List[Dict]) -> Dict[str, np.ndarray]:
+    """Normalized Pokemon name -> boolean vector of damaging move types it can learn"""
+    learnsets: Dict[str, np.ndarray] = {}
+    for move in moves:
+        if move.get("category") == "Status" or not move.get("base_power"):
+            continue
+        index = TYPE_INDEX.get(PokeDataUtils.normalize_key(move.get("battle_type") or ""))
+        if index is None:
+            continue
+        for learner in move.get("learned_by", []):
+            key = PokeDataUtils.normalize_key(learner_name(learner))
+            if key not in learnsets:
+                learnsets[key] = np.zeros(len(TYPES), dtype=bool)
+            learnsets[key][index] = True
+    return learnsets
+
+
+class TeamCoverage:
+    """Evaluates teams against the species of a DefensiveMatchups table"""
+
+    def __init__(self, matchups: DefensiveMatchups, learnsets: Dict[str, np.ndarray]):
+        self.matchups = matchups
+        self.table = matchups.table
+        self.learnsets = learnsets
+
+    def _row(self, name: str) -> int:
+        return self.matchups._row(name)
+
+    def attack_types(self, name: str) -> np.ndarray:
+        """Damaging move types a Pokemon can learn (its own types if no learnset)"""
+        learnset = self.learnsets.get(PokeDataUtils.normalize_key(name))
+        if learnset is not None:
+            return learnset
+        return self.matchups.type_members[self._row(name)]
+
+    def analyze(self, team: Sequence[str], defenders: Optional[str] = None) -> Dict:
+        """Coverage report for a team against the species matching `defenders`.
+
+        defenders is a query expression ("game in Scarlet"); all species by default.
+        """
+        if not team or len(team) > TEAM_SIZE:
+            raise ValueError(f"A team has 1 to {TEAM_SIZE} members, got {len(team)}")
+
+        team = list(team)
+        pool = np.flatnonzero(self.table.mask(defenders))
+        pool_multipliers = self.matchups.multipliers[pool]  # (species, attacking type)
+        pool_types = self.matchups.type_members[pool]  # (species, defending type)
+
+        # Offense: best multiplier each member can hit each defender with
+        attack = np.array([self.attack_types(name) for name in team])  # (member, type)
+        member_best = np.where(
+            attack[:, None, :], pool_multipliers[None, :, :], 0.0
+        ).max(axis=2)  # (member, species)
+        team_best = member_best.max(axis=0)
+
+        # Defense: each member's multipliers, and the worst STAB hit every
+        # defender can land on each member
+        member_rows = [self._row(name) for name in team]
+        team_multipliers = self.matchups.multipliers[member_rows]  # (member, type)
+        threat = np.where(
+            pool_types[:, None, :], team_multipliers[None, :, :], 0.0
+        ).max(axis=2)  # (species, member)
+
+        names = self.table.text["name"][pool]
+        weak_counts = (team_multipliers > 1).sum(axis=0)
+        return {
+            "defenders": len(pool),
+            "offense": {
+                "super_effective": int(np.count_nonzero(team_best > 1)),
+                "neutral": int(np.count_nonzero(team_best == 1)),
+                "resisted": int(np.count_nonzero((team_best < 1) & (team_best > 0))),
+                "immune": int(np.count_nonzero(team_best == 0)),
+                "walls": names[team_best < 1].tolist(),
+                "by_member": {
+                    name: int(np.count_nonzero(best > 1))
+                    for name, best in zip(team, member_best)
+                },
+                "missing_types": [
+                    TYPES[i] for i in np.flatnonzero(~attack.any(axis=0))
+                ],
+            },
+            "defense": {
+                "weak": {TYPES[i]: int(weak_counts[i]) for i in np.flatnonzero(weak_counts)},
+                "resist": {
+                    TYPES[i]: int(count)
+                    for i, count in enumerate((team_multipliers < 1).sum(axis=0))
+                    if count
+                },
+                # Attacking types more than half the team is weak to
+                "shared_weaknesses": [
+                    TYPES[i] for i in np.flatnonzero(weak_counts * 2 > len(team))
+                ],
+                "by_member": {
+                    name: group_by_multiplier(multipliers)
+                    for name, multipliers in zip(team, team_multipliers)
+                },
+                # Defenders whose STAB hits at least half the team super effectively
+                "threats": names[(threat > 1).sum(axis=1) * 2 >= len(team)].tolist(),
+            },
+        }
+
+
+if __name__ == "__main__":
+    from data_store import get_store
+
+    store = get_store()
+    coverage = store.team_coverage()
+    names = store.pokemon_table().text["name"]
+    team = sys.argv[1:] or names[: min(TEAM_SIZE, len(names))].tolist()
+    report = coverage.analyze(team, "game in Scarlet")
+    print(f"Team: {', '.join(team)} vs {report['defenders']} Scarlet species")
+    for section in ("offense", "defense"):
+        print(f"\n{section.title()}:")
+        for key, value in report[section].items():
+            if isinstance(value, list) and len(value) > 10:
+                value = value[:10] + [f"... {len(value) - 10} more"]
+            print(f"  {key}: {value}")
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Full-Text Search
+Inverted-index search with tokenization, Porter stemming and BM25 ranking over
+move effects, ability text and item descriptions ("raises Speed", "protects
+from priority"). Sources are indexed incrementally: only files that changed
+since the last sync are re-indexed.
+"""
+
+import heapq
+import math
+import os
+import re
+import sys
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+sys.path.append(os.path.dirname(__file__))
+from config import MOVES_FILE_TEMPLATE, MOVE_GENERATIONS
+
+CORPORA = ("move", "ability", "item")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+STOPWORDS = frozenset(
+    """a an and are as at be by for from has if in into is it its of on or
+    that the their this to was were when which while will with""".split()
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class PorterStemmer:
+    """The classic Porter (1980) stemming algorithm"""
+
+    _STEP2 = (
+        ("ational", "ate"), ("tional", "tion"), ("enci", "ence"), ("anci", "ance"),
+        ("izer", "ize"), ("bli", "ble"), ("alli", "al"), ("entli", "ent"),
+        ("eli", "e"), ("ousli", "ous"), ("ization", "ize"), ("ation", "ate"),
+        ("ator", "ate"), ("alism", "al"), ("iveness", "ive"), ("fulness", "ful"),
+        ("ousness", "ous"), ("aliti", "al"), ("iviti", "ive"), ("biliti", "ble"),
+        ("logi", "log"),
+    )
+    _STEP3 = (
+        ("icate", "ic"), ("ative", ""), ("alize", "al"), ("iciti", "ic"),
+        ("ical", "ic"), ("ful", ""), ("ness", ""),
+    )
+    _STEP4 = (
+        "al", "ance", "ence", "er", "ic", "able", "ible", "ant", "ement",
+        "ment", "ent", "ion", "ou", "ism", "ate", "iti", "ous", "ive", "ize",
+    )
+
+    def __init__(self):
+        self._cache: Dict[str, str] = {}
+
+    @staticmethod
+    def _is_consonant(word: str, i: int) -> bool:
+        char = word[i]
+        if char in "aeiou":
+            return False
+        if char == "y":
+            return i == 0 or not PorterStemmer._is_consonant(word, i - 1)
+        return True
+
+    def _measure(self, stem: str) -> int:
+        """Number of vowel-consonant sequences ([C](VC)^m[V])"""
+        m, previous_vowel = 0, False
+        for i in range(len(stem)):
+            vowel = not self._is_consonant(stem, i)
+            if previous_vowel and not vowel:
+                m += 1
+            previous_vowel = vowel
+        return m
+
+    def _has_vowel(self, stem: str) -> bool:
+        return any(not self._is_consonant(stem, i) for i in range(len(stem)))
+
+    def _double_consonant(self, word: str) -> bool:
+        return (
+            len(word) >= 2
+            and word[-1] == word[-2]
+            and self._is_consonant(word, len(word) - 1)
+        )
+
+    def _cvc(self, word: str) -> bool:
+        """consonant-vowel-consonant ending where the last isn't w, x or y"""
+        return (
+            len(word) >= 3
+            and self._is_consonant(word, len(word) - 3)
+            and not self._is_consonant(word, len(word) - 2)
+            and self._is_consonant(word, len(word) - 1)
+            and word[-1] not in "wxy"
+        )
+
+    def _replace(self, word: str, rules, min_measure: int) -> str:
+        for suffix, replacement in rules:
+            if word.endswith(suffix):
+                stem = word[: -len(suffix)]
+                if self._measure(stem) > min_measure:
+                    return stem + replacement
+                return word
+        return word
+
+    def stem(self, word: str) -> str:
+        if len(word) <= 2:
+            return word
+        cached = self._cache.get(word)
+        if cached is not None:
+            return cached
+
+        original = word
+
+        # Step 1a: plurals
+        if word.endswith("sses"):
+            word = word[:-2]
+        elif word.endswith("ies"):
+            word = word[:-2]
+        elif word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+
+        # Step 1b: -ed / -ing
+        if word.endswith("eed"):
+            if self._measure(word[:-3]) > 0:
+                word = word[:-1]
+        else:
+            for suffix in ("ed", "ing"):
+                if word.endswith(suffix) and self._has_vowel(word[: -len(suffix)]):
+                    word = word[: -len(suffix)]
+                    if word.endswith(("at", "bl", "iz")):
+                        word += "e"
+                    elif self._double_consonant(word) and word[-1] not in "lsz":
+                        word = word[:-1]
+                    elif self._measure(word) == 1 and self._cvc(word):
+                        word += "e"
+                    break
+
+        # Step 1c: y -> i
+        if word.endswith("y") and self._has_vowel(word[:-1]):
+            word = word[:-1] + "i"
+
+        # Steps 2-3: derivational suffixes
+        word = self._replace(word, self._STEP2, 0)
+        word = self._replace(word, self._STEP3, 0)
+
+        # Step 4: strip suffixes from long stems
+        for suffix in self._STEP4:
+            if word.endswith(suffix):
+                stem = word[: -len(suffix)]
+                if self._measure(stem) > 1 and (suffix != "ion" or stem.endswith(("s", "t"))):
+                    word = stem
+                break
+
+        # Step 5: final -e and double -ll
+        if word.endswith("e"):
+            stem = word[:-1]
+            measure = self._measure(stem)
+            if measure > 1 or (measure == 1 and not self._cvc(stem)):
+                word = stem
+        if word.endswith("ll") and self._measure(word) > 1:
+            word = word[:-1]
+
+        self._cache[original] = word
+        return word
+
+
+_stemmer = PorterStemmer()
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, strip accents, drop stopwords and stem"""
+    text = "".join(
+        char for char in unicodedata.normalize("NFKD", text.lower()) if not unicodedata.combining(char)
+    )
+    return [
+        _stemmer.stem(token)
+        for token in _TOKEN_PATTERN.findall(text)
+        if token not in STOPWORDS
+    ]
+
+
+class FullTextIndex:
+    """BM25 inverted index over documents grouped into sources"""
+
+    def __init__(self):
+        # term -> {doc_id: term frequency}
+        self.postings: Dict[str, Dict[int, int]] = {}
+        # doc_id -> (corpus, title, snippet)
+        self.documents: Dict[int, Tuple[str, str, str]] = {}
+        self.doc_lengths: Dict[int, int] = {}
+        self.total_length = 0
+        self._doc_terms: Dict[int, Dict[str, int]] = {}
+        self._source_docs: Dict[str, List[int]] = {}
+        self._source_versions: Dict[str, object] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add_document(self, corpus: str, title: str, text: str, source: str = "") -> int:
+        """Index one document and return its id"""
+        doc_id = self._next_id
+        self._next_id += 1
+
+        # The title is indexed alongside the body so name words count too
+        terms: Dict[str, int] = {}
+        for term in tokenize(f"{title} {text}"):
+            terms[term] = terms.get(term, 0) + 1
+        for term, frequency in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+
+        length = sum(terms.values())
+        self.documents[doc_id] = (corpus, title, text)
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+        self._doc_terms[doc_id] = terms
+        self._source_docs.setdefault(source, []).append(doc_id)
+        return doc_id
+
+    def remove_document(self, doc_id: int):
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            docs = self.postings.get(term)
+            if docs is not None:
+                docs.pop(doc_id, None)
+                if not docs:
+                    del self.postings[term]
+        self.total_length -= self.doc_lengths.pop(doc_id)
+        del self.documents[doc_id]
+
+    def remove_source(self, source: str):
+        for doc_id in self._source_docs.pop(source, []):
+            self.remove_document(doc_id)
+        self._source_versions.pop(source, None)
+
+    def sync_source(self, source: str, version, documents: Iterable[Tuple[str, str, str]]) -> bool:
+        """Re-index a source only if its version changed since the last sync"""
+        if self._source_versions.get(source) == version:
+            return False
+        self.remove_source(source)
+        self._source_docs[source] = []
+        for corpus, title, text in documents:
+            self.add_document(corpus, title, text, source)
+        self._source_versions[source] = version
+        return True
+
+    def search(
+        self,
+        query: str,
+        corpora: Optional[Sequence[str]] = None,
+        limit: int = 20,
+    ) -> List[Dict]:
+        """Rank documents by BM25 against the query terms"""
+        if not self.documents:
+            return []
+        terms = list(dict.fromkeys(tokenize(query)))
+        total_docs = len(self.documents)
+        average_length = self.total_length / total_docs or 1.0
+        allowed = set(corpora) if corpora else None
+
+        scores: Dict[int, float] = {}
+        for term in terms:
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (total_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_id, frequency in docs.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+
+        if allowed:
+            scores = {d: s for d, s in scores.items() if self.documents[d][0] in allowed}
+
+        results = []
+        for doc_id, score in heapq.nlargest(limit, scores.items(), key=lambda item: item[1]):
+            corpus, title, text = self.documents[doc_id]
+            results.append(
+                {"type": corpus, "name": title, "text": text, "score": round(score, 3)}
+            )
+        return results
+
+
+def _join(*parts) -> str:
+    return " ".join(part.strip() for part in parts if isinstance(part, str) and part.strip())
+
+
+def move_documents(moves: List[Dict]) -> Iterable[Tuple[str, str, str]]:
+    for move in moves:
+        yield "move", move.get("name", ""), _join(
+            move.get("battle_effect"), move.get("secondary_effect")
+        )
+
+
+def ability_documents(abilities: List[Dict]) -> Iterable[Tuple[str, str, str]]:
+    for ability in abilities:
+        yield "ability", ability.get("name", ""), _join(
+            ability.get("game_text") or ability.get("game_description"),
+            ability.get("in_depth_effect") or ability.get("technical_effect"),
+        )
+
+
+def item_documents(items: List[Dict]) -> Iterable[Tuple[str, str, str]]:
+    for item in items:
+        # Flavor text repeats across games; index each distinct line once
+        flavor = dict.fromkeys((item.get("flavor_text") or {}).values())
+        yield "item", item.get("name", ""), _join(
+            item.get("effect"), *(item.get("held_item_effects") or []), *flavor
+        )
+
+
+def sync_text_index(index: FullTextIndex, store) -> FullTextIndex:
+    """Bring the index up to date with every moves, abilities and items file"""
+    # Newest generation wins when a move appears in several files, so a
+    # generation's documents also depend on every newer moves file
+    seen_moves = set()
+    newer_versions = ()
+    for generation in reversed(MOVE_GENERATIONS):
+        key = MOVES_FILE_TEMPLATE.format(generation=generation)
+        newer_versions += (store.version(key),)
+        moves = [
+            move for move in store.moves(generation) if move.get("name") not in seen_moves
+        ]
+        seen_moves.update(move.get("name") for move in moves)
+        index.sync_source(key, newer_versions, move_documents(moves))
+
+    index.sync_source("abilities", store.version("abilities"), ability_documents(store.abilities()))
+
+    for key in store.item_category_files():
+        data = store.load(key)
+        items = data.get("items", []) if isinstance(data, dict) else []
+        index.sync_source(key, store.version(key), item_documents(items))
+    return index
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Pokemon Data Collection System - Type Effectiveness
+18x18 effectiveness matrices (attacking type x defending type) for each
+generation's rules, and a vectorized defensive product that computes the
+multipliers of every species against every attacking type at once. Defensive
+abilities (Levitate, Thick Fat, Flash Fire, ...) are applied as variants.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.append(os.path.dirname(__file__))
+from config import PokeDataUtils
+
+TYPES = (
+    "Normal", "Fire", "Water", "Electric", "Grass", "Ice", "Fighting", "Poison", "Ground",
+    "Flying", "Psychic", "Bug", "Rock", "Ghost", "Dragon", "Dark", "Steel", "Fairy",
+)
+TYPE_INDEX = {PokeDataUtils.normalize_key(name): i for i, name in enumerate(TYPES)}
+LATEST_GENERATION = 9
+
+# Gen 6+ chart: attacking type -> {defending type: multiplier} (1x omitted)
+_CHART = {
+    "Normal": {"Rock": 0.5, "Ghost": 0, "Steel": 0.5},
+    "Fire": {"Fire": 0.5, "Water": 0.5, "Grass": 2, "Ice": 2, "Bug": 2, "Rock": 0.5, "Dragon": 0.5, "Steel": 2},
+    "Water": {"Fire": 2, "Water": 0.5, "Grass": 0.5, "Ground": 2, "Rock": 2, "Dragon": 0.5},
+    "Electric": {"Water": 2, "Electric": 0.5, "Grass": 0.5, "Ground": 0, "Flying": 2, "Dragon": 0.5},
+    "Grass": {"Fire": 0.5, "Water": 2, "Grass": 0.5, "Poison": 0.5, "Ground": 2, "Flying": 0.5, "Bug": 0.5, "Rock": 2, "Dragon": 0.5, "Steel": 0.5},
+    "Ice": {"Fire": 0.5, "Water": 0.5, "Grass": 2, "Ice": 0.5, "Ground": 2, "Flying": 2, "Dragon": 2, "Steel": 0.5},
+    "Fighting": {"Normal": 2, "Ice": 2, "Poison": 0.5, "Flying": 0.5, "Psychic": 0.5, "Bug": 0.5, "Rock": 2, "Ghost": 0, "Dark": 2, "Steel": 2, "Fairy": 0.5},
+    "Poison": {"Grass": 2, "Poison": 0.5, "Ground": 0.5, "Rock": 0.5, "Ghost": 0.5, "Steel": 0, "Fairy": 2},
+    "Ground": {"Fire": 2, "Electric": 2, "Grass": 0.5, "Poison": 2, "Flying": 0, "Bug": 0.5, "Rock": 2, "Steel": 2},
+    "Flying": {"Electric": 0.5, "Grass": 2, "Fighting": 2, "Bug": 2, "Rock": 0.5, "Steel": 0.5},
+    "Psychic": {"Fighting": 2, "Poison": 2, "Psychic": 0.5, "Dark": 0, "Steel": 0.5},
+    "Bug": {"Fire": 0.5, "Grass": 2, "Fighting": 0.5, "Poison": 0.5, "Flying": 0.5, "Psychic": 2, "Ghost": 0.5, "Dark": 2, "Steel": 0.5, "Fairy": 0.5},
+    "Rock": {"Fire": 2, "Ice": 2, "Fighting": 0.5, "Ground": 0.5, "Flying": 2, "Bug": 2, "Steel": 0.5},
+    "Ghost": {"Normal": 0, "Psychic": 2, "Ghost": 2, "Dark": 0.5},
+    "Dragon": {"Dragon": 2, "Steel": 0.5, "Fairy": 0},
+    "Dark": {"Fighting": 0.5, "Psychic": 2, "Ghost": 2, "Dark": 0.5, "Fairy": 0.5},
+    "Steel": {"Fire": 0.5, "Water": 0.5, "Electric": 0.5, "Ice": 2, "Rock": 2, "Steel": 0.5, "Fairy": 2},
+    "Fairy": {"Fire": 0.5, "Fighting": 2, "Poison": 0.5, "Dragon": 2, "Dark": 2, "Steel": 0.5},
+}
+
+# Older rules: last generation they applied to -> changes on top of the newer chart
+_CHART_CHANGES = {
+    # Gen 2-5: no Fairy type, Steel resists Ghost and Dark
+    5: {("Ghost", "Steel"): 0.5, ("Dark", "Steel"): 0.5},
+    # Gen 1 on top of Gen 2-5: no Dark or Steel, Bug/Poison hit each other
+    # super effectively, Ghost can't touch Psychic, Ice is neutral on Fire
+    1: {("Bug", "Poison"): 2, ("Poison", "Bug"): 2, ("Ghost", "Psychic"): 0, ("Ice", "Fire"): 1},
+}
+_TYPES_ADDED = {"Dark": 2, "Steel": 2, "Fairy": 6}
+
+# Defensive abilities: attacking type -> extra multiplier
+ABILITY_MODIFIERS = {
+    "Levitate": {"Ground": 0},
+    "Earth Eater": {"Ground": 0},
+    "Thick Fat": {"Fire": 0.5, "Ice": 0.5},
+    "Heatproof": {"Fire": 0.5},
+    "Water Bubble": {"Fire": 0.5},
+    "Purifying Salt": {"Ghost": 0.5},
+    "Fluffy": {"Fire": 2},
+    "Dry Skin": {"Fire": 1.25, "Water": 0},
+    "Flash Fire": {"Fire": 0},
+    "Well-Baked Body": {"Fire": 0},
+    "Volt Absorb": {"Electric": 0},
+    "Lightning Rod": {"Electric": 0},
+    "Motor Drive": {"Electric": 0},
+    "Water Absorb": {"Water": 0},
+    "Storm Drain": {"Water": 0},
+    "Sap Sipper": {"Grass": 0},
+}
+# Lightning Rod and Storm Drain only grant immunity from Gen 5 on
+_ABILITY_SINCE = {"Lightning Rod": 5, "Storm Drain": 5}
+# Super-effective hits are reduced to 3/4
+SUPER_EFFECTIVE_FILTERS = ("Filter", "Solid Rock", "Prism Armor")
+# Only super-effective hits land
+WONDER_GUARD = "Wonder Guard"
+
+
+def type_index(name: str) -> int:
+    index = TYPE_INDEX.get(PokeDataUtils.normalize_key(str(name)))
+    if index is None:
+        raise ValueError(f"Unknown type '{name}'")
+    return index
+
+
+def types_in_generation(generation: int = LATEST_GENERATION) -> List[str]:
+    """Types that exist under a generation's rules"""
+    return [name for name in TYPES if _TYPES_ADDED.get(name, 1) <= generation]
+
+
+@lru_cache(maxsize=None)
+def _chart(generation: int) -> np.ndarray:
+    chart = np.ones((len(TYPES), len(TYPES)))
+    for attacker, row in _CHART.items():
+        for defender, multiplier in row.items():
+            chart[type_index(attacker), type_index(defender)] = multiplier
+
+    for until in (5, 1):
+        if generation <= until:
+            for (attacker, defender), multiplier in _CHART_CHANGES[until].items():
+                chart[type_index(attacker), type_index(defender)] = multiplier
+
+    # Types that don't exist yet neither hit nor change anything
+    for name, added in _TYPES_ADDED.items():
+        if generation < added:
+            chart[type_index(name), :] = 1
+            chart[:, type_index(name)] = 1
+    chart.flags.writeable = False
+    return chart
+
+
+def type_chart(generation: int = LATEST_GENERATION) -> np.ndarray:
+    """18x18 matrix of attacking type (rows) x defending type (columns).
+
+    The array is shared and read-only.
+    """
+    return _chart(max(1, min(int(generation), LATEST_GENERATION)))
+
+
+def chart_variants() -> Dict[int, np.ndarray]:
+    """The distinct charts keyed by the first generation they apply to"""
+    return {1: type_chart(1), 2: type_chart(2), 6: type_chart(6)}
+
+
+def ability_modifier(ability: str, generation: int = LATEST_GENERATION) -> Optional[np.ndarray]:
+    """Per-attacking-type multiplier row for a defensive ability, if it has one"""
+    key = PokeDataUtils.normalize_key(ability)
+    for name, modifiers in ABILITY_MODIFIERS.items():
+        if PokeDataUtils.normalize_key(name) == key:
+            if generation < _ABILITY_SINCE.get(name, 3):
+                return None
+            row = np.ones(len(TYPES))
+            for attack_type, multiplier in modifiers.items():
+                row[type_index(attack_type)] = multiplier
+            return row
+    return None
+
+
+def apply_ability(multipliers: np.ndarray, ability: str, generation: int = LATEST_GENERATION) -> np.ndarray:
+    """Apply a defensive ability to multipliers (last axis = attacking type)"""
+    key = PokeDataUtils.normalize_key(ability)
+    if key in {PokeDataUtils.normalize_key(name) for name in SUPER_EFFECTIVE_FILTERS}:
+        return np.where(multipliers > 1, multipliers * 0.75, multipliers)
+    if key == PokeDataUtils.normalize_key(WONDER_GUARD):
+        return np.where(multipliers > 1, multipliers, 0.0)
+    row = ability_modifier(ability, generation)
+    return multipliers if row is None else multipliers * row
+
+
+def has_defensive_ability(ability: str, generation: int = LATEST_GENERATION) -> bool:
+    key = PokeDataUtils.normalize_key(ability)
+    special = {PokeDataUtils.normalize_key(name) for name in (*SUPER_EFFECTIVE_FILTERS, WONDER_GUARD)}
+    return key in special or ability_modifier(ability, generation) is not None
+
+
+def defensive_multipliers(type_members: np.ndarray, generation: int = LATEST_GENERATION) -> np.ndarray:
+    """Multipliers against every attacking type for a batch of typings.
+
+    type_members is a (species x 18) boolean matrix of defending types; the
+    result is (species x 18 attacking types), the product over each species'
+    types computed in one broadcast.
+    """
+    chart = type_chart(generation)
+    # (species, defending, attacking): chart value where the species has the type
+    per_type = np.where(type_members[:, :, None], chart.T[None, :, :], 1.0)
+    return per_type.prod(axis=1)
+
+
+def effectiveness(
+    attack_type: str,
+    defender_types: Sequence[str],
+    generation: int = LATEST_GENERATION,
+    ability: Optional[str] = None,
+) -> float:
+    """Multiplier of one attacking type against a typing (and ability)"""
+    members = np.zeros((1, len(TYPES)), dtype=bool)
+    for name in defender_types:
+        members[0, type_index(name)] = True
+    multipliers = defensive_multipliers(members, generation)
+    if ability:
+        multipliers = apply_ability(multipliers, ability, generation)
+    return float(multipliers[0, type_index(attack_type)])
+
+
+def group_by_multiplier(multipliers: Sequence[float]) -> Dict[str, List[str]]:
+    """{'4x': [...], '2x': [...], '0.5x': [...], ...} for one row of multipliers"""
+    groups: Dict[str, List[str]] = {}
+    for name, multiplier in zip(TYPES, multipliers):
+        if multiplier != 1:
+            groups.setdefault(f"{multiplier:g}x", []).append(name)
+    return dict(sorted(groups.items(), key=lambda item: -float(item[0][:-1])))
+
+
+class DefensiveMatchups:
+    """Multipliers of every Pokemon in a PokemonTable against every attacking type"""
+
+    def __init__(self, table, generation: int = LATEST_GENERATION):
+        self.table = table
+        self.generation = generation
+
+        # Map the table's type vocabulary onto the chart's type order
+        members = np.zeros((len(table), len(TYPES)), dtype=bool)
+        for code, label in enumerate(table.labels["types"]):
+            index = TYPE_INDEX.get(PokeDataUtils.normalize_key(label))
+            if index is not None:
+                members[:, index] |= table.sets["types"][:, code]
+        self.type_members = members
+        self.multipliers = defensive_multipliers(members, generation)
+
+        # Ability variants: (row, ability) -> multipliers with the ability applied
+        self.ability_variants: Dict[int, Dict[str, np.ndarray]] = {}
+        for column in ("abilities", "hidden_abilities"):
+            for code, label in enumerate(table.labels[column]):
+                if not has_defensive_ability(label, generation):
+                    continue
+                rows = np.flatnonzero(table.sets[column][:, code])
+                variants = apply_ability(self.multipliers[rows], label, generation)
+                for row, variant in zip(rows, variants):
+                    self.ability_variants.setdefault(int(row), {})[label] = variant
+
+    def _row(self, name: str) -> int:
+        rows = self.table.rows(f"name == {name!r}")
+        if not len(rows):
+            raise ValueError(f"Unknown Pokemon '{name}'")
+        return int(rows[0])
+
+    def weaknesses(self, name: str, ability: Optional[str] = None) -> Dict[str, List[str]]:
+        """Attacking types grouped by multiplier for one Pokemon"""
+        row = self._row(name)
+        multipliers = self.multipliers[row]
+        if ability:
+            multipliers = apply_ability(multipliers, ability, self.generation)
+        return group_by_multiplier(multipliers)
+
+    def weak_to(self, attack_type: str, minimum: float = 2) -> List[str]:
+        """Names of every Pokemon taking at least `minimum` from a type"""
+        rows = np.flatnonzero(self.multipliers[:, type_index(attack_type)] >= minimum)
+        return self.table.text["name"][rows].tolist()
+
+    # Serialization
+    def to_dict(self) -> Dict:
+        """Compact form for the Pokemon and type pages.
+
+        charts: first generation of each chart variant -> 18x18 matrix
+        species: ref_id -> [name, types, multipliers, {ability: multipliers}]
+        names: name -> ref_id (first form with that name)
+        """
+        ref_ids = self.table.text["ref_id"]
+        names = self.table.text["name"]
+        types = self.table.column_values("types", np.arange(len(self.table)))
+        species, by_name = {}, {}
+        for row in range(len(self.table)):
+            key = ref_ids[row] or names[row]
+            species[key] = [
+                names[row],
+                types[row],
+                [float(f"{m:g}") for m in self.multipliers[row]],
+                {
+                    ability: [float(f"{m:g}") for m in variant]
+                    for ability, variant in self.ability_variants.get(row, {}).items()
+                },
+            ]
+            by_name.setdefault(names[row], key)
+        return {
+            "version": 1,
+            "generation": self.generation,
+            "types": list(TYPES),
+            "charts": {
+                str(since): [[float(f"{m:g}") for m in row] for row in chart]
+                for since, chart in chart_variants().items()
+            },
+            "species": species,
+            "names": by_name,
+        }
+
+
+if __name__ == "__main__":
+    from data_store import get_store
+
+    print("Fire vs Grass/Steel:", effectiveness("Fire", ["Grass", "Steel"]))
+    print("Ghost vs Psychic (Gen 1):", effectiveness("Ghost", ["Psychic"], generation=1))
+    print("Ground vs Electric with Levitate:", effectiveness("Ground", ["Electric"], ability="Levitate"))
+
+    matchups = get_store().type_matchups()
+    if len(matchups.table):
+        name = matchups.table.text["name"][0]
+        print(f"\n{name}: {matchups.weaknesses(name)}")
@@ -0,0 +1,38 @@
+import { NextRequest, NextResponse } from "next/server";
+import fs from "fs";
+import path from "path";
+import { normalizeKey } from "@/lib/keys";
+
+export async function GET(
+  request: NextRequest,
+  { params }: { params: { name: string } }
+) {
+  const name = decodeURIComponent(params.name);
+  try {
+    // Precomputed by build_derived_data.py (python build_derived_data.py move_recommendations)
+    const recommendationsPath = path.join(
+      process.cwd(),
+      "..",
+      "data",
+      "derived",
+      "move_recommendations",
+      `${normalizeKey(name)}.json`
+    );
+
+    if (fs.existsSync(recommendationsPath)) {
+      const fileContent = fs.readFileSync(recommendationsPath, "utf-8");
+      return NextResponse.json(JSON.parse(fileContent));
+    }
+
+    return NextResponse.json(
+      { version: 1, name, generations: {} },
+      { status: 200 }
+    );
+  } catch (error) {
+    console.error("Error reading move recommendations:", error);
+    return NextResponse.json(
+      { version: 1, name, generations: {} },
+      { status: 200 }
+    );
+  }
+}
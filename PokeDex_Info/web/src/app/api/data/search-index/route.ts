@@ -0,0 +1,32 @@
+import { NextRequest, NextResponse } from "next/server";
+import fs from "fs";
+import path from "path";
+
+export async function GET(request: NextRequest) {
+  try {
+    // Precomputed by build_derived_data.py (python build_derived_data.py search_index)
+    const indexPath = path.join(
+      process.cwd(),
+      "..",
+      "data",
+      "derived",
+      "search_index.json"
+    );
+
+    if (fs.existsSync(indexPath)) {
+      const fileContent = fs.readFileSync(indexPath, "utf-8");
+      return NextResponse.json(JSON.parse(fileContent));
+    }
+
+    return NextResponse.json(
+      { version: 1, types: [], entries: [], prefixes: [], grams: {} },
+      { status: 200 }
+    );
+  } catch (error) {
+    console.error("Error reading search index:", error);
+    return NextResponse.json(
+      { version: 1, types: [], entries: [], prefixes: [], grams: {} },
+      { status: 200 }
+    );
+  }
+}
@@ -0,0 +1,32 @@
+import { NextRequest, NextResponse } from "next/server";
+import fs from "fs";
+import path from "path";
+
+export async function GET(request: NextRequest) {
+  try {
+    // Precomputed by build_derived_data.py (python build_derived_data.py type_weaknesses)
+    const chartPath = path.join(
+      process.cwd(),
+      "..",
+      "data",
+      "derived",
+      "type_weaknesses.json"
+    );
+
+    if (fs.existsSync(chartPath)) {
+      const fileContent = fs.readFileSync(chartPath, "utf-8");
+      return NextResponse.json(JSON.parse(fileContent));
+    }
+
+    return NextResponse.json(
+      { version: 1, types: [], charts: {}, species: {}, names: {} },
+      { status: 200 }
+    );
+  } catch (error) {
+    console.error("Error reading type weaknesses:", error);
+    return NextResponse.json(
+      { version: 1, types: [], charts: {}, species: {}, names: {} },
+      { status: 200 }
+    );
+  }
+}
@@ -4,6 +4,19 @@ import { useEffect, useState } from "react";
 import { useParams } from "next/navigation";
 import Link from "next/link";
 import Image from "next/image";
+import {
+  LearnsetData,
+  LearnsetEntry,
+  countMoves,
+  generationLearnset,
+  loadLearnset,
+} from "@/lib/learnsets";
+import {
+  MoveRecommendationData,
+  RecommendedMove,
+  generationRecommendations,
+  loadMoveRecommendations,
+} from "@/lib/moveRecommendations";
 
 interface Pokemon {
   id: string;
@@ -60,6 +73,20 @@ export default function PokemonPage() {
   const [gameReleaseOrder, setGameReleaseOrder] = useState<
     Record<string, number>
   >({});
+  const [gameGenerations, setGameGenerations] = useState<
+    Record<string, number>
+  >({});
+  const [learnsetData, setLearnsetData] = useState<LearnsetData | null>(null);
+  const [recommendationData, setRecommendationData] =
+    useState<MoveRecommendationData | null>(null);
+
+  useEffect(() => {
+    // Precomputed slice for this Pokemon only; falls back to pokemon.moves
+    loadLearnset(decodeURIComponent(pokemonName)).then(setLearnsetData);
+    loadMoveRecommendations(decodeURIComponent(pokemonName)).then(
+      setRecommendationData
+    );
+  }, [pokemonName]);
 
   useEffect(() => {
     const fetchPokemon = async () => {
@@ -73,6 +100,7 @@ export default function PokemonPage() {
 
         // Fetch games data to get release order
         let releaseOrder: Record<string, number> = {};
+        const generations: Record<string, number> = {};
         try {
           const gamesResponse = await fetch("/api/data/games");
           const gamesData = await gamesResponse.json();
@@ -84,11 +112,15 @@ export default function PokemonPage() {
               if (Array.isArray(gen.games)) {
                 gen.games.forEach((game: string) => {
                   releaseOrder[game] = orderIndex++;
+                  if (typeof gen.generation === "number") {
+                    generations[game] = gen.generation;
+                  }
                 });
               }
             });
           }
           setGameReleaseOrder(releaseOrder);
+          setGameGenerations(generations);
         } catch (err) {
           console.error("Error fetching games data:", err);
         }
@@ -118,6 +150,16 @@ export default function PokemonPage() {
     fetchPokemon();
   }, [pokemonName]);
 
+  // Learnset and recommendations for the selected game's generation (the
+  // latest one when the game is not in the games data)
+  const selectedGeneration: number | undefined = gameGenerations[selectedGame];
+  const learnset: Record<string, LearnsetEntry[]> | null = learnsetData
+    ? generationLearnset(learnsetData, selectedGeneration)
+    : null;
+  const recommendedMoves: RecommendedMove[] = recommendationData
+    ? generationRecommendations(recommendationData, selectedGeneration)
+    : [];
+
   if (loading) {
     return <div className="text-white text-center py-8">Loading...</div>;
   }
@@ -545,13 +587,70 @@ export default function PokemonPage() {
           </div>
 
           {/* Moves Section */}
-          {pokemon.moves && pokemon.moves.length > 0 && (
+          {(learnset || (pokemon.moves && pokemon.moves.length > 0)) && (
             <div>
               <h3 className="font-bold text-white mb-3 text-lg">Moves</h3>
               <p className="text-gray-300 text-sm mb-3">
-                {pokemon.name} can learn {pokemon.moves.length} moves in{" "}
-                {selectedGame}.
+                {pokemon.name} can learn{" "}
+                {learnset ? countMoves(learnset) : pokemon.moves?.length} moves
+                {learnset && selectedGeneration === undefined
+                  ? " in the latest generation"
+                  : ` in ${selectedGame}`}
+                .
               </p>
+              {learnset && (
+                <div className="grid grid-cols-2 gap-3 mb-3">
+                  {Object.entries(learnset).map(([method, entries]) => (
+                    <div
+                      key={method}
+                      className="bg-gray-800 p-3 rounded-lg border border-gray-700 text-sm"
+                    >
+                      <p className="font-semibold text-white mb-1">
+                        {method} ({entries.length})
+                      </p>
+                      <p className="text-gray-300">
+                        {entries
+                          .map(([move, level]) =>
+                            level !== null ? `${move} (Lv. ${level})` : move
+                          )
+                          .join(", ")}
+                      </p>
+                    </div>
+                  ))}
+                </div>
+              )}
+              {recommendedMoves.length > 0 && (
+                <div className="bg-gray-800 p-3 rounded-lg border border-gray-700 text-sm mb-3">
+                  <p className="font-semibold text-white mb-2">
+                    Recommended Moves
+                  </p>
+                  <div className="space-y-1">
+                    {recommendedMoves
+                      .slice(0, 6)
+                      .map(
+                        ([move, type, category, power, , , , stab, coverage]) => (
+                          <div
+                            key={move}
+                            className="flex justify-between text-gray-300"
+                          >
+                            <span className="text-white">
+                              {move}
+                              {stab && (
+                                <span className="ml-1 text-xs text-yellow-400">
+                                  STAB
+                                </span>
+                              )}
+                            </span>
+                            <span>
+                              {type} · {category} · {power}
+                              {coverage > 0 && ` · +${coverage}% coverage`}
+                            </span>
+                          </div>
+                        )
+                      )}
+                  </div>
+                </div>
+              )}
               <Link
                 href={`/moves?pokemon=${encodeURIComponent(
                   pokemon.name
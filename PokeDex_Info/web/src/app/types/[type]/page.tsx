@@ -4,6 +4,7 @@ import { useParams } from "next/navigation";
 import { useState, useEffect } from "react";
 import Link from "next/link";
 import Image from "next/image";
+import { loadTypeWeaknesses, typeWeaknesses } from "@/lib/typeChart";
 
 interface Pokemon {
   id: string;
@@ -66,6 +67,9 @@ export default function TypeDetailPage() {
 
   const [pokemon, setPokemon] = useState<Pokemon[]>([]);
   const [loading, setLoading] = useState(true);
+  const [chartWeaknesses, setChartWeaknesses] = useState<string[] | null>(
+    null
+  );
 
   useEffect(() => {
     const fetchPokemon = async () => {
@@ -89,9 +93,13 @@ export default function TypeDetailPage() {
     };
 
     fetchPokemon();
+    loadTypeWeaknesses().then((data) =>
+      setChartWeaknesses(data ? typeWeaknesses(data, typeName) : null)
+    );
   }, [typeName]);
 
-  const weaknesses = TYPE_WEAKNESSES[typeName.toLowerCase()] || [];
+  const weaknesses =
+    chartWeaknesses || TYPE_WEAKNESSES[typeName.toLowerCase()] || [];
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-slate-900 via-cyan-900 to-slate-900">
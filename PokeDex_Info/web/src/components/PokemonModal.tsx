@@ -1,7 +1,8 @@
 "use client";
 
-import { useState } from "react";
+import { useEffect, useState } from "react";
 import Link from "next/link";
+import { loadTypeWeaknesses, pokemonMatchups } from "@/lib/typeChart";
 
 interface Evolution {
   name: string;
@@ -68,6 +69,16 @@ export default function PokemonModal({
   const [selectedGame, setSelectedGame] = useState<string>(
     Object.keys(pokemon.game_appearances || {})[0] || ""
   );
+  const [matchups, setMatchups] = useState<Record<string, string[]> | null>(
+    null
+  );
+
+  useEffect(() => {
+    // Combined multipliers for both types; falls back to per-type lists
+    loadTypeWeaknesses().then((data) =>
+      setMatchups(data ? pokemonMatchups(data, pokemon.name) : null)
+    );
+  }, [pokemon.name]);
 
   const getDexEntryForGame = (gameName: string): string => {
     if (!gameName || !pokemon.dex_entries)
@@ -119,6 +130,36 @@ export default function PokemonModal({
     return colors[type.toLowerCase()] || "bg-gray-600";
   };
 
+  // Matchup groups split into weaknesses (>1x) and resistances/immunities (<1x)
+  const matchupGroups = Object.entries(matchups || {});
+  const weaknessGroups = matchupGroups.filter(([m]) => parseFloat(m) > 1);
+  const resistanceGroups = matchupGroups.filter(([m]) => parseFloat(m) < 1);
+
+  const renderMatchupGroups = (groups: [string, string[]][]) => (
+    <div className="grid grid-cols-2 gap-3">
+      {groups.map(([multiplier, attackTypes]) => (
+        <div
+          key={multiplier}
+          className="bg-gray-800 p-4 rounded border border-gray-700 flex flex-col items-center text-center"
+        >
+          <p className="text-sm font-bold text-gray-200 mb-2">{multiplier}</p>
+          <div className="flex gap-1 flex-wrap justify-center">
+            {attackTypes.map((attackType: string) => (
+              <span
+                key={attackType}
+                className={`text-xs text-white px-2 py-1 rounded font-medium ${getTypeColor(
+                  attackType.toLowerCase()
+                )}`}
+              >
+                {attackType}
+              </span>
+            ))}
+          </div>
+        </div>
+      ))}
+    </div>
+  );
+
   const parseGenderRatio = (
     genderRatio: string
   ): { malePercent: number; femalePercent: number; isGenderless: boolean } => {
@@ -322,36 +363,54 @@ export default function PokemonModal({
             {/* Type Weaknesses */}
             <div>
               <h3 className="font-bold text-white mb-3 text-lg">Weaknesses</h3>
-              <div className="grid grid-cols-2 gap-3">
-                {pokemon.types.map((t: string) => {
-                  const weaknesses = getTypeWeaknesses(t);
-                  return (
-                    <div
-                      key={t}
-                      className="bg-gray-800 p-4 rounded border border-gray-700 flex flex-col items-center text-center"
-                    >
-                      <p className="text-sm font-bold text-gray-200 mb-2 capitalize">
-                        {t}
-                      </p>
-                      <div className="flex gap-1 flex-wrap justify-center">
-                        {weaknesses.map((weakness: string) => (
-                          <span
-                            key={weakness}
-                            className={`text-xs text-white px-2 py-1 rounded font-medium ${getTypeColor(
-                              weakness
-                            )}`}
-                          >
-                            {weakness.charAt(0).toUpperCase() +
-                              weakness.slice(1)}
-                          </span>
-                        ))}
+              {matchups ? (
+                weaknessGroups.length > 0 ? (
+                  renderMatchupGroups(weaknessGroups)
+                ) : (
+                  <p className="text-gray-400 text-sm">None</p>
+                )
+              ) : (
+                <div className="grid grid-cols-2 gap-3">
+                  {pokemon.types.map((t: string) => {
+                    const weaknesses = getTypeWeaknesses(t);
+                    return (
+                      <div
+                        key={t}
+                        className="bg-gray-800 p-4 rounded border border-gray-700 flex flex-col items-center text-center"
+                      >
+                        <p className="text-sm font-bold text-gray-200 mb-2 capitalize">
+                          {t}
+                        </p>
+                        <div className="flex gap-1 flex-wrap justify-center">
+                          {weaknesses.map((weakness: string) => (
+                            <span
+                              key={weakness}
+                              className={`text-xs text-white px-2 py-1 rounded font-medium ${getTypeColor(
+                                weakness
+                              )}`}
+                            >
+                              {weakness.charAt(0).toUpperCase() +
+                                weakness.slice(1)}
+                            </span>
+                          ))}
+                        </div>
                       </div>
-                    </div>
-                  );
-                })}
-              </div>
+                    );
+                  })}
+                </div>
+              )}
             </div>
 
+            {/* Type Resistances and Immunities */}
+            {resistanceGroups.length > 0 && (
+              <div>
+                <h3 className="font-bold text-white mb-3 text-lg">
+                  Resistances
+                </h3>
+                {renderMatchupGroups(resistanceGroups)}
+              </div>
+            )}
+
             {/* Evolution Chain */}
             {pokemon.evolution && pokemon.evolution.evolutions.length > 0 && (
               <div>
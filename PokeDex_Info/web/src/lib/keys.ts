@@ -0,0 +1,11 @@
+// Same normalization as PokeDataUtils.normalize_key in utils/config.py
+// ("Alolan Vulpix" -> "alolanvulpix", "Flabébé" -> "flabebe"); derived data
+// files and search keys are named with it.
+export function normalizeKey(text: string): string {
+  return text
+    .replace(/♀/g, "f")
+    .replace(/♂/g, "m")
+    .toLowerCase()
+    .normalize("NFKD")
+    .replace(/[^a-z0-9]/g, "");
+}
@@ -0,0 +1,46 @@
+// Per-Pokemon learnset slices from build_derived_data.py (learnsets).
+// Mirrors LearnsetTable.learnset in utils/learnsets.py: generation -> method
+// -> [move, level] pairs, level-sorted (level is null for non level-up moves).
+
+export type LearnsetEntry = [string, number | null];
+
+export interface LearnsetData {
+  version: number;
+  name: string;
+  generations: Record<string, Record<string, LearnsetEntry[]>>;
+}
+
+const loading: Record<string, Promise<LearnsetData | null>> = {};
+
+export function loadLearnset(name: string): Promise<LearnsetData | null> {
+  if (!loading[name]) {
+    loading[name] = fetch(`/api/data/learnset/${encodeURIComponent(name)}`)
+      .then((response) => response.json())
+      .then((data: LearnsetData) =>
+        Object.keys(data.generations || {}).length ? data : null
+      )
+      .catch((error) => {
+        console.error("Error loading learnset:", error);
+        delete loading[name];
+        return null;
+      });
+  }
+  return loading[name];
+}
+
+// Moves learnable in one generation (the latest one by default), by method
+export function generationLearnset(
+  data: LearnsetData,
+  generation?: number
+): Record<string, LearnsetEntry[]> {
+  const generations = Object.keys(data.generations).map(Number);
+  if (generations.length === 0) return {};
+  const key = String(generation ?? Math.max(...generations));
+  return data.generations[key] || {};
+}
+
+export function countMoves(learnset: Record<string, LearnsetEntry[]>): number {
+  return new Set(
+    Object.values(learnset).flatMap((entries) => entries.map(([move]) => move))
+  ).size;
+}
@@ -0,0 +1,55 @@
+// Per-Pokemon move recommendations from build_derived_data.py
+// (move_recommendations). Mirrors MoveRecommender.recommendations in
+// utils/move_recommender.py: generation -> moves, best first.
+
+// [move, type, category, power, accuracy, priority, score, stab, coverage %]
+export type RecommendedMove = [
+  string,
+  string,
+  string,
+  number,
+  number | null,
+  number,
+  number,
+  boolean,
+  number
+];
+
+export interface MoveRecommendationData {
+  version: number;
+  name: string;
+  generations: Record<string, RecommendedMove[]>;
+}
+
+const loading: Record<string, Promise<MoveRecommendationData | null>> = {};
+
+export function loadMoveRecommendations(
+  name: string
+): Promise<MoveRecommendationData | null> {
+  if (!loading[name]) {
+    loading[name] = fetch(
+      `/api/data/move-recommendations/${encodeURIComponent(name)}`
+    )
+      .then((response) => response.json())
+      .then((data: MoveRecommendationData) =>
+        Object.keys(data.generations || {}).length ? data : null
+      )
+      .catch((error) => {
+        console.error("Error loading move recommendations:", error);
+        delete loading[name];
+        return null;
+      });
+  }
+  return loading[name];
+}
+
+// Recommendations for one generation (the latest one by default)
+export function generationRecommendations(
+  data: MoveRecommendationData,
+  generation?: number
+): RecommendedMove[] {
+  const generations = Object.keys(data.generations).map(Number);
+  if (generations.length === 0) return [];
+  const key = String(generation ?? Math.max(...generations));
+  return data.generations[key] || [];
+}
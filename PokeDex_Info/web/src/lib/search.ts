@@ -0,0 +1,162 @@
+// Client-side search over the precomputed index from build_derived_data.py.
+// Mirrors utils/search_index.py: prefix matches via binary search over sorted
+// keys, typo-tolerant matches via character trigrams.
+
+import { normalizeKey } from "@/lib/keys";
+
+export type SearchResultType = "pokemon" | "item" | "ability" | "move";
+
+export interface SearchResult {
+  type: SearchResultType;
+  name: string;
+  description?: string;
+  score: number;
+}
+
+interface SerializedSearchIndex {
+  version: number;
+  types: SearchResultType[];
+  entries: [number, string, string][];
+  prefixes: [string, number][];
+  grams: Record<string, number[]>;
+}
+
+const EXACT_SCORE = 1.0;
+const NAME_PREFIX_SCORE = 0.9;
+const WORD_PREFIX_SCORE = 0.8;
+const FUZZY_WEIGHT = 0.7;
+const FUZZY_THRESHOLD = 0.3;
+const TYPE_ORDER: SearchResultType[] = ["pokemon", "move", "ability", "item"];
+
+function trigrams(key: string): string[] {
+  const padded = `  ${key} `;
+  const grams = new Set<string>();
+  for (let i = 0; i < padded.length - 2; i++) {
+    grams.add(padded.slice(i, i + 3));
+  }
+  return Array.from(grams);
+}
+
+class PokedexSearch {
+  private types: SearchResultType[] = [];
+  private entries: [number, string, string][] = [];
+  private keys: string[] = [];
+  private prefixKeys: string[] = [];
+  private prefixIds: number[] = [];
+  private grams = new Map<string, number[]>();
+  private loading: Promise<void> | null = null;
+
+  initialize(): Promise<void> {
+    if (!this.loading) {
+      this.loading = fetch("/api/data/search-index")
+        .then((response) => response.json())
+        .then((data: SerializedSearchIndex) => this.load(data))
+        .catch((error) => {
+          console.error("Error loading search index:", error);
+          this.loading = null;
+        });
+    }
+    return this.loading;
+  }
+
+  load(data: SerializedSearchIndex) {
+    this.types = data.types;
+    this.entries = data.entries;
+    this.keys = data.entries.map(([, name]) => normalizeKey(name));
+    this.prefixKeys = data.prefixes.map(([key]) => key);
+    this.prefixIds = data.prefixes.map(([, id]) => id);
+
+    // Posting lists are delta-encoded
+    this.grams.clear();
+    for (const [gram, gaps] of Object.entries(data.grams)) {
+      let total = 0;
+      this.grams.set(
+        gram,
+        gaps.map((gap) => (total += gap))
+      );
+    }
+  }
+
+  private prefixMatches(prefix: string): number[] {
+    let low = 0;
+    let high = this.prefixKeys.length;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (this.prefixKeys[mid] < prefix) low = mid + 1;
+      else high = mid;
+    }
+
+    const ids: number[] = [];
+    for (let i = low; i < this.prefixKeys.length; i++) {
+      if (!this.prefixKeys[i].startsWith(prefix)) break;
+      ids.push(this.prefixIds[i]);
+    }
+    return ids;
+  }
+
+  private fuzzyMatches(key: string): Map<number, number> {
+    const queryGrams = trigrams(key);
+    const overlap = new Map<number, number>();
+    for (const gram of queryGrams) {
+      for (const id of this.grams.get(gram) || []) {
+        overlap.set(id, (overlap.get(id) || 0) + 1);
+      }
+    }
+
+    const scores = new Map<number, number>();
+    overlap.forEach((shared, id) => {
+      const score =
+        (2 * shared) / (queryGrams.length + this.keys[id].length + 1);
+      if (score >= FUZZY_THRESHOLD) scores.set(id, score);
+    });
+    return scores;
+  }
+
+  search(
+    query: string,
+    types?: SearchResultType[],
+    limit: number = 20
+  ): SearchResult[] {
+    const key = normalizeKey(query);
+    if (!key || this.entries.length === 0) return [];
+
+    const scores = new Map<number, number>();
+    for (const id of this.prefixMatches(key)) {
+      const entryKey = this.keys[id];
+      const score =
+        entryKey === key
+          ? EXACT_SCORE
+          : entryKey.startsWith(key)
+          ? NAME_PREFIX_SCORE
+          : WORD_PREFIX_SCORE;
+      scores.set(id, Math.max(scores.get(id) || 0, score));
+    }
+
+    // Only fall back to fuzzy matching when prefixes don't fill the page
+    if (scores.size < limit) {
+      this.fuzzyMatches(key).forEach((similarity, id) => {
+        if (!scores.has(id)) scores.set(id, FUZZY_WEIGHT * similarity);
+      });
+    }
+
+    const typeOf = (id: number) => this.types[this.entries[id][0]];
+    return Array.from(scores.entries())
+      .filter(([id]) => !types || types.includes(typeOf(id)))
+      .sort(
+        ([a, scoreA], [b, scoreB]) =>
+          scoreB - scoreA ||
+          TYPE_ORDER.indexOf(typeOf(a)) - TYPE_ORDER.indexOf(typeOf(b)) ||
+          this.keys[a].length - this.keys[b].length ||
+          this.keys[a].localeCompare(this.keys[b])
+      )
+      .slice(0, limit)
+      .map(([id, score]) => ({
+        type: typeOf(id),
+        name: this.entries[id][1],
+        description: this.entries[id][2] || undefined,
+        score: Math.round(score * 1000) / 1000,
+      }));
+  }
+}
+
+export const pokedexSearch = new PokedexSearch();
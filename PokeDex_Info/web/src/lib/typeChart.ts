@@ -0,0 +1,81 @@
+// Precomputed type matchups from build_derived_data.py (type_weaknesses).
+// Mirrors utils/type_chart.py: charts are attacking type (rows) x defending
+// type (columns); species rows hold multipliers per attacking type.
+
+export interface TypeWeaknessData {
+  version: number;
+  generation?: number;
+  types: string[];
+  charts: Record<string, number[][]>;
+  // ref_id -> [name, types, multipliers, {ability: multipliers}]
+  species: Record<
+    string,
+    [string, string[], number[], Record<string, number[]>]
+  >;
+  names: Record<string, string>;
+}
+
+let loading: Promise<TypeWeaknessData | null> | null = null;
+
+export function loadTypeWeaknesses(): Promise<TypeWeaknessData | null> {
+  if (!loading) {
+    loading = fetch("/api/data/type-weaknesses")
+      .then((response) => response.json())
+      .then((data: TypeWeaknessData) => (data.types.length ? data : null))
+      .catch((error) => {
+        console.error("Error loading type weaknesses:", error);
+        loading = null;
+        return null;
+      });
+  }
+  return loading;
+}
+
+function latestChart(data: TypeWeaknessData): number[][] | null {
+  const keys = Object.keys(data.charts).map(Number);
+  if (keys.length === 0) return null;
+  return data.charts[String(Math.max(...keys))];
+}
+
+// Attacking types grouped by multiplier, strongest first ({"4x": [...], ...})
+export function groupByMultiplier(
+  types: string[],
+  multipliers: number[]
+): Record<string, string[]> {
+  const groups: Record<string, string[]> = {};
+  multipliers.forEach((multiplier, i) => {
+    if (multiplier === 1) return;
+    const label = `${multiplier}x`;
+    (groups[label] = groups[label] || []).push(types[i]);
+  });
+  return Object.fromEntries(
+    Object.entries(groups).sort(
+      ([a], [b]) => parseFloat(b) - parseFloat(a)
+    )
+  );
+}
+
+export function pokemonMatchups(
+  data: TypeWeaknessData,
+  name: string
+): Record<string, string[]> | null {
+  const refId = data.names[name];
+  const entry = refId ? data.species[refId] : undefined;
+  if (!entry) return null;
+  return groupByMultiplier(data.types, entry[2]);
+}
+
+// Attacking types that are super effective against a single defending type
+export function typeWeaknesses(
+  data: TypeWeaknessData,
+  typeName: string
+): string[] | null {
+  const chart = latestChart(data);
+  const column = data.types.findIndex(
+    (t) => t.toLowerCase() === typeName.toLowerCase()
+  );
+  if (!chart || column < 0) return null;
+  return data.types
+    .filter((_, row) => chart[row][column] > 1)
+    .map((t) => t.toLowerCase());
+}